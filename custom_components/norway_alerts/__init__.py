@@ -16,10 +16,19 @@ from .const import (
     CONF_WARNING_TYPE,
     CONF_TEST_MODE,
     CONF_CAP_FORMAT,
+    CONF_BULK_FETCH,
     CONF_ENABLE_NOTIFICATIONS,
     CONF_NOTIFICATION_SEVERITY,
     NOTIFICATION_SEVERITY_YELLOW_PLUS,
+    DATA_HTTP_CLIENT,
+    DATA_FETCH_HUB,
+    DATA_AVALANCHE_REGIONS,
+    WARNING_TYPE_AVALANCHE,
 )
+from .avalanche import async_get_region_table
+from .cache import WarningCache
+from .client import async_get_http_client
+from .hub import async_get_fetch_hub
 from .sensor import NorwayAlertsCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,6 +40,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     _LOGGER.debug("Setting up Norway Alerts entry: %s", entry.entry_id)
     
+    # Shared pooled HTTP client and request coalescing hub used by every entry's API clients
+    async_get_http_client(hass)
+    async_get_fetch_hub(hass)
+    
     # Get config from entry.options (preferred) or entry.data (fallback)
     config = entry.options if entry.options else entry.data
     
@@ -38,6 +51,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     lang = config.get(CONF_LANG) or entry.data.get(CONF_LANG, "en")
     test_mode = config.get(CONF_TEST_MODE, False)
     cap_format = config.get(CONF_CAP_FORMAT, True)  # Default to True for CAP format
+    bulk_fetch = config.get(CONF_BULK_FETCH, False)
     enable_notifications = config.get(CONF_ENABLE_NOTIFICATIONS, False)
     notification_severity = config.get(CONF_NOTIFICATION_SEVERITY, NOTIFICATION_SEVERITY_YELLOW_PLUS)
     
@@ -49,6 +63,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.debug("Config: warning_type=%s, county_id=%s, lat=%s, lon=%s, cap_format=%s", 
                   warning_type, county_id, latitude, longitude, cap_format)
     
+    if warning_type == WARNING_TYPE_AVALANCHE:
+        # Region -> county relevance shared by all avalanche entries
+        await async_get_region_table(hass)
+    
     if county_id:
         # County-based configuration (NVE warnings)
         county_name = config.get(CONF_COUNTY_NAME) or entry.data.get(CONF_COUNTY_NAME, "Unknown")
@@ -56,7 +74,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         coordinator = NorwayAlertsCoordinator(
             hass, county_id, county_name, warning_type, lang, test_mode,
             enable_notifications, notification_severity, cap_format,
-            latitude=None, longitude=None, config_entry=entry
+            latitude=None, longitude=None, config_entry=entry, bulk_fetch=bulk_fetch
         )
     else:
         # Lat/lon-based configuration (Met.no metalerts)
@@ -64,17 +82,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         coordinator = NorwayAlertsCoordinator(
             hass, None, None, warning_type, lang, test_mode,
             enable_notifications, notification_severity, cap_format,
-            latitude=latitude, longitude=longitude, config_entry=entry
+            latitude=latitude, longitude=longitude, config_entry=entry, bulk_fetch=bulk_fetch
         )
     
-    # Do the first refresh before setting up platforms
-    _LOGGER.debug("Performing first refresh for coordinator")
-    try:
-        await coordinator.async_config_entry_first_refresh()
-        _LOGGER.debug("First refresh completed successfully")
-    except Exception as err:
-        _LOGGER.error("Failed to initialize coordinator: %s", err, exc_info=True)
-        raise ConfigEntryNotReady(f"Failed to connect to API: {err}") from err
+    # Serve the last good warnings from disk and revalidate in the background,
+    # so startup does not wait on the upstream APIs
+    coordinator.cache = WarningCache(hass, entry.entry_id)
+    cached = None if test_mode else await coordinator.cache.async_load()
+    if cached is not None:
+        warnings, fetched_at = cached
+        _LOGGER.debug("Serving %d cached warnings fetched at %s", len(warnings), fetched_at)
+        coordinator.async_set_updated_data(warnings)
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} revalidate {entry.entry_id}"
+        )
+    else:
+        # No usable cache: do the first refresh before setting up platforms
+        _LOGGER.debug("Performing first refresh for coordinator")
+        try:
+            await coordinator.async_config_entry_first_refresh()
+            _LOGGER.debug("First refresh completed successfully")
+        except Exception as err:
+            _LOGGER.error("Failed to initialize coordinator: %s", err, exc_info=True)
+            raise ConfigEntryNotReady(f"Failed to connect to API: {err}") from err
     
     # Store coordinator in hass.data for the sensor platform
     _LOGGER.debug("Storing coordinator in hass.data")
@@ -97,10 +127,30 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        
+        # Release shared resources once the last entry is unloaded
+        other_entries_loaded = any(
+            other.entry_id in hass.data[DOMAIN]
+            for other in hass.config_entries.async_entries(DOMAIN)
+            if other.entry_id != entry.entry_id
+        )
+        if not other_entries_loaded:
+            hass.data[DOMAIN].pop(DATA_FETCH_HUB, None)
+            hass.data[DOMAIN].pop(DATA_AVALANCHE_REGIONS, None)
+            http_client = hass.data[DOMAIN].pop(DATA_HTTP_CLIENT, None)
+            if http_client is not None:
+                await http_client.async_close()
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cached warnings of a deleted config entry."""
+    await WarningCache(hass, entry.entry_id).async_remove()
+
+
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
+    # Cached warnings may belong to another county or warning type now
+    await WarningCache(hass, entry.entry_id).async_remove()
     await hass.config_entries.async_reload(entry.entry_id)
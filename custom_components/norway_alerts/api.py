@@ -6,7 +6,9 @@ import json
 import logging
 import os
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, List, Dict, Any, Tuple
+from urllib.parse import urlsplit
 
 import aiohttp
 
@@ -14,8 +16,23 @@ from .const import (
     API_BASE_LANDSLIDE, 
     API_BASE_FLOOD, 
     API_BASE_AVALANCHE,
-    API_BASE_METALERTS
+    API_BASE_METALERTS,
+    HTTP_REQUEST_TIMEOUT,
+    AVALANCHE_DETAIL_CONCURRENCY,
+    AVALANCHE_REFRESH_DEADLINE,
+    AVALANCHE_SHARED_TTL,
+    NVE_BULK_WARNINGS_PATH,
+    ALERT_AREA_COARSE_TOLERANCE,
+    ALERT_AREA_DISPLAY_TOLERANCE,
 )
+from .avalanche import RegionCountyTable, warning_positions
+from .client import NorwayAlertsHttpClient
+from .hub import FetchHub
+from .filtering import mask_counties, parse_municipality_csv
+from .geometry import PolygonIndex
+from .ingest import async_decode_json, project_nve_warnings
+from .models import Alert, alerts_from_mappings
+from .resilience import async_retry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,14 +58,185 @@ def _get_user_agent() -> str:
     return f"norway_alerts/{_VERSION} jeremy.m.cook@gmail.com"
 
 
+# HTTP statuses worth retrying
+TRANSIENT_HTTP_STATUSES = {408, 429, 500, 502, 503, 504}
+
+# Detail payload of an avalanche region and its active warnings, each with its converted alert
+RegionDetail = Tuple[List[Dict[str, Any]], List[Tuple[Dict[str, Any], Alert]]]
+
+# All current Met.no alerts: payload, converted alerts, geometry index and county -> alert positions
+NationwideAlerts = Tuple[Any, List[Alert], PolygonIndex, Dict[str, List[int]]]
+
+
+class WarningAPIError(Exception):
+    """Raised when an upstream API returns an unusable response."""
+
+
+class TransientAPIError(WarningAPIError):
+    """Raised for upstream failures that are worth retrying."""
+    
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(WarningAPIError):
+    """Raised when requests to a failing host are paused by its circuit breaker."""
+
+
+def _is_transient(err: BaseException) -> bool:
+    """Return True for errors that may succeed when retried."""
+    return isinstance(err, (TransientAPIError, aiohttp.ClientError, asyncio.TimeoutError))
+
+
+def _retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds."""
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
 class BaseWarningAPI(ABC):
-    """Base class for warning API clients."""
+    """Base class for warning API clients.
+    
+    With a shared HTTP client, requests are conditional (ETag/Last-Modified) and
+    a 304 response yields the very same payload object as before. API clients
+    that are kept between refreshes use that to return their previously
+    converted warnings; ``not_modified`` tells the caller this happened.
     
-    def __init__(self, county_id: str, county_name: str, lang: str = "en"):
+    The shared client path also retries transient failures and honours the
+    per-host circuit breaker. When a fetch fails, the last good warnings are
+    returned and ``stale`` is set.
+    """
+    
+    def __init__(self, county_id: str, county_name: str, lang: str = "en",
+                 http_client: NorwayAlertsHttpClient | None = None, fetch_hub: FetchHub | None = None):
         self.county_id = county_id
         self.county_name = county_name
         self.lang = lang
+        self.http_client = http_client
+        self.fetch_hub = fetch_hub
         self.warning_type = self._get_warning_type()
+        self.not_modified = False  # True if the last fetch_warnings() returned unchanged data
+        self.stale = False  # True if the last fetch_warnings() failed and returned the last good data
+        self._last_payload: Any = None
+        self._last_warnings: List[Alert] | None = None
+    
+    def _is_unchanged(self, payload: Any) -> bool:
+        """Return True if payload is the one the last warnings were converted from."""
+        return payload is not None and payload is self._last_payload and self._last_warnings is not None
+    
+    def _remember(self, payload: Any, warnings: List[Alert]) -> List[Alert]:
+        """Remember the converted warnings of payload and return them."""
+        self._last_payload = payload
+        self._last_warnings = warnings
+        return warnings
+    
+    def _fallback(self) -> List[Alert]:
+        """Mark the result stale and return the last good warnings (if any)."""
+        self.stale = True
+        return list(self._last_warnings) if self._last_warnings is not None else []
+    
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the shared pooled session, or a short-lived one if none was injected."""
+        if self.http_client is not None:
+            yield self.http_client.session
+            return
+        async with aiohttp.ClientSession() as session:
+            yield session
+    
+    async def _get_json(self, url: str, check_content_type: bool = True,
+                        projection: Callable[[Any], Any] | None = None, ttl: float | None = None) -> Any:
+        """Fetch and decode JSON from url.
+        
+        Goes through the shared fetch hub when available, so identical URLs
+        requested by several entries reach the upstream API only once (ttl
+        overrides how long the hub shares the payload).
+        """
+        if self.fetch_hub is not None:
+            return await self.fetch_hub.async_fetch(
+                url, lambda: self._download_json(url, check_content_type, projection), ttl=ttl
+            )
+        return await self._download_json(url, check_content_type, projection)
+    
+    async def _download_json(self, url: str, check_content_type: bool = True,
+                             projection: Callable[[Any], Any] | None = None) -> Any:
+        """Download and decode JSON from url, raising WarningAPIError on bad responses.
+        
+        With the shared HTTP client, transient failures are retried with backoff
+        and the host's circuit breaker is updated.
+        """
+        if self.http_client is None:
+            return await self._request_json(url, check_content_type, projection)
+        
+        host = urlsplit(url).hostname or ""
+        breaker = self.http_client.circuit_breaker(host)
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"Requests to {host} paused after repeated failures")
+        
+        try:
+            payload = await async_retry(
+                lambda: self._request_json(url, check_content_type, projection), _is_transient
+            )
+        except Exception as err:
+            if _is_transient(err):
+                breaker.record_failure()
+            else:
+                breaker.release_trial()
+            raise
+        except asyncio.CancelledError:
+            breaker.release_trial()
+            raise
+        breaker.record_success()
+        return payload
+    
+    async def _request_json(self, url: str, check_content_type: bool = True,
+                            projection: Callable[[Any], Any] | None = None) -> Any:
+        """Send one request for url and decode the JSON response.
+        
+        With the shared HTTP client the body is read as bytes and decoded by the
+        ingestion stage (off the event loop for large bodies, projected if a
+        projection is given); otherwise aiohttp decodes it.
+        """
+        headers = {
+            "Accept": "application/json",
+            "User-Agent": _get_user_agent()
+        }
+        if self.http_client is not None:
+            headers.update(self.http_client.conditional_headers(url))
+        
+        async with self._session() as session:
+            async with asyncio.timeout(HTTP_REQUEST_TIMEOUT):
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 304 and self.http_client is not None:
+                        payload = self.http_client.not_modified_payload(url)
+                        if payload is None:
+                            raise WarningAPIError("HTTP 304 without a cached response")
+                        _LOGGER.debug("Not modified: %s", url)
+                        return payload
+                    
+                    if response.status in TRANSIENT_HTTP_STATUSES:
+                        raise TransientAPIError(
+                            f"HTTP {response.status}",
+                            _retry_after(response.headers.get("Retry-After")),
+                        )
+                    if response.status != 200:
+                        raise WarningAPIError(f"HTTP {response.status}")
+                    
+                    if check_content_type:
+                        content_type = response.headers.get("Content-Type", "")
+                        if "application/json" not in content_type:
+                            raise WarningAPIError(f"Unexpected content type: {content_type}")
+                    
+                    if self.http_client is None:
+                        payload = await response.json()
+                        return projection(payload) if projection is not None else payload
+                    
+                    payload = await async_decode_json(await response.read(), projection)
+                    self.http_client.remember_response(url, response.headers, payload)
+                    return payload
     
     @abstractmethod
     def _get_warning_type(self) -> str:
@@ -56,53 +244,114 @@ class BaseWarningAPI(ABC):
         pass
     
     @abstractmethod
-    async def fetch_warnings(self) -> List[Dict[str, Any]]:
+    async def fetch_warnings(self) -> List[Alert]:
         """Fetch warnings from the API."""
         pass
 
 
+def _municipality_county_id(municipality_id: Any) -> str:
+    """Return the county number of a municipality number (4601 -> "46", 301 -> "03")."""
+    return str(municipality_id).strip().zfill(4)[:2]
+
+
+def partition_warnings_by_county(warnings: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Split a country-wide NVE warning list into per-county views.
+    
+    Counties are taken from CountyList (falling back to MunicipalityCsvString
+    when CountyList is empty). Each county gets a shallow copy of the warning
+    whose CountyList and MunicipalityList are narrowed to that county.
+    """
+    by_county: Dict[str, List[Dict[str, Any]]] = {}
+    for warning in warnings:
+        county_list = warning.get("CountyList") or []
+        county_ids = [str(county.get("Id")) for county in county_list if county.get("Id")]
+        if not county_ids:
+            county_ids = mask_counties(parse_municipality_csv(warning.get("MunicipalityCsvString")))
+        
+        municipality_list = warning.get("MunicipalityList") or []
+        for county_id in county_ids:
+            county_view = dict(warning)
+            county_view["CountyList"] = [c for c in county_list if str(c.get("Id")) == county_id]
+            county_view["MunicipalityList"] = [
+                m for m in municipality_list if _municipality_county_id(m.get("Id", "")) == county_id
+            ]
+            by_county.setdefault(county_id, []).append(county_view)
+    return by_county
+
+
 class CountyBasedAPI(BaseWarningAPI):
-    """Base class for county-based APIs (landslide/flood)."""
+    """Base class for county-based APIs (landslide/flood).
+    
+    In bulk mode the country-wide warning list is downloaded once and split
+    per county locally, so all county entries share a single request.
+    """
     
-    async def _fetch_county_warnings(self, base_url: str, warning_type: str) -> List[Dict[str, Any]]:
+    def __init__(self, county_id: str, county_name: str, lang: str = "en",
+                 http_client: NorwayAlertsHttpClient | None = None, fetch_hub: FetchHub | None = None,
+                 bulk: bool = False):
+        super().__init__(county_id, county_name, lang, http_client, fetch_hub)
+        self.bulk = bulk
+        self._last_partition: Tuple[Any, Dict[str, List[Dict[str, Any]]]] | None = None
+    
+    async def _fetch_bulk_county_warnings(self, base_url: str, lang_key: str) -> Tuple[Any, List[Dict[str, Any]]]:
+        """Fetch the country-wide warning list.
+        
+        Returns the nationwide payload (used for change detection) and this
+        county's view of it.
+        """
+        url = f"{base_url}/{NVE_BULK_WARNINGS_PATH.format(lang_key=lang_key)}"
+        
+        async def _download_and_partition() -> Tuple[Any, Dict[str, List[Dict[str, Any]]]]:
+            payload = await self._download_json(url, projection=project_nve_warnings) or []
+            # Not modified: the previous partition is still valid
+            if self._last_partition is None or self._last_partition[0] is not payload:
+                self._last_partition = (payload, partition_warnings_by_county(payload))
+            return self._last_partition
+        
+        if self.fetch_hub is not None:
+            payload, by_county = await self.fetch_hub.async_fetch(url, _download_and_partition, variant="by_county")
+        else:
+            payload, by_county = await _download_and_partition()
+        return payload, by_county.get(str(self.county_id), [])
+    
+    async def _fetch_county_warnings(self, base_url: str, warning_type: str) -> List[Alert]:
         """Fetch warnings using county-based API."""
         lang_key = "2" if self.lang == "en" else "1"
         url = f"{base_url}/Warning/County/{self.county_id}/{lang_key}"
         
-        headers = {
-            "Accept": "application/json",
-            "User-Agent": _get_user_agent()
-        }
-        
-        _LOGGER.debug("Fetching %s warnings from: %s", warning_type, url)
+        if self.bulk:
+            _LOGGER.debug("Fetching %s warnings for county %s from nationwide list", warning_type, self.county_id)
+        else:
+            _LOGGER.debug("Fetching %s warnings from: %s", warning_type, url)
         
+        self.not_modified = False
+        self.stale = False
         try:
-            async with aiohttp.ClientSession() as session:
-                async with asyncio.timeout(10):
-                    async with session.get(url, headers=headers) as response:
-                        if response.status != 200:
-                            _LOGGER.error("Error fetching %s data: %s", warning_type, response.status)
-                            return []
-
-                        content_type = response.headers.get("Content-Type", "")
-                        if "application/json" in content_type:
-                            json_data = await response.json()
-                            if json_data:
-                                _LOGGER.info("Successfully fetched %s warnings (count: %d)", warning_type, len(json_data))
-                                return json_data
-                            else:
-                                _LOGGER.info("No %s warnings found", warning_type)
-                                return []
-                        else:
-                            _LOGGER.error("Unexpected content type for %s: %s", warning_type, content_type)
-                            return []
+            if self.bulk:
+                payload, json_data = await self._fetch_bulk_county_warnings(base_url, lang_key)
+            else:
+                payload = json_data = await self._get_json(url, projection=project_nve_warnings)
+            if self._is_unchanged(payload):
+                _LOGGER.debug("%s warnings not modified", warning_type)
+                self.not_modified = True
+                return list(self._last_warnings)
+            if json_data:
+                _LOGGER.info("Successfully fetched %s warnings (count: %d)", warning_type, len(json_data))
+                # Alerts are built once per payload and reused while it is unchanged
+                return list(self._remember(payload, alerts_from_mappings(json_data, warning_type)))
+            else:
+                _LOGGER.info("No %s warnings found", warning_type)
+                return list(self._remember(payload, []))
                         
+        except WarningAPIError as err:
+            _LOGGER.error("Error fetching %s data: %s", warning_type, err)
+            return self._fallback()
         except aiohttp.ClientError as err:
             _LOGGER.error("Error fetching %s warnings: %s", warning_type, err)
-            return []
+            return self._fallback()
         except Exception as err:
             _LOGGER.error("Unexpected error fetching %s warnings: %s", warning_type, err)
-            return []
+            return self._fallback()
 
 
 class LandslideAPI(CountyBasedAPI):
@@ -111,13 +360,9 @@ class LandslideAPI(CountyBasedAPI):
     def _get_warning_type(self) -> str:
         return "landslide"
     
-    async def fetch_warnings(self) -> List[Dict[str, Any]]:
+    async def fetch_warnings(self) -> List[Alert]:
         """Fetch landslide warnings from NVE API."""
-        warnings = await self._fetch_county_warnings(API_BASE_LANDSLIDE, "landslide")
-        # Add warning type to each warning
-        for warning in warnings:
-            warning["_warning_type"] = "landslide"
-        return warnings
+        return await self._fetch_county_warnings(API_BASE_LANDSLIDE, "landslide")
 
 
 class FloodAPI(CountyBasedAPI):
@@ -126,18 +371,33 @@ class FloodAPI(CountyBasedAPI):
     def _get_warning_type(self) -> str:
         return "flood"
     
-    async def fetch_warnings(self) -> List[Dict[str, Any]]:
+    async def fetch_warnings(self) -> List[Alert]:
         """Fetch flood warnings from NVE API."""
-        warnings = await self._fetch_county_warnings(API_BASE_FLOOD, "flood")
-        # Add warning type to each warning
-        for warning in warnings:
-            warning["_warning_type"] = "flood"
-        return warnings
+        return await self._fetch_county_warnings(API_BASE_FLOOD, "flood")
 
 
 class AvalancheAPI(BaseWarningAPI):
     """API client for avalanche warnings."""
     
+    def __init__(self, county_id: str, county_name: str, lang: str = "en",
+                 http_client: NorwayAlertsHttpClient | None = None, fetch_hub: FetchHub | None = None,
+                 max_concurrency: int = AVALANCHE_DETAIL_CONCURRENCY, refresh_deadline: float = AVALANCHE_REFRESH_DEADLINE,
+                 region_table: RegionCountyTable | None = None):
+        """Initialize the avalanche API client.
+        
+        max_concurrency bounds the number of region detail requests in flight,
+        refresh_deadline bounds the wall-clock time of a whole refresh (seconds).
+        region_table is the shared region -> county relevance table.
+        """
+        super().__init__(county_id, county_name, lang, http_client, fetch_hub)
+        self.max_concurrency = max(1, max_concurrency)
+        self.refresh_deadline = refresh_deadline
+        self.region_table = region_table if region_table is not None else RegionCountyTable()
+        # region_id -> (shared region detail, converted warnings relevant to this county)
+        self._region_warnings: Dict[Any, Tuple[RegionDetail, List[Alert]]] = {}
+        # region_id -> summary fingerprint the cached region detail belongs to
+        self._region_fingerprints: Dict[Any, Tuple] = {}
+    
     def _get_warning_type(self) -> str:
         return "avalanche"
     
@@ -154,9 +414,185 @@ class AvalancheAPI(BaseWarningAPI):
         except (KeyError, TypeError, AttributeError):
             return ""
     
-    async def fetch_warnings(self) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _danger_level(warning: Dict[str, Any]) -> int:
+        """Return the danger level of a warning as an integer."""
+        danger_level = warning.get("DangerLevel", 0)
+        if isinstance(danger_level, str):
+            danger_level = int(danger_level) if danger_level.isdigit() else 0
+        return danger_level
+    
+    def _find_active_regions(self, summary_data: List[Dict[str, Any]]) -> List[Any]:
+        """Return the ids of regions with an active (level > 0) warning."""
+        active_regions = []
+        for region in summary_data:
+            if "AvalancheWarningList" in region and region["AvalancheWarningList"]:
+                for warning in region["AvalancheWarningList"]:
+                    if self._danger_level(warning) > 0:
+                        active_regions.append(warning.get("RegionId"))
+                        break
+        return active_regions
+    
+    @staticmethod
+    def _summary_fingerprints(summary_data: List[Dict[str, Any]]) -> Dict[Any, Tuple]:
+        """Return a fingerprint of each region's summary warnings.
+        
+        A new or corrected bulletin changes the warning Id, publish time,
+        danger level or main text, so a region whose fingerprint is unchanged
+        still has the same details.
+        """
+        fingerprints = {}
+        for region in summary_data:
+            for warning in region.get("AvalancheWarningList") or ():
+                region_id = warning.get("RegionId")
+                fingerprints[region_id] = fingerprints.get(region_id, ()) + ((
+                    warning.get("Id"),
+                    warning.get("ValidFrom"),
+                    warning.get("PublishTime"),
+                    warning.get("DangerLevel"),
+                    warning.get("MainText"),
+                ),)
+        return fingerprints
+    
+    def _is_relevant(self, warning: Dict[str, Any]) -> bool:
+        """Check whether a region warning is relevant to the configured county.
+        
+        The region is relevant if the county is listed in its CountyList or
+        holds at least AVALANCHE_RELEVANCE_THRESHOLD of its municipalities.
+        """
+        return self.region_table.is_relevant(warning.get("RegionId"), warning, self.county_id, self.county_name)
+    
+    def _convert_warning(self, warning: Dict[str, Any], position: Tuple[float, float] | None = None) -> Alert:
+        """Convert a region detail warning (with its region point as longitude/latitude) to the common warning format."""
+        return Alert.from_mapping({
+            "Id": warning.get("RegionId"),
+            "ActivityLevel": str(warning.get("DangerLevel", 1)),
+            "DangerLevel": f"Level {warning.get('DangerLevel', 1)}",
+            "DangerTypeName": "Skredfare",
+            "MainText": warning.get("MainText", "Snøskredvarsel"),
+            "RegionName": warning.get("RegionName", "Ukjent område"),
+            "ValidFrom": warning.get("ValidFrom"),
+            "ValidTo": warning.get("ValidTo"),
+            "PublishTime": warning.get("PublishTime"),
+            "CountyList": warning.get("CountyList", []),
+            "MunicipalityList": warning.get("MunicipalityList", []),
+            "_region_id": warning.get("RegionId"),
+            "_region_name": warning.get("RegionName"),
+            "_warning_type": "avalanches",  # Plural to match icon naming
+            "UtmZone": warning.get("UtmZone"),
+            "UtmEast": warning.get("UtmEast"),
+            "UtmNorth": warning.get("UtmNorth"),
+            "Longitude": round(position[0], 6) if position else None,
+            "Latitude": round(position[1], 6) if position else None,
+            
+            # Avalanche-specific attributes (instead of generic WarningText/AdviceText/ConsequenceText)
+            "AvalancheDanger": warning.get("AvalancheDanger", ""),
+            "EmergencyWarning": warning.get("EmergencyWarning", ""),
+            "AvalancheProblems": warning.get("AvalancheProblems", []),
+            "AvalancheAdvices": warning.get("AvalancheAdvices", []),
+            "SnowSurface": warning.get("SnowSurface", ""),
+            "CurrentWeaklayers": warning.get("CurrentWeaklayers", ""),
+            "LatestAvalancheActivity": warning.get("LatestAvalancheActivity", ""),
+            "LatestObservations": warning.get("LatestObservations", ""),
+            "Author": warning.get("Author", ""),
+            "DangerLevelName": warning.get("DangerLevelName", ""),
+            "ExposedHeightFill": warning.get("ExposedHeightFill", 0),
+            "ExposedHeight1": warning.get("ExposedHeight1", 0),
+            
+            # Flattened mountain weather for easy template access
+            "WindSpeed": self._extract_weather_value(warning, "wind", "Speed"),
+            "WindDirection": self._extract_weather_value(warning, "wind", "Direction"),
+            "Temperature": self._extract_weather_value(warning, "temperature", "Value"),
+            "Precipitation": self._extract_weather_value(warning, "precipitation", "Value"),
+            "MountainWeather": warning.get("MountainWeather", {}),  # Keep raw data too
+        })
+    
+    def _relevant_alerts(self, region: RegionDetail) -> List[Alert]:
+        """Return the converted warnings of a region that are relevant to this county."""
+        warnings = []
+        for warning, alert in region[1]:
+            if not self._is_relevant(warning):
+                continue
+            _LOGGER.debug("Including avalanche region '%s': relevant to %s (county in region or municipalities match)", 
+                          warning.get("RegionName", "Unknown"), self.county_name)
+            warnings.append(alert)
+        return warnings
+    
+    async def _fetch_region_detail(self, semaphore: asyncio.Semaphore, region_id: Any,
+                                   today: str, tomorrow: str) -> RegionDetail:
+        """Fetch the detail warnings of one region and convert the active ones.
+        
+        The result is shared through the fetch hub by all avalanche entries;
+        each entry only applies its county filter.
+        """
+        detail_url = f"{API_BASE_AVALANCHE}/api/AvalancheWarningByRegion/Detail/{region_id}/2/{today}/{tomorrow}"
+        
+        async def _download_and_convert() -> RegionDetail:
+            async with semaphore:
+                detail_data = await self._download_json(detail_url, check_content_type=False)
+            if not isinstance(detail_data, list):
+                detail_data = []
+            # Not modified: reuse the previous conversion
+            cached = self._region_warnings.get(region_id)
+            if cached is not None and cached[0][0] is detail_data:
+                return cached[0]
+            active = [warning for warning in detail_data if self._danger_level(warning) > 0]
+            return detail_data, [
+                (warning, self._convert_warning(warning, position))
+                for warning, position in zip(active, warning_positions(active))
+            ]
+        
+        if self.fetch_hub is not None:
+            return await self.fetch_hub.async_fetch(
+                detail_url, _download_and_convert, variant="converted", ttl=AVALANCHE_SHARED_TTL
+            )
+        return await _download_and_convert()
+    
+    async def _fetch_region_details(self, active_regions: List[Any], today: str, tomorrow: str,
+                                    timeout: float) -> Dict[Any, RegionDetail]:
+        """Fetch detail data for all active regions concurrently.
+        
+        Returns the detail data of every region that completed within the timeout;
+        failed or unfinished regions are logged and left out (partial result).
+        """
+        if not active_regions:
+            return {}
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = {
+            region_id: asyncio.create_task(
+                self._fetch_region_detail(semaphore, region_id, today, tomorrow)
+            )
+            for region_id in active_regions
+        }
+        
+        done, pending = await asyncio.wait(tasks.values(), timeout=max(timeout, 0))
+        for task in pending:
+            task.cancel()
+        if pending:
+            _LOGGER.warning(
+                "Avalanche refresh deadline reached, %d of %d regions not fetched",
+                len(pending), len(tasks)
+            )
+        
+        details = {}
+        for region_id, task in tasks.items():
+            if task not in done or task.cancelled():
+                continue
+            if task.exception() is not None:
+                _LOGGER.debug("Error fetching details for region %s: %s", region_id, task.exception())
+                continue
+            details[region_id] = task.result()
+        return details
+    
+    async def fetch_warnings(self) -> List[Alert]:
         """Fetch avalanche warnings from NVE API."""
+        self.not_modified = False
+        self.stale = False
         try:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.refresh_deadline
+            
             today = dt.datetime.now().strftime("%Y-%m-%d")
             tomorrow = (dt.datetime.now() + dt.timedelta(days=1)).strftime("%Y-%m-%d")
             
@@ -165,132 +601,88 @@ class AvalancheAPI(BaseWarningAPI):
             
             _LOGGER.info("Fetching avalanche summary from: %s", summary_url)
             
-            async with aiohttp.ClientSession() as session:
-                # Get region summary to find active regions
-                async with session.get(summary_url) as response:
-                    if response.status != 200:
-                        _LOGGER.error("Error fetching avalanche warnings summary: HTTP %d", response.status)
-                        return []
-                    
-                    summary_data = await response.json()
-                    if not summary_data:
-                        _LOGGER.info("No avalanche warnings found")
-                        return []
-                    
-                    # Find regions with active warnings
-                    active_regions = []
-                    for region in summary_data:
-                        if "AvalancheWarningList" in region and region["AvalancheWarningList"]:
-                            for warning in region["AvalancheWarningList"]:
-                                danger_level = warning.get("DangerLevel", 0)
-                                if isinstance(danger_level, str):
-                                    danger_level = int(danger_level) if danger_level.isdigit() else 0
-                                if danger_level > 0:
-                                    active_regions.append(warning.get("RegionId"))
-                                    break
-                    
-                    _LOGGER.debug("Found %d active avalanche regions", len(active_regions))
-                    
-                    # Get detailed data for active regions
-                    warnings = []
-                    for region_id in active_regions:
-                        detail_url = f"{API_BASE_AVALANCHE}/api/AvalancheWarningByRegion/Detail/{region_id}/2/{today}/{tomorrow}"
-                        
-                        try:
-                            async with session.get(detail_url) as detail_response:
-                                if detail_response.status == 200:
-                                    detail_data = await detail_response.json()
-                                    
-                                    if isinstance(detail_data, list):
-                                        for warning in detail_data:
-                                            danger_level = warning.get("DangerLevel", 0)
-                                            if isinstance(danger_level, str):
-                                                danger_level = int(danger_level) if danger_level.isdigit() else 0
-                                            if danger_level > 0:
-                                                # Calculate county relevance score
-                                                municipality_list = warning.get("MunicipalityList", [])
-                                                county_list = warning.get("CountyList", [])
-                                                
-                                                # Check if this region has relevance to target county
-                                                # First check by county name in CountyList since CountyId is often empty
-                                                county_list = warning.get("CountyList", [])
-                                                county_names = [county.get("Name", "") for county in county_list]
-                                                is_relevant = self.county_name in county_names
-                                                
-                                                # If not found by county name, fall back to municipality CountyId check
-                                                if not is_relevant:
-                                                    target_county_municipalities = 0
-                                                    total_municipalities = len(municipality_list)
-                                                    
-                                                    for municipality in municipality_list:
-                                                        muni_county_id = municipality.get("CountyId")
-                                                        if str(muni_county_id) == str(self.county_id):
-                                                            target_county_municipalities += 1
-                                                    
-                                                    # Calculate relevance score (0.0 to 1.0)
-                                                    relevance_score = target_county_municipalities / total_municipalities if total_municipalities > 0 else 0
-                                                    
-                                                    # Only include regions with some relevance (>= 10% of municipalities)
-                                                    is_relevant = relevance_score >= 0.1
-                                                
-                                                if is_relevant:
-                                                    region_name = warning.get("RegionName", "Unknown")
-                                                    _LOGGER.debug("Including avalanche region '%s': relevant to %s (county in region or municipalities match)", 
-                                                                region_name, self.county_name)
-                                                    converted_warning = {
-                                                        "Id": warning.get("RegionId"),
-                                                        "ActivityLevel": str(warning.get("DangerLevel", 1)),
-                                                        "DangerLevel": f"Level {warning.get('DangerLevel', 1)}",
-                                                        "DangerTypeName": "Skredfare",
-                                                        "MainText": warning.get("MainText", "Snøskredvarsel"),
-                                                        "RegionName": warning.get("RegionName", "Ukjent område"),
-                                                        "ValidFrom": warning.get("ValidFrom"),
-                                                        "ValidTo": warning.get("ValidTo"),
-                                                        "PublishTime": warning.get("PublishTime"),
-                                                        "CountyList": warning.get("CountyList", []),
-                                                        "MunicipalityList": warning.get("MunicipalityList", []),
-                                                        "_region_id": warning.get("RegionId"),
-                                                        "_region_name": warning.get("RegionName"),
-                                                        "_warning_type": "avalanches",  # Plural to match icon naming
-                                                        "UtmZone": warning.get("UtmZone"),
-                                                        "UtmEast": warning.get("UtmEast"),
-                                                        "UtmNorth": warning.get("UtmNorth"),
-                                                        
-                                                        # Avalanche-specific attributes (instead of generic WarningText/AdviceText/ConsequenceText)
-                                                        "AvalancheDanger": warning.get("AvalancheDanger", ""),
-                                                        "EmergencyWarning": warning.get("EmergencyWarning", ""),
-                                                        "AvalancheProblems": warning.get("AvalancheProblems", []),
-                                                        "AvalancheAdvices": warning.get("AvalancheAdvices", []),
-                                                        "SnowSurface": warning.get("SnowSurface", ""),
-                                                        "CurrentWeaklayers": warning.get("CurrentWeaklayers", ""),
-                                                        "LatestAvalancheActivity": warning.get("LatestAvalancheActivity", ""),
-                                                        "LatestObservations": warning.get("LatestObservations", ""),
-                                                        "Author": warning.get("Author", ""),
-                                                        "DangerLevelName": warning.get("DangerLevelName", ""),
-                                                        "ExposedHeightFill": warning.get("ExposedHeightFill", 0),
-                                                        "ExposedHeight1": warning.get("ExposedHeight1", 0),
-                                                        
-                                                        # Flattened mountain weather for easy template access
-                                                        "WindSpeed": self._extract_weather_value(warning, "wind", "Speed"),
-                                                        "WindDirection": self._extract_weather_value(warning, "wind", "Direction"),
-                                                        "Temperature": self._extract_weather_value(warning, "temperature", "Value"),
-                                                        "Precipitation": self._extract_weather_value(warning, "precipitation", "Value"),
-                                                        "MountainWeather": warning.get("MountainWeather", {}),  # Keep raw data too
-                                                    }
-                                                    warnings.append(converted_warning)
-                        except Exception as e:
-                            _LOGGER.debug("Error fetching details for region %s: %s", region_id, e)
-                            continue
-                    
-                    _LOGGER.info("Successfully fetched avalanche warnings for %s: %d", self.county_name, len(warnings))
-                    return warnings
+            # Get region summary to find active regions
+            try:
+                summary_data = await self._get_json(summary_url, check_content_type=False, ttl=AVALANCHE_SHARED_TTL)
+            except WarningAPIError as err:
+                _LOGGER.error("Error fetching avalanche warnings summary: %s", err)
+                return self._fallback()
+            
+            if not summary_data:
+                _LOGGER.info("No avalanche warnings found")
+                return []
+            
+            # Find regions with active warnings
+            active_regions = self._find_active_regions(summary_data)
+            _LOGGER.debug("Found %d active avalanche regions", len(active_regions))
+            
+            # Only regions whose bulletin is new or changed need their details fetched
+            fingerprints = self._summary_fingerprints(summary_data)
+            changed_regions = [
+                region_id for region_id in active_regions
+                if region_id not in self._region_warnings
+                or self._region_fingerprints.get(region_id) != fingerprints.get(region_id)
+            ]
+            _LOGGER.debug("Fetching details for %d of %d active avalanche regions",
+                          len(changed_regions), len(active_regions))
+            
+            # Get detailed data for changed regions (concurrently, within the refresh deadline)
+            details = await self._fetch_region_details(
+                changed_regions, today, tomorrow, deadline - loop.time()
+            )
+            for region_id in details:
+                self._region_fingerprints[region_id] = fingerprints.get(region_id)
+            
+            # Regions whose detail payload is unchanged (304 or hub cache) are not converted again
+            unchanged = self._is_unchanged(summary_data)
+            region_warnings = {}
+            warnings = []
+            changed = set(changed_regions)
+            for region_id in active_regions:
+                if region_id not in changed:
+                    # Unchanged bulletin: reuse the cached warnings without a request
+                    region_warnings[region_id] = self._region_warnings[region_id]
+                    warnings.extend(region_warnings[region_id][1])
+                    continue
+                region = details.get(region_id)
+                if region is None:
+                    unchanged = False
+                    cached = self._region_warnings.get(region_id)
+                    if cached is not None:
+                        # Detail fetch failed: keep the last good warnings of this region
+                        self.stale = True
+                        region_warnings[region_id] = cached
+                        warnings.extend(cached[1])
+                    continue
+                cached = self._region_warnings.get(region_id)
+                if cached is not None and cached[0][0] is region[0]:
+                    converted = cached[1]
+                else:
+                    unchanged = False
+                    converted = self._relevant_alerts(region)
+                region_warnings[region_id] = (region, converted)
+                warnings.extend(converted)
+            unchanged = unchanged and region_warnings.keys() == self._region_warnings.keys()
+            self._region_warnings = region_warnings
+            self._region_fingerprints = {
+                region_id: fingerprint for region_id, fingerprint in self._region_fingerprints.items()
+                if region_id in region_warnings
+            }
+            
+            if unchanged:
+                _LOGGER.debug("Avalanche warnings for %s not modified", self.county_name)
+                self.not_modified = True
+                return list(self._last_warnings)
+            
+            _LOGGER.info("Successfully fetched avalanche warnings for %s: %d", self.county_name, len(warnings))
+            return list(self._remember(summary_data, warnings))
                         
         except aiohttp.ClientError as err:
             _LOGGER.error("Error fetching avalanche warnings: %s", err)
-            return []
+            return self._fallback()
         except Exception as err:
             _LOGGER.error("Unexpected error fetching avalanche warnings: %s", err)
-            return []
+            return self._fallback()
 
 
 # MetAlerts API (originally authored by @kutern84 and @svenove for met_alerts integration)
@@ -305,18 +697,31 @@ class MetAlertsAPI(BaseWarningAPI):
     unifying all Norwegian geohazard services.
     """
     
-    def __init__(self, latitude: float = None, longitude: float = None, county_id: str = None, county_name: str = None, lang: str = "en", test_mode: bool = False):
+    def __init__(self, latitude: float = None, longitude: float = None, county_id: str = None, county_name: str = None, lang: str = "en", test_mode: bool = False,
+                 http_client: NorwayAlertsHttpClient | None = None, fetch_hub: FetchHub | None = None,
+                 bulk: bool = False):
         """Initialize the MetAlerts API client.
         
         Can operate in two modes:
         1. Location-based: Uses latitude/longitude for geographic filtering
         2. County-based: Uses county_id for administrative filtering
+        
+        In bulk mode all current alerts are downloaded once (shared by all
+        entries through the fetch hub) and the location or county filter is
+        applied locally.
         """
         # Call parent with county values (may be empty for lat/lon mode)
-        super().__init__(county_id or "", county_name or "", lang)
+        super().__init__(county_id or "", county_name or "", lang, http_client, fetch_hub)
         self.latitude = latitude
         self.longitude = longitude
         self.test_mode = test_mode
+        self.bulk = bulk
+        self._last_nationwide: NationwideAlerts | None = None
+        # Alert areas of the last fetch: the alerts and the polygon index over their geometry
+        # (in bulk mode all current alerts, otherwise the ones fetched for this entry, indexed on first query)
+        self.area_alerts: List[Alert] = []
+        self.area_index: PolygonIndex | None = None
+        self._area_features: List[Dict[str, Any]] = []
     
     def _get_warning_type(self) -> str:
         return "metalerts"
@@ -338,12 +743,178 @@ class MetAlertsAPI(BaseWarningAPI):
         else:
             return title, None, None
     
-    async def fetch_warnings(self) -> List[Dict[str, Any]]:
+    def _convert_feature(self, feature: Dict[str, Any]) -> Alert:
+        """Convert a metalerts GeoJSON feature to the common Norway Alerts warning format."""
+        props = feature.get("properties", {})
+
+        # Extract basic information
+        title, starttime, endtime = self._extract_times_from_title(props.get("title", ""))
+
+        # Parse awareness_level (format: "2; orange; Moderate")
+        awareness_level = props.get("awareness_level", "")
+        try:
+            awareness_level_numeric, awareness_level_color, awareness_level_name = awareness_level.split("; ")
+            activity_level = awareness_level_numeric
+        except ValueError:
+            awareness_level_numeric = "1"
+            awareness_level_color = "yellow"
+            awareness_level_name = "Minor"
+            activity_level = "1"
+
+        # Get resource URL
+        resources = props.get("resources", [])
+        resource_url = ""
+        map_url = None
+        if resources and len(resources) > 0:
+            resource_url = resources[0].get("uri", "")
+            # Extract PNG map URL
+            for resource in resources:
+                if resource.get("mimeType") == "image/png":
+                    map_url = resource.get("uri")
+                    break
+
+        # Convert to Norway Alerts warning format
+        # Map event types for icon compatibility
+        event_type = props.get("event", "").lower()
+        # Handle special mappings for icons
+        if event_type == "gale":
+            icon_event_type = "wind"
+        elif event_type == "icing":
+            icon_event_type = "ice"
+        elif event_type == "blowingsnow":
+            icon_event_type = "snow"
+        else:
+            icon_event_type = event_type
+
+        return Alert.from_mapping({
+            "Id": props.get("id", ""),
+            "ActivityLevel": activity_level,
+            "DangerLevel": f"Level {activity_level}",
+            "DangerTypeName": props.get("event", "Weather warning"),
+            "MainText": props.get("description", ""),
+            "RegionName": props.get("area", ""),
+            "ValidFrom": starttime or props.get("eventEndingTime", ""),
+            "ValidTo": endtime or props.get("eventEndingTime", ""),
+            "PublishTime": "",  # Not provided by metalerts
+            "_warning_type": icon_event_type,
+
+            # Metalerts-specific attributes (preserving original structure)
+            "title": title,
+            "starttime": starttime,
+            "endtime": endtime,
+            "description": props.get("description", ""),
+            "awareness_level": awareness_level,
+            "awareness_level_numeric": awareness_level_numeric,
+            "awareness_level_color": awareness_level_color,
+            "awareness_level_name": awareness_level_name,
+            "certainty": props.get("certainty", ""),
+            "severity": props.get("severity", ""),
+            "instruction": props.get("instruction", ""),
+            "contact": props.get("contact", ""),
+            "resources": resources,
+            "area": props.get("area", ""),
+            "event": props.get("event", ""),
+            "event_awareness_name": props.get("eventAwarenessName", ""),
+            "consequences": props.get("consequences", ""),
+            "map_url": map_url,
+            "resource_url": resource_url,
+            "awareness_type": props.get("awareness_type", ""),
+            "ceiling": props.get("ceiling"),
+            "county": props.get("county", []),
+            "geographic_domain": props.get("geographicDomain", ""),
+            "risk_matrix_color": props.get("riskMatrixColor", ""),
+            "trigger_level": props.get("triggerLevel"),
+            "web": props.get("web", ""),
+        })
+    
+    def _index_nationwide(self, payload: Any) -> NationwideAlerts:
+        """Convert and index all current alerts (geometry and county lists). Blocking; run it in the executor."""
+        features = payload.get("features", []) if isinstance(payload, dict) else []
+        by_county: Dict[str, List[int]] = {}
+        for position, feature in enumerate(features):
+            for county in feature.get("properties", {}).get("county") or ():
+                by_county.setdefault(str(county), []).append(position)
+        return payload, [self._convert_feature(feature) for feature in features], PolygonIndex(features, coarse_tolerance=ALERT_AREA_COARSE_TOLERANCE), by_county
+    
+    async def _fetch_nationwide_alerts(self) -> Tuple[Any, List[Alert]]:
+        """Fetch all current alerts and return the payload and the alerts for this location or county."""
+        url = f"{API_BASE_METALERTS}/current.json?lang={self.lang}"
+        
+        async def _download_and_index() -> NationwideAlerts:
+            payload = await self._download_json(url)
+            # Not modified: the previous conversion and index are still valid
+            if self._last_nationwide is None or self._last_nationwide[0] is not payload:
+                self._last_nationwide = await asyncio.get_running_loop().run_in_executor(
+                    None, self._index_nationwide, payload
+                )
+            return self._last_nationwide
+        
+        if self.fetch_hub is not None:
+            payload, alerts, index, by_county = await self.fetch_hub.async_fetch(
+                url, _download_and_index, variant="indexed"
+            )
+        else:
+            payload, alerts, index, by_county = await _download_and_index()
+        self.area_alerts, self.area_index, self._area_features = alerts, index, []
+        
+        if self.latitude is not None and self.longitude is not None:
+            positions = index.features_at(float(self.longitude), float(self.latitude))
+        else:
+            positions = by_county.get(str(self.county_id), [])
+        return payload, [alerts[position] for position in positions]
+    
+    def _set_areas(self, alerts: List[Alert], features: List[Dict[str, Any]]) -> None:
+        """Keep the alerts and features of a per-entry fetch; the polygon index is built on first query."""
+        self.area_alerts, self.area_index, self._area_features = alerts, None, features
+    
+    def _area_index(self) -> PolygonIndex | None:
+        """Return the polygon index of the last fetch, building it if needed."""
+        if self.area_index is None and self._area_features:
+            self.area_index = PolygonIndex(self._area_features)
+            self._area_features = []
+        return self.area_index
+    
+    def alerts_at(self, latitude: float, longitude: float) -> List[Alert]:
+        """Return the alerts of the last fetch whose area contains the point."""
+        index = self._area_index()
+        if index is None:
+            return []
+        return [self.area_alerts[position] for position in index.features_at(longitude, latitude)]
+    
+    def alerts_in_bbox(self, south: float, west: float, north: float, east: float) -> List[Alert]:
+        """Return the alerts of the last fetch whose area intersects the bounding box."""
+        index = self._area_index()
+        if index is None:
+            return []
+        return [self.area_alerts[position] for position in index.features_in_bbox((west, south, east, north))]
+    
+    def nearest_alert(self, latitude: float, longitude: float) -> Tuple[Alert, float] | None:
+        """Return the alert of the last fetch with the closest area and its distance in km (0 inside)."""
+        index = self._area_index()
+        nearest = index.nearest(longitude, latitude) if index is not None else None
+        if nearest is None:
+            return None
+        return self.area_alerts[nearest[0]], nearest[1]
+    
+    def display_geometry(self, alert: Alert, tolerance: float = ALERT_AREA_DISPLAY_TOLERANCE) -> Dict[str, Any] | None:
+        """Return the area of an alert from the last fetch simplified for map output (GeoJSON MultiPolygon)."""
+        index = self._area_index()
+        if index is None:
+            return None
+        for position, candidate in enumerate(self.area_alerts):
+            if candidate is alert:
+                return index.display_geometry(position, tolerance)
+        return None
+    
+    async def fetch_warnings(self) -> List[Alert]:
         """Fetch weather alerts from Met.no metalerts API.
         
         Implementation adapted from met_alerts integration by @kutern84 and @svenove.
         Returns alerts converted to the common Norway Alerts warning format.
         """
+        if self.bulk and not self.test_mode:
+            return await self._fetch_bulk_warnings()
+        
         # Use test endpoint if in test mode
         if self.test_mode:
             url = f"{API_BASE_METALERTS}/example.json"
@@ -357,174 +928,117 @@ class MetAlertsAPI(BaseWarningAPI):
         else:
             raise ValueError("MetAlerts requires either lat/lon coordinates or county_id")
         
-        headers = {
-            "Accept": "application/json",
-            "User-Agent": _get_user_agent()
-        }
-        
         _LOGGER.debug("Fetching metalerts from: %s", url)
         
+        self.not_modified = False
+        self.stale = False
         try:
-            async with aiohttp.ClientSession() as session:
-                async with asyncio.timeout(10):
-                    async with session.get(url, headers=headers) as response:
-                        if response.status != 200:
-                            _LOGGER.error("Error fetching metalerts data: %s", response.status)
-                            return []
-                        
-                        content_type = response.headers.get("Content-Type", "")
-                        if "application/json" not in content_type:
-                            _LOGGER.error("Unexpected content type for metalerts: %s", content_type)
-                            return []
-                        
-                        json_data = await response.json()
-                        if not json_data:
-                            _LOGGER.info("No metalerts found")
-                            return []
-                        
-                        features = json_data.get("features", [])
-                        _LOGGER.info("Successfully fetched %d metalerts", len(features))
-                        
-                        # Convert metalerts format to common Norway Alerts warning format
-                        warnings = []
-                        for feature in features:
-                            props = feature.get("properties", {})
-                            
-                            # Extract basic information
-                            title, starttime, endtime = self._extract_times_from_title(props.get("title", ""))
-                            
-                            # Parse awareness_level (format: "2; orange; Moderate")
-                            awareness_level = props.get("awareness_level", "")
-                            try:
-                                awareness_level_numeric, awareness_level_color, awareness_level_name = awareness_level.split("; ")
-                                activity_level = awareness_level_numeric
-                            except ValueError:
-                                awareness_level_numeric = "1"
-                                awareness_level_color = "yellow"
-                                awareness_level_name = "Minor"
-                                activity_level = "1"
-                            
-                            # Get resource URL
-                            resources = props.get("resources", [])
-                            resource_url = ""
-                            map_url = None
-                            if resources and len(resources) > 0:
-                                resource_url = resources[0].get("uri", "")
-                                # Extract PNG map URL
-                                for resource in resources:
-                                    if resource.get("mimeType") == "image/png":
-                                        map_url = resource.get("uri")
-                                        break
-                            
-                            # Convert to Norway Alerts warning format
-                            # Map event types for icon compatibility
-                            event_type = props.get("event", "").lower()
-                            # Handle special mappings for icons
-                            if event_type == "gale":
-                                icon_event_type = "wind"
-                            elif event_type == "icing":
-                                icon_event_type = "ice"
-                            elif event_type == "blowingsnow":
-                                icon_event_type = "snow"
-                            else:
-                                icon_event_type = event_type
-                            
-                            converted_warning = {
-                                "Id": props.get("id", ""),
-                                "ActivityLevel": activity_level,
-                                "DangerLevel": f"Level {activity_level}",
-                                "DangerTypeName": props.get("event", "Weather warning"),
-                                "MainText": props.get("description", ""),
-                                "RegionName": props.get("area", ""),
-                                "ValidFrom": starttime or props.get("eventEndingTime", ""),
-                                "ValidTo": endtime or props.get("eventEndingTime", ""),
-                                "PublishTime": "",  # Not provided by metalerts
-                                "_warning_type": icon_event_type,
-                                
-                                # Metalerts-specific attributes (preserving original structure)
-                                "title": title,
-                                "starttime": starttime,
-                                "endtime": endtime,
-                                "description": props.get("description", ""),
-                                "awareness_level": awareness_level,
-                                "awareness_level_numeric": awareness_level_numeric,
-                                "awareness_level_color": awareness_level_color,
-                                "awareness_level_name": awareness_level_name,
-                                "certainty": props.get("certainty", ""),
-                                "severity": props.get("severity", ""),
-                                "instruction": props.get("instruction", ""),
-                                "contact": props.get("contact", ""),
-                                "resources": resources,
-                                "area": props.get("area", ""),
-                                "event": props.get("event", ""),
-                                "event_awareness_name": props.get("eventAwarenessName", ""),
-                                "consequences": props.get("consequences", ""),
-                                "map_url": map_url,
-                                "resource_url": resource_url,
-                                "awareness_type": props.get("awareness_type", ""),
-                                "ceiling": props.get("ceiling"),
-                                "county": props.get("county", []),
-                                "geographic_domain": props.get("geographicDomain", ""),
-                                "risk_matrix_color": props.get("riskMatrixColor", ""),
-                                "trigger_level": props.get("triggerLevel"),
-                                "web": props.get("web", ""),
-                            }
-                            warnings.append(converted_warning)
-                        
-                        return warnings
+            json_data = await self._get_json(url)
+            if self._is_unchanged(json_data):
+                _LOGGER.debug("Metalerts not modified")
+                self.not_modified = True
+                return list(self._last_warnings)
+            if not json_data:
+                _LOGGER.info("No metalerts found")
+                self._set_areas([], [])
+                return []
+            
+            features = json_data.get("features", [])
+            _LOGGER.info("Successfully fetched %d metalerts", len(features))
+            
+            # Convert metalerts format to common Norway Alerts warning format
+            alerts = [self._convert_feature(feature) for feature in features]
+            self._set_areas(alerts, features)
+            return list(self._remember(json_data, alerts))
         
+        except WarningAPIError as err:
+            _LOGGER.error("Error fetching metalerts data: %s", err)
+            return self._fallback()
         except aiohttp.ClientError as err:
             _LOGGER.error("Error fetching metalerts: %s", err)
-            return []
+            return self._fallback()
         except Exception as err:
             _LOGGER.error("Unexpected error fetching metalerts: %s", err)
-            return []
+            return self._fallback()
+    
+    async def _fetch_bulk_warnings(self) -> List[Alert]:
+        """Fetch weather alerts for this location or county from the shared nationwide alert list."""
+        if (self.latitude is None or self.longitude is None) and not self.county_id:
+            raise ValueError("MetAlerts requires either lat/lon coordinates or county_id")
+        
+        self.not_modified = False
+        self.stale = False
+        try:
+            payload, alerts = await self._fetch_nationwide_alerts()
+            if self._is_unchanged(payload):
+                _LOGGER.debug("Metalerts not modified")
+                self.not_modified = True
+                return list(self._last_warnings)
+            _LOGGER.info("Successfully fetched %d metalerts from the nationwide list", len(alerts))
+            return list(self._remember(payload, alerts))
+        
+        except WarningAPIError as err:
+            _LOGGER.error("Error fetching metalerts data: %s", err)
+            return self._fallback()
+        except aiohttp.ClientError as err:
+            _LOGGER.error("Error fetching metalerts: %s", err)
+            return self._fallback()
+        except Exception as err:
+            _LOGGER.error("Unexpected error fetching metalerts: %s", err)
+            return self._fallback()
 
 
 class WarningAPIFactory:
     """Factory for creating warning API clients."""
     
-    def __init__(self, county_id: str = "", county_name: str = "", latitude: float = None, longitude: float = None, lang: str = "en", test_mode: bool = False):
+    def __init__(self, county_id: str = "", county_name: str = "", latitude: float = None, longitude: float = None, lang: str = "en", test_mode: bool = False,
+                 http_client: NorwayAlertsHttpClient | None = None, fetch_hub: FetchHub | None = None,
+                 bulk_fetch: bool = False, region_table: RegionCountyTable | None = None):
         self.county_id = county_id
         self.county_name = county_name
         self.latitude = latitude
         self.longitude = longitude
         self.lang = lang
         self.test_mode = test_mode
+        self.bulk_fetch = bulk_fetch  # Serve entries from one nationwide download
+        self.http_client = http_client  # Shared pooled client from hass.data[DOMAIN]
+        self.fetch_hub = fetch_hub  # Shared request coalescing hub from hass.data[DOMAIN]
+        self.region_table = region_table  # Shared avalanche region -> county table from hass.data[DOMAIN]
     
     def get_api(self, warning_type: str) -> BaseWarningAPI:
         """Create appropriate API client for warning type."""
         if warning_type == "landslide":
-            return LandslideAPI(self.county_id, self.county_name, self.lang)
+            return LandslideAPI(self.county_id, self.county_name, self.lang, self.http_client, self.fetch_hub, bulk=self.bulk_fetch)
         elif warning_type == "flood":
-            return FloodAPI(self.county_id, self.county_name, self.lang)
+            return FloodAPI(self.county_id, self.county_name, self.lang, self.http_client, self.fetch_hub, bulk=self.bulk_fetch)
         elif warning_type == "avalanche":
-            return AvalancheAPI(self.county_id, self.county_name, self.lang)
+            return AvalancheAPI(self.county_id, self.county_name, self.lang, self.http_client, self.fetch_hub,
+                                region_table=self.region_table)
         elif warning_type == "metalerts":
             # MetAlerts (weather) - supports both lat/lon and county
             if self.latitude is not None and self.longitude is not None:
                 # Location-based mode
-                return MetAlertsAPI(latitude=self.latitude, longitude=self.longitude, lang=self.lang, test_mode=self.test_mode)
+                return MetAlertsAPI(latitude=self.latitude, longitude=self.longitude, lang=self.lang, test_mode=self.test_mode, http_client=self.http_client, fetch_hub=self.fetch_hub, bulk=self.bulk_fetch)
             elif self.county_id:
                 # County-based mode  
-                return MetAlertsAPI(county_id=self.county_id, county_name=self.county_name, lang=self.lang, test_mode=self.test_mode)
+                return MetAlertsAPI(county_id=self.county_id, county_name=self.county_name, lang=self.lang, test_mode=self.test_mode, http_client=self.http_client, fetch_hub=self.fetch_hub, bulk=self.bulk_fetch)
             else:
                 raise ValueError("MetAlerts requires either lat/lon coordinates or county_id")
         else:
             raise ValueError(f"Unknown warning type: {warning_type}")
     
     @staticmethod
-    def create_api(warning_type: str, county_id: str = "", county_name: str = "", latitude: float = None, longitude: float = None, lang: str = "en") -> BaseWarningAPI:
+    def create_api(warning_type: str, county_id: str = "", county_name: str = "", latitude: float = None, longitude: float = None, lang: str = "en", http_client: NorwayAlertsHttpClient | None = None) -> BaseWarningAPI:
         """Create appropriate API client for warning type (static method)."""
         if warning_type == "landslide":
-            return LandslideAPI(county_id, county_name, lang)
+            return LandslideAPI(county_id, county_name, lang, http_client)
         elif warning_type == "flood":
-            return FloodAPI(county_id, county_name, lang)
+            return FloodAPI(county_id, county_name, lang, http_client)
         elif warning_type == "avalanche":
-            return AvalancheAPI(county_id, county_name, lang)
+            return AvalancheAPI(county_id, county_name, lang, http_client)
         elif warning_type == "metalerts":
             if latitude is None or longitude is None:
                 raise ValueError("Latitude and longitude are required for metalerts")
-            return MetAlertsAPI(latitude, longitude, lang)
+            return MetAlertsAPI(latitude, longitude, lang=lang, http_client=http_client)
         else:
             raise ValueError(f"Unknown warning type: {warning_type}")
\ No newline at end of file
@@ -0,0 +1,154 @@
+"""Avalanche region to county relevance for the Norway Alerts integration.
+
+Avalanche warnings are issued per forecast region, and a region can span
+several counties. Which counties a region belongs to hardly ever changes, so
+the relation is computed once from a region's detail data and kept in a
+table shared by all avalanche entries: the county names listed in the
+region's ``CountyList`` and, per county, the share of the region's
+municipalities in that county. The table is persisted in a ``Store`` and a
+region's row is recomputed when it is older than ``AVALANCHE_REGION_MAX_AGE``,
+so every avalanche coordinator does a dictionary lookup per region instead of
+walking the municipality list of every warning.
+
+Region warnings also carry a UTM point; ``warning_positions`` converts those
+to longitude/latitude.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import Counter
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    DATA_AVALANCHE_REGIONS,
+    CACHE_STORAGE_VERSION,
+    CACHE_SAVE_DELAY,
+    AVALANCHE_REGION_MAX_AGE,
+    AVALANCHE_RELEVANCE_THRESHOLD,
+)
+from .projection import utm_zone
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _county_key(county_id: Any) -> str:
+    """Return a county number in the two digit form used by COUNTIES ("3" -> "03")."""
+    return str(county_id).strip().zfill(2)
+
+
+def county_shares(municipalities: List[Mapping[str, Any]]) -> Dict[str, float]:
+    """Return the share (0.0 - 1.0) of the municipalities in each county.
+
+    The county is taken from ``CountyId`` or, when that is empty, from the
+    first two digits of the municipality number.
+    """
+    counts: Counter = Counter()
+    for municipality in municipalities:
+        county_id = municipality.get("CountyId")
+        if county_id in (None, ""):
+            municipality_id = str(municipality.get("Id") or "").strip()
+            county_id = municipality_id.zfill(4)[:2] if municipality_id.isdigit() else None
+        if county_id not in (None, ""):
+            counts[_county_key(county_id)] += 1
+    total = len(municipalities)
+    return {county: count / total for county, count in counts.items()} if total else {}
+
+
+def warning_positions(warnings: Sequence[Mapping[str, Any]]) -> List[Tuple[float, float] | None]:
+    """Return the (longitude, latitude) of each warning's region point (UtmZone/UtmEast/UtmNorth).
+    
+    The points are converted per UTM zone in one call; warnings without a
+    valid point get None.
+    """
+    positions: List[Tuple[float, float] | None] = [None] * len(warnings)
+    by_zone: Dict[int, List[Tuple[int, float, float]]] = {}
+    for position, warning in enumerate(warnings):
+        try:
+            zone = int(warning.get("UtmZone"))
+            easting, northing = float(warning.get("UtmEast")), float(warning.get("UtmNorth"))
+        except (TypeError, ValueError):
+            continue
+        if 1 <= zone <= 60:
+            by_zone.setdefault(zone, []).append((position, easting, northing))
+    for zone, points in by_zone.items():
+        longitudes, latitudes = utm_zone(zone).inverse_many(
+            [point[1] for point in points], [point[2] for point in points]
+        )
+        for (position, _, _), longitude, latitude in zip(points, longitudes, latitudes):
+            positions[position] = (longitude, latitude)
+    return positions
+
+
+class RegionCountyTable:
+    """Region -> county relevance table, shared by all avalanche entries.
+
+    Without hass the table lives in memory only.
+    """
+
+    def __init__(self, hass: HomeAssistant | None = None, max_age: float = AVALANCHE_REGION_MAX_AGE):
+        self._store: Store[Dict[str, Any]] | None = (
+            Store(hass, CACHE_STORAGE_VERSION, f"{DOMAIN}.avalanche_regions") if hass is not None else None
+        )
+        self._max_age = max_age
+        # region id -> {"updated": unix time, "counties": [county names], "shares": {county id: share}}
+        self._regions: Dict[str, Dict[str, Any]] = {}
+        self._load_task: asyncio.Task | None = None
+
+    async def async_load(self) -> None:
+        """Load the persisted table (once, concurrent callers share the load)."""
+        if self._store is None:
+            return
+        if self._load_task is None:
+            self._load_task = asyncio.ensure_future(self._async_load())
+        await self._load_task
+
+    async def _async_load(self) -> None:
+        data = await self._store.async_load()
+        if data and isinstance(data.get("regions"), dict):
+            # Rows computed since startup win over persisted ones
+            self._regions = {**data["regions"], **self._regions}
+            _LOGGER.debug("Loaded county relevance of %d avalanche regions", len(self._regions))
+
+    def row(self, region_id: Any, warning: Mapping[str, Any]) -> Dict[str, Any]:
+        """Return the relevance row of a region, computing it from the warning when missing or outdated."""
+        key = str(region_id)
+        row = self._regions.get(key)
+        now = time.time()
+        if row is None or now - row.get("updated", 0) > self._max_age:
+            row = self._regions[key] = {
+                "updated": now,
+                "counties": sorted({county.get("Name", "") for county in warning.get("CountyList") or ()}),
+                "shares": county_shares(warning.get("MunicipalityList") or []),
+            }
+            self._async_schedule_save()
+        return row
+
+    def is_relevant(self, region_id: Any, warning: Mapping[str, Any], county_id: str, county_name: str,
+                    threshold: float = AVALANCHE_RELEVANCE_THRESHOLD) -> bool:
+        """Return True if the region is in the county (by name) or has enough municipalities there."""
+        row = self.row(region_id, warning)
+        if county_name in row["counties"]:
+            return True
+        return row["shares"].get(_county_key(county_id), 0.0) >= threshold
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the table."""
+        if self._store is not None:
+            self._store.async_delay_save(lambda: {"regions": self._regions}, CACHE_SAVE_DELAY)
+
+
+async def async_get_region_table(hass: HomeAssistant) -> RegionCountyTable:
+    """Return the shared region table, creating and loading it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    table = domain_data.get(DATA_AVALANCHE_REGIONS)
+    if table is None:
+        table = domain_data[DATA_AVALANCHE_REGIONS] = RegionCountyTable(hass)
+    await table.async_load()
+    return table
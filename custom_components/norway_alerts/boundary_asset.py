@@ -0,0 +1,308 @@
+"""Boundary data files for the Norway Alerts integration.
+
+Kartverket GeoJSON (county "Fylker" or municipality "Kommuner" datasets, plain
+or zipped) is read here. Features are streamed one at a time out of the
+archive (``geojson_stream``) and packed into flat arrays as they arrive, so
+the document is never held in memory as a whole.
+
+Parsing the county GeoJSON (13 MB of UTM 33 coordinates) still takes seconds,
+so it is converted once into a compact binary file that is memory-mapped at
+runtime:
+
+* WGS84 longitude/latitude quantized to int32 (``BOUNDARY_ASSET_SCALE`` units
+  per degree), with every ring closed
+* ring offsets per area and area offsets into the rings
+* the ``BoundaryGrid`` of the areas (cell owners, cell entries and edge runs)
+* a small JSON table with the county IDs and names
+
+Opening the file builds no per-vertex Python objects: every section is a
+memoryview into the mapping. The header records the SHA-256 of the source
+archive, and ``ensure_boundary_asset`` rebuilds the file when the archive
+changes (``async_build_boundary_asset`` does so in a worker process).
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import json
+import mmap
+import multiprocessing
+import os
+import struct
+import sys
+import zipfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Tuple
+
+from .const import COUNTIES, BOUNDARY_ASSET_SCALE, BOUNDARY_ASSET_CELL_DEGREES
+from .geojson_stream import iter_features
+from .geometry import BoundaryGrid, append_area, geometry_polygons
+from .projection import UTM33, TransverseMercator
+
+MAGIC = b"NABOUND2"
+# Magic, source SHA-256, scale, grid origin x/y, cell size,
+# vertices, rings, areas, grid columns, grid rows, grid entries, edge runs, table bytes
+_HEADER = struct.Struct("<8s32s4d8I")
+
+# Section name and array type code, in file order (item counts follow from the header)
+_SECTIONS: Tuple[Tuple[str, str], ...] = (
+    ("coords", "i"),
+    ("ring_starts", "i"),
+    ("area_rings", "i"),
+    ("owners", "i"),
+    ("cell_starts", "i"),
+    ("entry_areas", "i"),
+    ("entry_starts", "i"),
+    ("runs", "i"),
+)
+
+# Names, county IDs, packed (coords, ring_starts, area_rings) and their projection (None for longitude/latitude)
+BoundaryAreas = Tuple[List[str], List[str], Tuple[array, array, array], TransverseMercator | None]
+
+
+def _section_lengths(vertices: int, rings: int, areas: int, cols: int, rows: int,
+                     entries: int, runs: int) -> Dict[str, int]:
+    """Return the number of items of each section."""
+    return {
+        "coords": 2 * vertices,
+        "ring_starts": rings + 1,
+        "area_rings": areas + 1,
+        "owners": cols * rows,
+        "cell_starts": cols * rows + 1,
+        "entry_areas": entries,
+        "entry_starts": entries + 1,
+        "runs": 2 * runs,
+    }
+
+
+def iter_area_features(geojson_path: str, header: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Stream the area features of a GeoJSON file or a zip archive of GeoJSON files.
+
+    Features are decoded one at a time straight out of the (compressed)
+    archive member. header receives the members of the collection the
+    features come from, such as its "crs".
+    """
+    if zipfile.is_zipfile(geojson_path):
+        with zipfile.ZipFile(geojson_path) as archive:
+            # Kartverket archives also contain the boundary lines ("Grense"); try the areas first
+            names = sorted(
+                (name for name in archive.namelist() if name.endswith(".geojson")),
+                key=lambda name: "Grense" in name,
+            )
+            for name in names:
+                header.clear()
+                found = False
+                with archive.open(name) as member:
+                    for feature in iter_features(io.TextIOWrapper(member, encoding="utf-8"), header):
+                        if isinstance(feature, dict) and geometry_polygons(feature.get("geometry")):
+                            found = True
+                            yield feature
+                if found:
+                    return
+        raise ValueError(f"No GeoJSON area features found in {geojson_path}")
+
+    with open(geojson_path, encoding="utf-8") as geojson_file:
+        for feature in iter_features(geojson_file, header):
+            if isinstance(feature, dict) and geometry_polygons(feature.get("geometry")):
+                yield feature
+
+
+def collection_projection(collection: Dict[str, Any]) -> TransverseMercator | None:
+    """Return the projection of the collection's coordinates (None for longitude/latitude)."""
+    crs = str((collection.get("crs") or {}).get("properties", {}).get("name", ""))
+    if crs.endswith("25833"):
+        return UTM33
+    if not crs or crs.endswith(("4326", "4258", "CRS84")):
+        return None
+    raise ValueError(f"Unsupported coordinate reference system: {crs}")
+
+
+def area_properties(props: Dict[str, Any]) -> Tuple[str, str]:
+    """Return the Norwegian name and county ID of a county or municipality feature.
+
+    Sami and Kven name variants are dropped ("Troms - Romsa - Tromssa" -> "Troms").
+    """
+    is_county = "kommunenummer" not in props
+    if is_county:
+        county_id = str(props.get("fylkesnummer") or "").zfill(2)
+    else:
+        county_id = str(props["kommunenummer"]).zfill(4)[:2]
+    if is_county and county_id in COUNTIES:
+        return COUNTIES[county_id], county_id
+    name = props.get("kommunenavn") or props.get("fylkesnavn")
+    return str(name or "").split(" - ")[0].strip(), county_id
+
+
+def source_hash(path: str) -> bytes:
+    """Return the SHA-256 digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for chunk in iter(lambda: source.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def read_boundary_areas(geojson_path: str) -> BoundaryAreas:
+    """
+    Read the areas of a Kartverket boundary file into packed arrays.
+    
+    Features are streamed one at a time and their rings appended to flat
+    arrays in the file's coordinates, so memory use stays close to the size
+    of the packed vertices.
+    
+    Returns:
+        names, county_ids, (coords, ring_starts, area_rings) as returned by
+        ``pack_areas`` and the projection of the coordinates
+    """
+    header: Dict[str, Any] = {}
+    names: List[str] = []
+    county_ids: List[str] = []
+    coords, ring_starts, area_rings = array("d"), array("l", [0]), array("l", [0])
+    for feature in iter_area_features(geojson_path, header):
+        name, county_id = area_properties(feature.get("properties") or {})
+        names.append(name)
+        county_ids.append(county_id)
+        append_area(
+            coords, ring_starts, area_rings,
+            [ring for polygon in geometry_polygons(feature.get("geometry")) for ring in polygon],
+        )
+    return names, county_ids, (coords, ring_starts, area_rings), collection_projection(header)
+
+
+def build_boundary_asset(source_path: str, asset_path: str) -> None:
+    """Convert the Kartverket county archive into the binary boundary asset.
+    
+    Blocks for a few seconds; the file is replaced atomically. Inside Home
+    Assistant use ``async_build_boundary_asset``, which runs it in a worker
+    process.
+    """
+    names, county_ids, (source_coords, ring_starts, area_rings), projection = read_boundary_areas(source_path)
+    xs, ys = source_coords[0::2], source_coords[1::2]
+    longitudes, latitudes = projection.inverse_many(xs, ys) if projection else (xs, ys)
+    # Quantized longitude/latitude, interleaved like the source coordinates
+    coords = array("d", bytes(source_coords.itemsize * len(source_coords)))
+    coords[0::2] = array("d", (round(longitude * BOUNDARY_ASSET_SCALE) for longitude in longitudes))
+    coords[1::2] = array("d", (round(latitude * BOUNDARY_ASSET_SCALE) for latitude in latitudes))
+    table = {"county_ids": county_ids, "names": names}
+
+    grid = BoundaryGrid(coords, ring_starts, area_rings, BOUNDARY_ASSET_CELL_DEGREES * BOUNDARY_ASSET_SCALE)
+    buffers = grid.buffers()
+    sections: Dict[str, Any] = {
+        "coords": coords,
+        "ring_starts": ring_starts,
+        "area_rings": area_rings,
+        "owners": buffers["owners"],
+        "cell_starts": buffers["cell_starts"],
+        "entry_areas": buffers["entry_areas"],
+        "entry_starts": buffers["entry_starts"],
+        "runs": buffers["runs"],
+    }
+    table_bytes = json.dumps(table, ensure_ascii=False).encode("utf-8")
+    header = _HEADER.pack(
+        MAGIC, source_hash(source_path), float(BOUNDARY_ASSET_SCALE),
+        buffers["origin"][0], buffers["origin"][1], buffers["cell_size"],
+        len(coords) // 2, len(ring_starts) - 1, len(area_rings) - 1, buffers["cols"], buffers["rows"],
+        len(buffers["entry_areas"]), len(buffers["runs"]) // 2, len(table_bytes),
+    )
+
+    temp_path = f"{asset_path}.tmp"
+    os.makedirs(os.path.dirname(asset_path) or ".", exist_ok=True)
+    with open(temp_path, "wb") as asset:
+        asset.write(header)
+        for name, typecode in _SECTIONS:
+            values = array(typecode, (int(value) for value in sections[name]))
+            if sys.byteorder == "big":
+                values.byteswap()
+            asset.write(values.tobytes())
+        asset.write(table_bytes)
+    os.replace(temp_path, asset_path)
+
+
+def read_source_hash(asset_path: str) -> bytes | None:
+    """Return the source hash recorded in an asset, or None if it is missing or not an asset."""
+    try:
+        with open(asset_path, "rb") as asset:
+            header = asset.read(_HEADER.size)
+    except OSError:
+        return None
+    if len(header) < _HEADER.size or not header.startswith(MAGIC):
+        return None
+    return _HEADER.unpack(header)[1]
+
+
+def boundary_asset_outdated(source_path: str, asset_path: str) -> bool:
+    """Return True if the source archive exists and differs from the one the asset was built from."""
+    if not os.path.exists(source_path):
+        return False
+    return read_source_hash(asset_path) != source_hash(source_path)
+
+
+def ensure_boundary_asset(source_path: str, asset_path: str) -> bool:
+    """Rebuild the asset if the source archive exists and differs from the one it was built from.
+    
+    Returns True if the asset was rebuilt.
+    """
+    if not boundary_asset_outdated(source_path, asset_path):
+        return False
+    build_boundary_asset(source_path, asset_path)
+    return True
+
+
+def _build_in_worker_process(source_path: str, asset_path: str) -> None:
+    """Build the asset in a worker process and wait for the pool to shut down."""
+    # Spawn rather than fork the multi-threaded Home Assistant process
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        executor.submit(build_boundary_asset, source_path, asset_path).result()
+
+
+async def async_build_boundary_asset(source_path: str, asset_path: str) -> None:
+    """Build the asset in a worker process, keeping the parsing off the event loop and out of this process.
+    
+    Only the finished asset file comes back; the caller maps it. Starting
+    and joining the pool happens in an executor thread.
+    """
+    await asyncio.get_running_loop().run_in_executor(None, _build_in_worker_process, source_path, asset_path)
+
+
+class BoundaryAsset:
+    """A memory-mapped boundary asset."""
+
+    def __init__(self, asset_path: str):
+        """Map the asset file (raises ValueError if it is not a boundary asset)."""
+        with open(asset_path, "rb") as asset:
+            self._mmap = mmap.mmap(asset.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, self.source_hash, self.scale, origin_x, origin_y, cell_size, vertices, rings, areas,
+         cols, rows, entries, runs, table_length) = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{asset_path} is not a boundary asset")
+
+        view = memoryview(self._mmap)
+        offset = _HEADER.size
+        lengths = _section_lengths(vertices, rings, areas, cols, rows, entries, runs)
+        sections: Dict[str, Any] = {}
+        for name, typecode in _SECTIONS:
+            size = lengths[name] * array(typecode).itemsize
+            section = view[offset:offset + size].cast(typecode)
+            if sys.byteorder == "big":
+                section = array(typecode, section)
+                section.byteswap()
+            sections[name] = section
+            offset += size
+        table = json.loads(bytes(view[offset:offset + table_length]).decode("utf-8"))
+
+        self.names: List[str] = table["names"]
+        self.county_ids: List[str] = table["county_ids"]
+        self.coords = sections["coords"]
+        self.ring_starts = sections["ring_starts"]
+        self.area_rings = sections["area_rings"]
+        self.grid = BoundaryGrid.from_buffers(
+            sections["coords"], (origin_x, origin_y), cell_size, cols, rows, sections["owners"],
+            sections["cell_starts"], sections["entry_areas"], sections["entry_starts"], sections["runs"],
+        )
+
+    def __len__(self) -> int:
+        """Return the number of areas."""
+        return len(self.names)
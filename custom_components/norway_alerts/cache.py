@@ -0,0 +1,64 @@
+"""Persistent warning cache for the Norway Alerts integration.
+
+The last good warnings of every config entry are saved with their fetch time
+in a ``Store`` under ``.storage``. On startup the cached warnings are served
+immediately while the coordinator revalidates against the upstream API in the
+background, so Home Assistant startup does not wait on NVE or Met.no.
+"""
+from __future__ import annotations
+
+import datetime as dt
+import logging
+from collections.abc import Mapping
+from typing import Any, Dict, List, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, CACHE_STORAGE_VERSION, CACHE_SAVE_DELAY, CACHE_MAX_AGE
+from .models import Alert
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WarningCache:
+    """Store-backed cache holding the last good warnings of one config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        self._store: Store[Dict[str, Any]] = Store(
+            hass, CACHE_STORAGE_VERSION, f"{DOMAIN}.cache.{entry_id}"
+        )
+
+    async def async_load(self) -> Tuple[List[Alert], dt.datetime] | None:
+        """Return the cached warnings and their fetch time, or None if missing or too old."""
+        data = await self._store.async_load()
+        if not data or not isinstance(data.get("warnings"), list):
+            return None
+
+        fetched_at = dt_util.parse_datetime(data.get("fetched_at") or "")
+        if fetched_at is None:
+            return None
+        if dt_util.utcnow() - fetched_at > dt.timedelta(seconds=CACHE_MAX_AGE):
+            _LOGGER.debug("Ignoring cached warnings from %s (too old)", fetched_at)
+            return None
+        return [Alert.from_mapping(warning) for warning in data["warnings"]], fetched_at
+
+    @callback
+    def async_save(self, warnings: List[Mapping[str, Any]]) -> None:
+        """Schedule saving the warnings with the current time as fetch time."""
+        fetched_at = dt_util.utcnow().isoformat()
+        self._store.async_delay_save(
+            lambda: {
+                "fetched_at": fetched_at,
+                "warnings": [
+                    warning.as_dict() if isinstance(warning, Alert) else warning
+                    for warning in warnings
+                ],
+            },
+            CACHE_SAVE_DELAY,
+        )
+
+    async def async_remove(self) -> None:
+        """Remove the cache file."""
+        await self._store.async_remove()
@@ -0,0 +1,179 @@
+"""Shared HTTP client for the Norway Alerts integration.
+
+All warning APIs (NVE landslide/flood/avalanche and Met.no) talk to a handful
+of hosts. Instead of opening a new aiohttp session for every request, one
+pooled session is kept per Home Assistant instance in ``hass.data[DOMAIN]``
+and injected into the API clients through ``WarningAPIFactory``.
+"""
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+from typing import Any, Dict, Mapping, Tuple
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import (
+    DOMAIN,
+    DATA_HTTP_CLIENT,
+    HTTP_CONNECTION_LIMIT,
+    HTTP_CONNECTION_LIMIT_PER_HOST,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_VALIDATOR_CACHE_SIZE,
+)
+from .resilience import CircuitBreaker
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class NorwayAlertsHttpClient:
+    """Pooled aiohttp session with per-host limits, keep-alive and DNS cache.
+
+    Connection usage is tracked through aiohttp trace hooks so the effect of
+    pooling can be inspected via ``stats``.
+
+    The client also remembers the ``ETag``/``Last-Modified`` validators and the
+    decoded payload of recent responses, so callers can make conditional
+    requests and reuse the payload when the server answers 304 Not Modified.
+    """
+
+    def __init__(
+        self,
+        limit: int = HTTP_CONNECTION_LIMIT,
+        limit_per_host: int = HTTP_CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout: float = HTTP_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: int = HTTP_DNS_CACHE_TTL,
+        validator_cache_size: int = HTTP_VALIDATOR_CACHE_SIZE,
+    ):
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._dns_cache_ttl = dns_cache_ttl
+        self._session: aiohttp.ClientSession | None = None
+        self._validator_cache_size = validator_cache_size
+        # url -> (etag, last_modified, payload), oldest first
+        self._validators: Dict[str, Tuple[str | None, str | None, Any]] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._stats = {
+            "requests": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0,
+            "not_modified": 0,
+        }
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of the request/connection counters."""
+        stats = dict(self._stats)
+        acquired = stats["connections_created"] + stats["connections_reused"]
+        stats["reuse_ratio"] = (
+            round(stats["connections_reused"] / acquired, 3) if acquired else 0.0
+        )
+        return stats
+
+    def circuit_breaker(self, host: str) -> CircuitBreaker:
+        """Return the circuit breaker of an upstream host."""
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker()
+        return breaker
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Return If-None-Match/If-Modified-Since headers for a previously seen url."""
+        cached = self._validators.get(url)
+        if cached is None:
+            return {}
+        etag, last_modified, _ = cached
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def remember_response(self, url: str, headers: Mapping[str, str], payload: Any) -> None:
+        """Store the validators and decoded payload of a 200 response."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        self._validators.pop(url, None)
+        if not etag and not last_modified:
+            return
+        self._validators[url] = (etag, last_modified, payload)
+        while len(self._validators) > self._validator_cache_size:
+            del self._validators[next(iter(self._validators))]
+
+    def not_modified_payload(self, url: str) -> Any:
+        """Return the payload stored for url after a 304 response, or None."""
+        cached = self._validators.get(url)
+        if cached is None:
+            return None
+        self._stats["not_modified"] += 1
+        return cached[2]
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create the underlying session and connection pool."""
+        connector = aiohttp.TCPConnector(
+            limit=self._limit,
+            limit_per_host=self._limit_per_host,
+            keepalive_timeout=self._keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self._dns_cache_ttl,
+        )
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._count("requests"))
+        trace_config.on_connection_create_end.append(self._count("connections_created"))
+        trace_config.on_connection_reuseconn.append(self._count("connections_reused"))
+        trace_config.on_dns_cache_hit.append(self._count("dns_cache_hits"))
+        trace_config.on_dns_cache_miss.append(self._count("dns_cache_misses"))
+
+        _LOGGER.debug(
+            "Creating shared HTTP session (limit=%d, per_host=%d, keepalive=%ss, dns_ttl=%ss)",
+            self._limit, self._limit_per_host, self._keepalive_timeout, self._dns_cache_ttl,
+        )
+        return aiohttp.ClientSession(connector=connector, trace_configs=[trace_config])
+
+    def _count(self, counter: str):
+        """Return a trace callback that increments the given counter."""
+        async def _on_event(
+            session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+        ) -> None:
+            self._stats[counter] += 1
+
+        return _on_event
+
+    async def async_close(self) -> None:
+        """Close the pooled session."""
+        if self._session is not None and not self._session.closed:
+            _LOGGER.debug("Closing shared HTTP session, stats: %s", self.stats)
+            await self._session.close()
+        self._session = None
+
+
+@callback
+def async_get_http_client(hass: HomeAssistant) -> NorwayAlertsHttpClient:
+    """Return the shared HTTP client, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    client = domain_data.get(DATA_HTTP_CLIENT)
+    if client is None:
+        client = NorwayAlertsHttpClient()
+        domain_data[DATA_HTTP_CLIENT] = client
+
+        async def _async_close_client(event: Event) -> None:
+            await client.async_close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_client)
+    return client
@@ -11,6 +11,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
 
 from .api import _get_user_agent
+from .client import async_get_http_client
 from .const import (
     DOMAIN,
     DEFAULT_NAME,
@@ -25,6 +26,7 @@ from .const import (
     CONF_MUNICIPALITY_FILTER,
     CONF_TEST_MODE,
     CONF_CAP_FORMAT,
+    CONF_BULK_FETCH,
     CONF_ENABLE_NOTIFICATIONS,
     CONF_NOTIFICATION_SEVERITY,
     CONF_METALERTS_LOCATION_MODE,
@@ -43,6 +45,12 @@ from .const import (
     METALERTS_MODE_LATLON,
     METALERTS_MODE_COUNTY,
 )
+from .municipality_lookup import (
+    MUNICIPALITY_LOOKUP_COUNTIES,
+    async_get_county_boundaries,
+    get_county_from_coordinates,
+    get_municipality_from_coordinates,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -58,26 +66,78 @@ async def validate_api_connection(hass: HomeAssistant, county_id: str, warning_t
         "User-Agent": _get_user_agent()
     }
     
+    # Reuse the integration-wide pooled session
+    session = async_get_http_client(hass).session
+    
     try:
-        async with aiohttp.ClientSession() as session:
-            async with asyncio.timeout(10):
-                async with session.get(url, headers=headers) as response:
-                    if response.status != 200:
-                        raise ValueError(f"API returned status {response.status}")
-                    
-                    content_type = response.headers.get('Content-Type', '')
-                    if 'application/json' not in content_type:
-                        raise ValueError(f"Unexpected content type: {content_type}")
-                    
-                    # Try to parse JSON
-                    await response.json()
-                    return True
+        async with asyncio.timeout(10):
+            async with session.get(url, headers=headers) as response:
+                if response.status != 200:
+                    raise ValueError(f"API returned status {response.status}")
+                
+                content_type = response.headers.get('Content-Type', '')
+                if 'application/json' not in content_type:
+                    raise ValueError(f"Unexpected content type: {content_type}")
+                
+                # Try to parse JSON
+                await response.json()
+                return True
     except aiohttp.ClientError as err:
         raise ValueError(f"Cannot connect to API: {err}")
     except Exception as err:
         raise ValueError(f"Unexpected error: {err}")
 
 
+async def async_resolve_location(hass: HomeAssistant, latitude, longitude) -> tuple[str | None, str]:
+    """Resolve coordinates to a county ID and a suggested municipality filter.
+    
+    The county comes from the bundled county boundaries (a local grid lookup,
+    no network). Only county boundaries are bundled, so the municipality is
+    suggested from the approximate municipality table, which covers Vestland
+    only; in other counties the filter is left empty. Returns (None, "")
+    outside Norway or if the boundaries cannot be loaded.
+    """
+    if latitude is None or longitude is None:
+        return None, ""
+    try:
+        boundaries = await async_get_county_boundaries(hass)
+    except (OSError, ValueError) as err:
+        _LOGGER.warning("County boundaries unavailable, county must be selected manually: %s", err)
+        return None, ""
+    county_id = get_county_from_coordinates(float(latitude), float(longitude), boundaries)
+    if county_id is None:
+        return None, ""
+    if county_id not in MUNICIPALITY_LOOKUP_COUNTIES:
+        return county_id, ""
+    municipality = get_municipality_from_coordinates(float(latitude), float(longitude))
+    return county_id, municipality[0] if municipality and municipality[1] == county_id else ""
+
+
+async def async_apply_site_coordinates(hass: HomeAssistant, user_input: dict, errors: dict) -> None:
+    """Replace the county (and the municipality filter) with those of entered site coordinates.
+    
+    NVE warnings are per county, so the coordinates themselves are not kept.
+    Raises ValueError (with errors["base"] set) for incomplete coordinates or
+    coordinates outside Norway.
+    """
+    latitude = user_input.pop(CONF_LATITUDE, None)
+    longitude = user_input.pop(CONF_LONGITUDE, None)
+    if latitude is None and longitude is None:
+        return
+    if latitude is None or longitude is None:
+        errors["base"] = "missing_location"
+        raise ValueError("Both latitude and longitude are required")
+    county_id, municipality = await async_resolve_location(hass, latitude, longitude)
+    if county_id is None:
+        errors["base"] = "outside_norway"
+        raise ValueError(f"No county found at {latitude}, {longitude}")
+    _, home_municipality = await async_resolve_location(hass, hass.config.latitude, hass.config.longitude)
+    # A filter typed for the selected county is kept; an empty, pre-filled or other county's filter is replaced
+    if county_id != user_input.get(CONF_COUNTY_ID) or user_input.get(CONF_MUNICIPALITY_FILTER, "") in ("", home_municipality):
+        user_input[CONF_MUNICIPALITY_FILTER] = municipality
+    user_input[CONF_COUNTY_ID] = county_id
+
+
 class NorwayAlertsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Norway Alerts."""
 
@@ -176,6 +236,11 @@ class NorwayAlertsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     CONF_NOTIFICATION_SEVERITY: self.context.get("notification_severity", NOTIFICATION_SEVERITY_YELLOW_PLUS),
                 }
                 
+                # Site coordinates, when entered, decide the county of NVE warnings
+                if needs_county:
+                    user_input = dict(user_input)
+                    await async_apply_site_coordinates(self.hass, user_input, errors)
+                
                 # Add county data if needed (for NVE warnings or MetAlerts county mode)
                 if needs_county or needs_metalerts_county:
                     county_id = user_input.get(CONF_COUNTY_ID)
@@ -227,6 +292,9 @@ class NorwayAlertsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     longitude = final_data[CONF_LONGITUDE]
                     unique_id = f"{latitude:.4f}_{longitude:.4f}_{warning_type}"
                     title = f"Weather Alerts ({latitude:.2f}, {longitude:.2f})"
+                    county_id, _ = await async_resolve_location(self.hass, latitude, longitude)
+                    if county_id in COUNTIES:
+                        title = f"{COUNTIES[county_id]} {title}"
                 
                 await self.async_set_unique_id(unique_id)
                 self._abort_if_unique_id_configured()
@@ -246,14 +314,25 @@ class NorwayAlertsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Build conditional schema based on needs
         schema_dict = {}
         
+        # Default to the county (and known municipality) of Home Assistant's location
+        home_county, home_municipality = None, ""
+        if needs_county or needs_metalerts_county:
+            home_county, home_municipality = await async_resolve_location(
+                self.hass, self.hass.config.latitude, self.hass.config.longitude
+            )
+        default_county = home_county or "46"
+        
         if needs_county:
-            schema_dict[vol.Required(CONF_COUNTY_ID, default="46")] = vol.In(
+            schema_dict[vol.Required(CONF_COUNTY_ID, default=default_county)] = vol.In(
                 {k: v for k, v in sorted(COUNTIES.items(), key=lambda x: x[1])}
             )
-            schema_dict[vol.Optional(CONF_MUNICIPALITY_FILTER, default="")] = cv.string
+            schema_dict[vol.Optional(CONF_MUNICIPALITY_FILTER, default=home_municipality)] = cv.string
+            # Optional site coordinates override the county (for cabins and other sites)
+            schema_dict[vol.Optional(CONF_LATITUDE)] = cv.latitude
+            schema_dict[vol.Optional(CONF_LONGITUDE)] = cv.longitude
         
         if needs_metalerts_county:
-            schema_dict[vol.Required(CONF_COUNTY_ID, default="46")] = vol.In(
+            schema_dict[vol.Required(CONF_COUNTY_ID, default=default_county)] = vol.In(
                 {k: v for k, v in sorted(COUNTIES.items(), key=lambda x: x[1])}
             )
         
@@ -304,6 +383,11 @@ class NorwayAlertsOptionsFlow(config_entries.OptionsFlow):
                 )
                 needs_metalerts_county = warning_type == WARNING_TYPE_METALERTS and metalerts_mode == METALERTS_MODE_COUNTY
                 
+                # Site coordinates, when entered, decide the county of NVE warnings
+                if needs_county:
+                    user_input = dict(user_input)
+                    await async_apply_site_coordinates(self.hass, user_input, errors)
+                
                 # Validate based on warning type
                 if needs_county or needs_metalerts_county:
                     county_id = user_input.get(CONF_COUNTY_ID)
@@ -367,6 +451,9 @@ class NorwayAlertsOptionsFlow(config_entries.OptionsFlow):
         # If no existing value (shouldn't happen), default to False to be safe
         if current_cap_format is None:
             current_cap_format = False
+        current_bulk_fetch = self.config_entry.options.get(
+            CONF_BULK_FETCH, self.config_entry.data.get(CONF_BULK_FETCH, False)
+        )
         
         # Determine what location fields to show
         needs_county = current_warning_type in [WARNING_TYPE_LANDSLIDE, WARNING_TYPE_FLOOD, WARNING_TYPE_AVALANCHE]
@@ -392,8 +479,16 @@ class NorwayAlertsOptionsFlow(config_entries.OptionsFlow):
         
         if needs_county or needs_metalerts_county:
             current_county_id = self.config_entry.options.get(
-                CONF_COUNTY_ID, self.config_entry.data.get(CONF_COUNTY_ID, "46")
+                CONF_COUNTY_ID, self.config_entry.data.get(CONF_COUNTY_ID)
             )
+            if not current_county_id:
+                # Switching from coordinates: start from the county of the entry's or Home Assistant's location
+                current_county_id, _ = await async_resolve_location(
+                    self.hass,
+                    self.config_entry.data.get(CONF_LATITUDE, self.hass.config.latitude),
+                    self.config_entry.data.get(CONF_LONGITUDE, self.hass.config.longitude),
+                )
+                current_county_id = current_county_id or "46"
             schema_dict[vol.Required(CONF_COUNTY_ID, default=current_county_id)] = vol.In(
                 {k: v for k, v in sorted(COUNTIES.items(), key=lambda x: x[1])}
             )
@@ -404,6 +499,8 @@ class NorwayAlertsOptionsFlow(config_entries.OptionsFlow):
                     CONF_MUNICIPALITY_FILTER, self.config_entry.data.get(CONF_MUNICIPALITY_FILTER, "")
                 )
                 schema_dict[vol.Optional(CONF_MUNICIPALITY_FILTER, default=current_municipality_filter)] = cv.string
+                schema_dict[vol.Optional(CONF_LATITUDE)] = cv.latitude
+                schema_dict[vol.Optional(CONF_LONGITUDE)] = cv.longitude
         
         if needs_metalerts_latlon:
             current_latitude = self.config_entry.options.get(
@@ -440,6 +537,10 @@ class NorwayAlertsOptionsFlow(config_entries.OptionsFlow):
         if current_warning_type in [WARNING_TYPE_LANDSLIDE, WARNING_TYPE_FLOOD, WARNING_TYPE_AVALANCHE]:
             schema_dict[vol.Optional(CONF_CAP_FORMAT, default=current_cap_format)] = cv.boolean
         
+        # Bulk fetch shares one nationwide download between all entries (not used by avalanche)
+        if current_warning_type in [WARNING_TYPE_LANDSLIDE, WARNING_TYPE_FLOOD, WARNING_TYPE_METALERTS]:
+            schema_dict[vol.Optional(CONF_BULK_FETCH, default=current_bulk_fetch)] = cv.boolean
+        
         data_schema = vol.Schema(schema_dict)
 
         return self.async_show_form(
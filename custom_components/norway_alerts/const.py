@@ -24,6 +24,7 @@ CONF_ENABLE_NOTIFICATIONS = "enable_notifications"
 CONF_NOTIFICATION_SEVERITY = "notification_severity"
 CONF_METALERTS_LOCATION_MODE = "metalerts_location_mode"
 CONF_CAP_FORMAT = "cap_format"
+CONF_BULK_FETCH = "bulk_fetch"
 
 # Display formatting options (for formatted_content attribute)
 CONF_SHOW_ICON = "show_icon"
@@ -57,6 +58,77 @@ API_BASE_AVALANCHE = "https://api01.nve.no/hydrology/forecast/avalanche/v6.3.0"
 # Met.no API Base URL (using Home Assistant proxy)
 API_BASE_METALERTS = "https://aa015h6buqvih86i1.api.met.no/weatherapi/metalerts/2.0"
 
+# Shared HTTP client (one pooled session per Home Assistant instance)
+DATA_HTTP_CLIENT = "http_client"
+HTTP_CONNECTION_LIMIT = 20
+HTTP_CONNECTION_LIMIT_PER_HOST = 4
+HTTP_KEEPALIVE_TIMEOUT = 60  # seconds an idle connection is kept open
+HTTP_DNS_CACHE_TTL = 300  # seconds a resolved host is cached
+HTTP_REQUEST_TIMEOUT = 10  # seconds per request
+HTTP_VALIDATOR_CACHE_SIZE = 128  # URLs whose ETag/Last-Modified and payload are kept for conditional requests
+JSON_EXECUTOR_THRESHOLD = 64 * 1024  # bytes, larger response bodies are decoded in the executor
+
+# Retries and circuit breaker for the shared HTTP client
+HTTP_RETRY_ATTEMPTS = 3  # attempts per request, including the first
+HTTP_RETRY_BASE_DELAY = 1.0  # seconds, doubled per retry (full jitter)
+HTTP_RETRY_MAX_DELAY = 10.0  # seconds
+CIRCUIT_FAILURE_THRESHOLD = 3  # consecutive failed requests (after retries) before a host's circuit opens
+CIRCUIT_RESET_TIMEOUT = 300  # seconds before a trial request is allowed again
+
+# Nationwide NVE warning list (bulk mode), partitioned per county locally
+NVE_BULK_WARNINGS_PATH = "Warning/All/{lang_key}"
+
+# Cross-entry request coalescing (identical upstream URLs are fetched once)
+DATA_FETCH_HUB = "fetch_hub"
+FETCH_HUB_TTL = 60  # seconds a fetched payload is shared between entries
+
+# Persistent per-entry warning cache (served on startup, revalidated in the background)
+CACHE_STORAGE_VERSION = 1
+CACHE_SAVE_DELAY = 10  # seconds, coalesces writes of consecutive updates
+CACHE_MAX_AGE = 24 * 3600  # seconds, older cached warnings are not served
+
+# Avalanche region detail fetching
+AVALANCHE_DETAIL_CONCURRENCY = 6  # region detail requests in flight at once
+AVALANCHE_REFRESH_DEADLINE = 30  # seconds for a whole avalanche refresh
+AVALANCHE_SHARED_TTL = 600  # seconds the region summary and details are shared by all avalanche entries
+DATA_AVALANCHE_REGIONS = "avalanche_regions"
+AVALANCHE_REGION_MAX_AGE = 24 * 3600  # seconds before a region's county relevance is recomputed
+AVALANCHE_RELEVANCE_THRESHOLD = 0.1  # share of a region's municipalities that makes it relevant to a county
+
+# Alert area resolutions (degrees): coarse level of the shared nationwide index for point queries,
+# simplified level for map output
+ALERT_AREA_COARSE_TOLERANCE = 0.002
+ALERT_AREA_DISPLAY_TOLERANCE = 0.01
+
+# Boundary lookup grid (coordinates to county/municipality)
+BOUNDARY_GRID_CELL_SIZE = 5000.0  # metres, for projected (UTM) boundaries
+BOUNDARY_GRID_CELL_DEGREES = 0.05  # for longitude/latitude boundaries
+BOUNDARY_SOURCE_ARCHIVE = "Basisdata_0000_Norge_25833_Fylker_GeoJSON.zip"  # Kartverket counties, in municipalities/
+BOUNDARY_ASSET_FILE = "county_boundaries.bin"  # Preprocessed county boundaries, in data/
+BOUNDARY_ASSET_SCALE = 10_000_000  # int32 units per degree (about 1 cm)
+BOUNDARY_ASSET_CELL_DEGREES = 0.1  # grid cell size of the preprocessed boundaries
+BOUNDARY_DISPLAY_TOLERANCE = 500.0  # metres, simplification of county outlines for map output
+GEOJSON_STREAM_CHUNK_SIZE = 1 << 16  # characters read at a time when streaming boundary GeoJSON
+DATA_COUNTY_BOUNDARIES = "county_boundaries"
+
+# Adaptive refresh scheduling (minutes)
+REFRESH_INTERVAL_QUIET = 60  # no warnings above green
+REFRESH_INTERVAL_YELLOW = 30
+REFRESH_INTERVAL_ORANGE = 10
+REFRESH_INTERVAL_RED = 5
+REFRESH_RECENT_PUBLISH_WINDOW = 60  # after a publication, corrections and escalations are likely...
+REFRESH_RECENT_PUBLISH_INTERVAL = 15  # ...so poll at least this often
+REFRESH_PUBLISH_GRACE = 2  # poll this long after an announced NextWarningTime
+REFRESH_MIN_INTERVAL_DEFAULT = 5
+# Minimum minutes between polls per upstream host
+REFRESH_MIN_INTERVAL_PER_HOST = {
+    "api01.nve.no": 5,
+    "aa015h6buqvih86i1.api.met.no": 10,
+}
+
+# CAP conversion cache (shared by all sensors)
+CAP_CACHE_SIZE = 512  # converted alerts kept, least recently used are evicted
+
 # Warning types
 WARNING_TYPE_LANDSLIDE = "landslide"
 WARNING_TYPE_FLOOD = "flood"
@@ -0,0 +1,136 @@
+"""Municipality filtering for the Norway Alerts integration.
+
+The municipality filter of an entry is compiled once into normalized terms.
+Alerts are matched through a ``MunicipalityIndex`` (municipality -> alerts)
+that is built once per coordinator update and shared by the sensors, so the
+filter terms are only compared with each distinct municipality once instead
+of with every municipality of every alert.
+
+Names are normalized with Norwegian-aware case folding: Unicode NFC, casefold,
+and the common ASCII/German spellings ``aa``, ``ae``, ``oe``, ``ä`` and ``ö``
+mapped to ``å``, ``æ`` and ``ø``. "Baerum", "BÆRUM" and "Bærum" all match.
+Terms that are municipality numbers ("4601") match the municipality Id.
+
+A warning's ``MunicipalityCsvString`` can be parsed into an integer bitset:
+bit ``n`` is set for municipality number ``n``. A municipality number is the
+two digit county number followed by two digits, so the municipalities of
+county ``cc`` are bits ``cc * 100`` to ``cc * 100 + 99`` and the counties of a
+warning are read off the bitset in one pass.
+"""
+from __future__ import annotations
+
+import unicodedata
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Sequence, Tuple
+
+# Applied after casefold, longest spellings first
+_NORWEGIAN_SPELLINGS = (
+    ("aa", "å"),
+    ("ae", "æ"),
+    ("oe", "ø"),
+    ("ä", "æ"),
+    ("ö", "ø"),
+)
+
+
+def normalize_name(name: Any) -> str:
+    """Return a municipality name or filter term in comparable form."""
+    if not name:
+        return ""
+    text = unicodedata.normalize("NFC", str(name)).strip().casefold()
+    for spelling, letter in _NORWEGIAN_SPELLINGS:
+        if spelling in text:
+            text = text.replace(spelling, letter)
+    return text
+
+
+MUNICIPALITIES_PER_COUNTY = 100
+_COUNTY_BITS = (1 << MUNICIPALITIES_PER_COUNTY) - 1
+
+
+def municipality_mask(municipality_ids: Iterable[Any]) -> int:
+    """Return the bitset of the given municipality numbers (non-numeric Ids are ignored)."""
+    mask = 0
+    for municipality_id in municipality_ids:
+        text = str(municipality_id).strip()
+        if text.isdigit():
+            mask |= 1 << int(text)
+    return mask
+
+
+@lru_cache(maxsize=1024)
+def parse_municipality_csv(csv_string: str | None) -> int:
+    """Return the bitset of an NVE MunicipalityCsvString ("4601;4627;1133")."""
+    if not csv_string:
+        return 0
+    return municipality_mask(csv_string.split(";"))
+
+
+def mask_counties(mask: int) -> List[str]:
+    """Return the county numbers ("03", "46") with at least one municipality in the bitset."""
+    counties = []
+    county = 0
+    while mask:
+        if mask & _COUNTY_BITS:
+            counties.append(f"{county:02d}")
+        mask >>= MUNICIPALITIES_PER_COUNTY
+        county += 1
+    return counties
+
+
+def _area_key(area: Mapping[str, Any]) -> str:
+    """Return the index key of a municipality entry (its Id, or its name without one)."""
+    area_id = area.get("Id")
+    if area_id not in (None, ""):
+        return str(area_id)
+    return f"name:{normalize_name(area.get('Name'))}"
+
+
+class MunicipalityIndex:
+    """Inverted index from municipality to the positions of the alerts covering it."""
+
+    def __init__(self, alerts: Sequence[Mapping[str, Any]] | None):
+        """Build the index for a list of alerts."""
+        self.alerts = alerts or []
+        self.positions: Dict[str, List[int]] = {}
+        self.names: Dict[str, str] = {}  # key -> normalized name
+        for position, alert in enumerate(self.alerts):
+            for area in alert.get("MunicipalityList") or ():
+                key = _area_key(area)
+                positions = self.positions.get(key)
+                if positions is None:
+                    self.positions[key] = [position]
+                    self.names[key] = normalize_name(area.get("Name"))
+                elif positions[-1] != position:
+                    positions.append(position)
+
+
+class MunicipalityFilter:
+    """A compiled municipality filter ("Bergen, Voss, 4601")."""
+
+    def __init__(self, filter_string: str | None):
+        """Compile the comma separated filter string."""
+        terms = [term.strip() for term in (filter_string or "").split(",")]
+        self.ids: FrozenSet[str] = frozenset(term for term in terms if term.isdigit())
+        self.terms: Tuple[str, ...] = tuple(
+            dict.fromkeys(normalize_name(term) for term in terms if term and not term.isdigit())
+        )
+        self._resolved: Tuple[MunicipalityIndex | None, List[int]] = (None, [])
+
+    def __bool__(self) -> bool:
+        """Return True if the filter has any terms."""
+        return bool(self.ids or self.terms)
+
+    def matches(self, key: str, name: str) -> bool:
+        """Return True if a municipality (index key and normalized name) matches the filter."""
+        return key in self.ids or any(term in name for term in self.terms)
+
+    def select(self, index: MunicipalityIndex) -> List[Mapping[str, Any]]:
+        """Return the alerts of the index covering a matching municipality, in their original order."""
+        if self._resolved[0] is not index:
+            positions = set()
+            for key, name in index.names.items():
+                if self.matches(key, name):
+                    positions.update(index.positions[key])
+            self._resolved = (index, sorted(positions))
+        return [index.alerts[position] for position in self._resolved[1]]
@@ -0,0 +1,135 @@
+"""Incremental GeoJSON reading for the Norway Alerts integration.
+
+Kartverket boundary files are single JSON documents of several megabytes.
+``iter_features`` walks such a document from a text stream (a file or a
+member of a zip archive, decompressed on the fly) and decodes one feature at
+a time with ``json.JSONDecoder.raw_decode``. Only the current feature and a
+read buffer are held in memory, never the whole document.
+
+Both plain FeatureCollections and Kartverket's layout, where the collection
+is nested under the layer name (``{"Fylke": {"type": "FeatureCollection",
+...}}``), are understood.
+"""
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Dict, Iterator, TextIO
+
+from .const import GEOJSON_STREAM_CHUNK_SIZE
+
+_NON_WHITESPACE = re.compile(r"[^ \t\n\r]")
+
+
+class _JsonStream:
+    """A JSON text stream read in chunks, with the unread part kept in a buffer."""
+
+    def __init__(self, stream: TextIO, chunk_size: int):
+        """Wrap a text stream."""
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def _fill(self, size: int) -> bool:
+        """Read up to size more characters, dropping the consumed text. Returns False at end of stream."""
+        if self._eof:
+            return False
+        chunk = self._stream.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._position:] + chunk
+        self._position = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it ("" at end of stream)."""
+        while True:
+            match = _NON_WHITESPACE.search(self._buffer, self._position)
+            if match is not None:
+                self._position = match.start()
+                return self._buffer[self._position]
+            self._position = len(self._buffer)
+            if not self._fill(self._chunk_size):
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume the next character, which must be char."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Invalid GeoJSON: expected {char!r}, found {found!r}")
+        self._position += 1
+
+    def value(self) -> Any:
+        """Decode and consume the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError as err:
+                # Incomplete value: grow the buffer geometrically so long values are decoded in linear time
+                if not self._fill(max(self._chunk_size, len(self._buffer) - self._position)):
+                    raise ValueError(f"Invalid GeoJSON: {err}") from err
+                continue
+            if end == len(self._buffer) and not isinstance(value, (dict, list, str)) and self._fill(self._chunk_size):
+                continue  # A number or literal may continue in the next chunk
+            self._position = end
+            return value
+
+
+def _members(reader: _JsonStream) -> Iterator[str]:
+    """Yield the keys of the next JSON object; the caller consumes each value before resuming."""
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.expect("}")
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        yield key
+        if reader.peek() != ",":
+            reader.expect("}")
+            return
+        reader.expect(",")
+
+
+def _collection_features(reader: _JsonStream, header: Dict[str, Any], nested: bool) -> Iterator[Any]:
+    """Yield the features of the next object, a FeatureCollection or an object of them."""
+    for key in _members(reader):
+        if key == "features" and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.expect("]")
+                continue
+            while True:
+                yield reader.value()
+                if reader.peek() != ",":
+                    reader.expect("]")
+                    break
+                reader.expect(",")
+        elif not nested and key not in ("crs", "bbox", "properties") and reader.peek() == "{":
+            yield from _collection_features(reader, header, True)
+        else:
+            header.setdefault(key, reader.value())
+
+
+def iter_features(stream: TextIO, header: Dict[str, Any] | None = None,
+                  chunk_size: int = GEOJSON_STREAM_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Yield the features of a GeoJSON FeatureCollection one at a time.
+
+    Parameters:
+        stream: Text stream positioned at the start of the document
+        header: Optional dict that receives the other members of the
+            collection ("type", "crs", ...) as they are read. Members after
+            the features array are only present once iteration has finished.
+        chunk_size: Characters read from the stream at a time
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    reader = _JsonStream(stream, chunk_size)
+    yield from _collection_features(reader, header if header is not None else {}, False)
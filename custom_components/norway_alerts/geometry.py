@@ -0,0 +1,652 @@
+"""Geometry helpers for the Norway Alerts integration.
+
+Spatial queries against GeoJSON feature geometries (Met.no alert areas).
+Coordinates are GeoJSON ``[longitude, latitude]`` pairs and points are passed
+as ``(x, y) = (longitude, latitude)``.
+
+``PolygonIndex`` is built once per payload. The polygons are packed into flat
+``array('d')`` coordinates with ring and polygon offsets, and their bounding
+boxes into an STR (sort-tile-recursive) packed R-tree, so a point, bounding
+box or nearest-area query only runs the exact tests on the few polygons whose
+boxes qualify.
+
+Geometries are kept at several resolutions: the exact rings, an optional
+coarse Douglas-Peucker level that decides point queries away from the
+boundary, and display levels simplified for map output on request
+(``simplify_rings`` keeps shared borders identical between neighbours).
+"""
+from __future__ import annotations
+
+import heapq
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+Ring = Sequence[Sequence[float]]
+Polygon = Sequence[Ring]  # Outer ring followed by holes
+BBox = Tuple[float, float, float, float]  # min x, min y, max x, max y
+
+RTREE_NODE_SIZE = 8  # Children per R-tree node
+KM_PER_DEGREE_LAT = 110.574
+KM_PER_DEGREE_LON = 111.320  # At the equator, scaled by cos(latitude)
+
+
+def point_in_ring(x: float, y: float, ring: Ring) -> bool:
+    """Return True if the point is inside the ring (even-odd rule)."""
+    inside = False
+    count = len(ring)
+    if count < 3:
+        return False
+    x1, y1 = ring[count - 1][0], ring[count - 1][1]
+    for point in ring:
+        x2, y2 = point[0], point[1]
+        if (y2 > y) != (y1 > y) and x < (x1 - x2) * (y - y2) / (y1 - y2) + x2:
+            inside = not inside
+        x1, y1 = x2, y2
+    return inside
+
+
+def point_in_polygon(x: float, y: float, polygon: Polygon) -> bool:
+    """Return True if the point is inside the polygon's outer ring and outside its holes."""
+    if not polygon or not point_in_ring(x, y, polygon[0]):
+        return False
+    return not any(point_in_ring(x, y, hole) for hole in polygon[1:])
+
+
+def geometry_polygons(geometry: Mapping[str, Any] | None) -> List[Polygon]:
+    """Return the polygons of a GeoJSON Polygon, MultiPolygon or GeometryCollection."""
+    if not geometry:
+        return []
+    geometry_type = geometry.get("type")
+    if geometry_type == "Polygon":
+        return [geometry.get("coordinates") or []]
+    if geometry_type == "MultiPolygon":
+        return list(geometry.get("coordinates") or [])
+    if geometry_type == "GeometryCollection":
+        return [polygon for part in geometry.get("geometries") or [] for polygon in geometry_polygons(part)]
+    return []
+
+
+def ring_bbox(ring: Ring) -> BBox:
+    """Return the bounding box of a ring."""
+    xs = [point[0] for point in ring]
+    ys = [point[1] for point in ring]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _segment_hits_bbox(x1: float, y1: float, x2: float, y2: float, bbox: BBox) -> bool:
+    """Return True if the segment touches the bounding box (Liang-Barsky clipping)."""
+    min_x, min_y, max_x, max_y = bbox
+    dx, dy = x2 - x1, y2 - y1
+    low, high = 0.0, 1.0
+    for p, q in ((-dx, x1 - min_x), (dx, max_x - x1), (-dy, y1 - min_y), (dy, max_y - y1)):
+        if p == 0:
+            if q < 0:
+                return False
+            continue
+        t = q / p
+        if p < 0:
+            if t > high:
+                return False
+            low = max(low, t)
+        else:
+            if t < low:
+                return False
+            high = min(high, t)
+    return True
+
+
+def _segment_distance_sq(px: float, py: float, x1: float, y1: float, x2: float, y2: float) -> float:
+    """Return the squared distance from a point to a segment."""
+    dx, dy = x2 - x1, y2 - y1
+    length_sq = dx * dx + dy * dy
+    t = 0.0 if length_sq == 0 else max(0.0, min(1.0, ((px - x1) * dx + (py - y1) * dy) / length_sq))
+    ex, ey = x1 + t * dx - px, y1 + t * dy - py
+    return ex * ex + ey * ey
+
+
+def _str_order(boxes: Sequence[BBox], node_size: int) -> List[int]:
+    """Return the sort-tile-recursive order of the boxes (slices by x center, then y center)."""
+    count = len(boxes)
+    leaves = math.ceil(count / node_size)
+    slice_size = node_size * math.ceil(math.sqrt(leaves))
+    by_x = sorted(range(count), key=lambda i: boxes[i][0] + boxes[i][2])
+    order: List[int] = []
+    for start in range(0, count, slice_size):
+        order.extend(sorted(by_x[start:start + slice_size], key=lambda i: boxes[i][1] + boxes[i][3]))
+    return order
+
+
+def _union(boxes: Sequence[BBox]) -> BBox:
+    """Return the bounding box of the boxes."""
+    return (
+        min(box[0] for box in boxes),
+        min(box[1] for box in boxes),
+        max(box[2] for box in boxes),
+        max(box[3] for box in boxes),
+    )
+
+
+def simplify_line(points: Sequence[Sequence[float]], tolerance: float) -> List[Sequence[float]]:
+    """Return the Douglas-Peucker simplification of a polyline (both ends are kept).
+
+    Every removed vertex, and so the whole original line, lies within
+    tolerance of the simplified line.
+    """
+    count = len(points)
+    if count < 3 or tolerance <= 0:
+        return list(points)
+    keep = bytearray(count)
+    keep[0] = keep[count - 1] = 1
+    tolerance_sq = tolerance * tolerance
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        x1, y1 = points[first][0], points[first][1]
+        x2, y2 = points[last][0], points[last][1]
+        farthest, index = -1.0, -1
+        for i in range(first + 1, last):
+            distance = _segment_distance_sq(points[i][0], points[i][1], x1, y1, x2, y2)
+            if distance > farthest:
+                farthest, index = distance, i
+        if farthest > tolerance_sq:
+            keep[index] = 1
+            stack.append((first, index))
+            stack.append((index, last))
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+def simplify_rings(rings: Sequence[Ring], tolerance: float) -> List[List[Tuple[float, float]]]:
+    """Simplify closed rings without opening gaps or overlaps between them.
+
+    Rings are split into arcs at the vertices where the set of rings sharing a
+    vertex changes (junctions between neighbours). Each arc is simplified on
+    its own in a canonical direction, so a border shared by two rings is
+    simplified identically in both, and junctions never move. Rings are
+    returned closed; a ring that would collapse below three distinct vertices
+    is kept unsimplified.
+    """
+    open_rings = []
+    for ring in rings:
+        points = [(float(point[0]), float(point[1])) for point in ring]
+        if len(points) > 1 and points[0] == points[-1]:
+            points.pop()
+        open_rings.append(points)
+    sharing: Dict[Tuple[float, float], set] = {}
+    for index, points in enumerate(open_rings):
+        for point in points:
+            sharing.setdefault(point, set()).add(index)
+
+    simplified = []
+    for points in open_rings:
+        count = len(points)
+        if count < 4 or tolerance <= 0:
+            simplified.append(points + points[:1])
+            continue
+        keys = [frozenset(sharing[point]) for point in points]
+        fixed = [i for i in range(count) if keys[i] != keys[i - 1] or keys[i] != keys[(i + 1) % count]]
+        if len(fixed) < 2:
+            # No junctions: split the ring at a vertex and the vertex farthest from it
+            start = fixed[0] if fixed else 0
+            x0, y0 = points[start]
+            far = max(range(count), key=lambda i: (points[i][0] - x0) ** 2 + (points[i][1] - y0) ** 2)
+            fixed = sorted({start, far})
+        result: List[Tuple[float, float]] = []
+        for number, first in enumerate(fixed):
+            last = fixed[(number + 1) % len(fixed)]
+            arc = points[first:last + 1] if first < last else points[first:] + points[:last + 1]
+            reverse = arc[-1] < arc[0]
+            arc = simplify_line(arc[::-1] if reverse else arc, tolerance)
+            result.extend((arc[::-1] if reverse else arc)[:-1])
+        if len(set(result)) < 3:
+            result = points
+        simplified.append(result + result[:1])
+    return simplified
+
+
+class PolygonIndex:
+    """Packed polygons of a list of GeoJSON features with an STR R-tree over their bounding boxes.
+
+    Queries return feature positions (indexes into the list the index was
+    built from), each at most once.
+    """
+
+    def __init__(self, features: Sequence[Mapping[str, Any]], node_size: int = RTREE_NODE_SIZE,
+                 coarse_tolerance: float = 0.0):
+        """Pack and index the polygons of the features (features without area geometry are skipped).
+
+        With a coarse tolerance, a Douglas-Peucker simplified copy of every
+        polygon decides point queries farther than the tolerance from its
+        boundary, and only points closer than that test the exact rings.
+        """
+        self._node_size = node_size
+        self._coords = array("d")  # x0, y0, x1, y1, ... of all ring vertices
+        self._ring_starts = array("l", [0])  # Vertex offset of each ring, plus end sentinel
+        self._polygon_rings = array("l", [0])  # Ring offset of each polygon, plus end sentinel
+        self._polygon_features = array("l")  # Feature position of each polygon (non-decreasing)
+        self._coarse_tolerance = coarse_tolerance
+        self._coarse_coords = array("d")  # Simplified rings, same ring numbering as the exact ones
+        self._coarse_ring_starts = array("l", [0])
+        self._display: Dict[Tuple[int, float], Dict[str, Any]] = {}
+        boxes: List[BBox] = []
+        for position, feature in enumerate(features):
+            for polygon in geometry_polygons(feature.get("geometry")):
+                if not polygon or len(polygon[0]) < 3:
+                    continue
+                for ring in polygon:
+                    for point in ring:
+                        self._coords.append(float(point[0]))
+                        self._coords.append(float(point[1]))
+                    self._ring_starts.append(len(self._coords) // 2)
+                if coarse_tolerance > 0:
+                    for ring in simplify_rings(polygon, coarse_tolerance):
+                        for point in ring:
+                            self._coarse_coords.extend(point)
+                        self._coarse_ring_starts.append(len(self._coarse_coords) // 2)
+                self._polygon_rings.append(len(self._ring_starts) - 1)
+                self._polygon_features.append(position)
+                boxes.append(ring_bbox(polygon[0]))
+
+        # R-tree levels, leaves first. Level 0 holds the polygons in STR order;
+        # node i of a level covers entries i * node_size ... of the level below.
+        self._levels: List[Tuple[array, array]] = []  # (4 floats per entry, item id per entry)
+        items = list(range(len(boxes)))
+        while items:
+            order = _str_order(boxes, node_size)
+            boxes = [boxes[i] for i in order]
+            items = [items[i] for i in order]
+            self._levels.append((array("d", [value for box in boxes for value in box]), array("l", items)))
+            if len(boxes) <= 1:
+                break
+            boxes = [_union(boxes[start:start + node_size]) for start in range(0, len(boxes), node_size)]
+            items = list(range(len(boxes)))
+
+    def __len__(self) -> int:
+        """Return the number of indexed polygons."""
+        return len(self._polygon_features)
+
+    def _candidates(self, bbox: BBox) -> List[int]:
+        """Return the polygons whose bounding box intersects bbox."""
+        if not self._levels:
+            return []
+        min_x, min_y, max_x, max_y = bbox
+        found = []
+        node_size = self._node_size
+        top = len(self._levels) - 1
+        stack = [(top, entry) for entry in range(len(self._levels[top][1]))]
+        while stack:
+            level, entry = stack.pop()
+            boxes, items = self._levels[level]
+            offset = entry * 4
+            if boxes[offset] > max_x or boxes[offset + 2] < min_x or boxes[offset + 1] > max_y or boxes[offset + 3] < min_y:
+                continue
+            if level == 0:
+                found.append(items[entry])
+            else:
+                first = items[entry] * node_size
+                last = min(first + node_size, len(self._levels[level - 1][1]))
+                stack.extend((level - 1, child) for child in range(first, last))
+        return found
+
+    def _ring_contains(self, ring: int, x: float, y: float) -> bool:
+        """Return True if the point is inside a packed ring (even-odd rule)."""
+        coords = self._coords
+        start, end = self._ring_starts[ring] * 2, self._ring_starts[ring + 1] * 2
+        inside = False
+        x1, y1 = coords[end - 2], coords[end - 1]
+        for offset in range(start, end, 2):
+            x2, y2 = coords[offset], coords[offset + 1]
+            if (y2 > y) != (y1 > y) and x < (x1 - x2) * (y - y2) / (y1 - y2) + x2:
+                inside = not inside
+            x1, y1 = x2, y2
+        return inside
+
+    def _polygon_contains(self, polygon: int, x: float, y: float) -> bool:
+        """Return True if the point is inside a packed polygon (outer ring minus holes)."""
+        first, last = self._polygon_rings[polygon], self._polygon_rings[polygon + 1]
+        if not self._ring_contains(first, x, y):
+            return False
+        return not any(self._ring_contains(hole, x, y) for hole in range(first + 1, last))
+
+    def _coarse_contains(self, polygon: int, x: float, y: float) -> bool | None:
+        """Decide containment from the simplified polygon, or return None if the point is too close to tell."""
+        coords = self._coarse_coords
+        tolerance = self._coarse_tolerance
+        tolerance_sq = tolerance * tolerance
+        inside = False
+        for ring in range(self._polygon_rings[polygon], self._polygon_rings[polygon + 1]):
+            start, end = self._coarse_ring_starts[ring] * 2, self._coarse_ring_starts[ring + 1] * 2
+            x1, y1 = coords[end - 2], coords[end - 1]
+            for offset in range(start, end, 2):
+                x2, y2 = coords[offset], coords[offset + 1]
+                if (y2 > y) != (y1 > y) and x < (x1 - x2) * (y - y2) / (y1 - y2) + x2:
+                    inside = not inside
+                if (
+                    min(x1, x2) - tolerance <= x <= max(x1, x2) + tolerance
+                    and min(y1, y2) - tolerance <= y <= max(y1, y2) + tolerance
+                    and _segment_distance_sq(x, y, x1, y1, x2, y2) <= tolerance_sq
+                ):
+                    return None
+                x1, y1 = x2, y2
+        return inside
+
+    def contains(self, polygon: int, x: float, y: float) -> bool:
+        """Return True if the point is inside a polygon, using the coarse level when it can decide."""
+        if self._coarse_tolerance > 0:
+            inside = self._coarse_contains(polygon, x, y)
+            if inside is not None:
+                return inside
+        return self._polygon_contains(polygon, x, y)
+
+    def _edges(self, polygon: int):
+        """Yield the edges (x1, y1, x2, y2) of all rings of a packed polygon."""
+        coords = self._coords
+        for ring in range(self._polygon_rings[polygon], self._polygon_rings[polygon + 1]):
+            start, end = self._ring_starts[ring] * 2, self._ring_starts[ring + 1] * 2
+            x1, y1 = coords[end - 2], coords[end - 1]
+            for offset in range(start, end, 2):
+                x2, y2 = coords[offset], coords[offset + 1]
+                yield x1, y1, x2, y2
+                x1, y1 = x2, y2
+
+    def _features(self, polygons: Sequence[int]) -> List[int]:
+        """Return the distinct feature positions of the polygons, in feature order."""
+        return sorted({self._polygon_features[polygon] for polygon in polygons})
+
+    def features_at(self, x: float, y: float) -> List[int]:
+        """Return the positions of the features whose geometry contains the point."""
+        return self._features([polygon for polygon in self._candidates((x, y, x, y)) if self.contains(polygon, x, y)])
+
+    def features_in_bbox(self, bbox: BBox) -> List[int]:
+        """Return the positions of the features whose geometry intersects the bounding box."""
+        center_x, center_y = (bbox[0] + bbox[2]) / 2, (bbox[1] + bbox[3]) / 2
+        return self._features([
+            polygon for polygon in self._candidates(bbox)
+            if any(_segment_hits_bbox(*edge, bbox) for edge in self._edges(polygon))
+            or self._polygon_contains(polygon, center_x, center_y)  # Box inside the polygon
+        ])
+
+    def display_geometry(self, position: int, tolerance: float) -> Dict[str, Any] | None:
+        """Return a feature's area simplified for map output, as a GeoJSON MultiPolygon (cached)."""
+        key = (position, tolerance)
+        if key not in self._display:
+            first = bisect_left(self._polygon_features, position)
+            last = bisect_right(self._polygon_features, position)
+            if first == last:
+                return None
+            polygons = []
+            for polygon in range(first, last):
+                rings = [
+                    [
+                        (self._coords[offset], self._coords[offset + 1])
+                        for offset in range(self._ring_starts[ring] * 2, self._ring_starts[ring + 1] * 2, 2)
+                    ]
+                    for ring in range(self._polygon_rings[polygon], self._polygon_rings[polygon + 1])
+                ]
+                polygons.append([[list(point) for point in ring] for ring in simplify_rings(rings, tolerance)])
+            self._display[key] = {"type": "MultiPolygon", "coordinates": polygons}
+        return self._display[key]
+
+    def nearest(self, x: float, y: float) -> Tuple[int, float] | None:
+        """Return the position of the feature closest to the point and the distance in km.
+
+        The distance is 0 inside an area. Degrees are converted to kilometres
+        with an equirectangular approximation around the point, which is
+        accurate to well under a percent at alert-area distances.
+        """
+        if not self._levels:
+            return None
+        scale_x = KM_PER_DEGREE_LON * math.cos(math.radians(y))
+        scale_y = KM_PER_DEGREE_LAT
+
+        def box_distance(boxes: array, entry: int) -> float:
+            offset = entry * 4
+            dx = max(boxes[offset] - x, 0.0, x - boxes[offset + 2]) * scale_x
+            dy = max(boxes[offset + 1] - y, 0.0, y - boxes[offset + 3]) * scale_y
+            return math.hypot(dx, dy)
+
+        node_size = self._node_size
+        top = len(self._levels) - 1
+        heap: List[Tuple[float, int, int, int]] = []  # (lower bound, kind, level, entry); kind 0 = exact
+        for entry in range(len(self._levels[top][1])):
+            heapq.heappush(heap, (box_distance(self._levels[top][0], entry), 1, top, entry))
+        while heap:
+            distance, kind, level, entry = heapq.heappop(heap)
+            if kind == 0:
+                return self._polygon_features[entry], distance
+            boxes, items = self._levels[level]
+            if level == 0:
+                polygon = items[entry]
+                heapq.heappush(heap, (self._polygon_distance(polygon, x, y, scale_x, scale_y), 0, 0, polygon))
+                continue
+            first = items[entry] * node_size
+            below = self._levels[level - 1][0]
+            for child in range(first, min(first + node_size, len(self._levels[level - 1][1]))):
+                heapq.heappush(heap, (box_distance(below, child), 1, level - 1, child))
+        return None
+
+    def _polygon_distance(self, polygon: int, x: float, y: float, scale_x: float, scale_y: float) -> float:
+        """Return the distance in km from the point to a packed polygon (0 inside)."""
+        if self._polygon_contains(polygon, x, y):
+            return 0.0
+        best = min(
+            _segment_distance_sq(0.0, 0.0, (x1 - x) * scale_x, (y1 - y) * scale_y, (x2 - x) * scale_x, (y2 - y) * scale_y)
+            for x1, y1, x2, y2 in self._edges(polygon)
+        )
+        return math.sqrt(best)
+
+
+def _side(ax: float, ay: float, bx: float, by: float, px: float, py: float) -> float:
+    """Return the cross product telling on which side of the line a -> b the point p lies."""
+    return (bx - ax) * (py - ay) - (by - ay) * (px - ax)
+
+
+def append_area(coords: array, ring_starts: array, area_rings: array, rings: Sequence[Ring]) -> None:
+    """Append the rings of one area to packed arrays (see ``pack_areas``)."""
+    for ring in rings:
+        if len(ring) < 3:
+            continue
+        for point in ring:
+            coords.append(float(point[0]))
+            coords.append(float(point[1]))
+        if ring[0][0] != ring[-1][0] or ring[0][1] != ring[-1][1]:
+            coords.append(float(ring[0][0]))
+            coords.append(float(ring[0][1]))
+        ring_starts.append(len(coords) // 2)
+    area_rings.append(len(ring_starts) - 1)
+
+
+def pack_areas(areas: Sequence[Sequence[Ring]]) -> Tuple[array, array, array]:
+    """Pack the rings of areas into flat arrays.
+
+    Returns ``(coords, ring_starts, area_rings)``: x, y of all vertices with
+    every ring closed (last vertex equal to the first), the vertex offset of
+    each ring and the ring offset of each area, both with an end sentinel.
+    Rings with fewer than three vertices are dropped.
+    """
+    coords = array("d")
+    ring_starts = array("l", [0])
+    area_rings = array("l", [0])
+    for rings in areas:
+        append_area(coords, ring_starts, area_rings, rings)
+    return coords, ring_starts, area_rings
+
+
+class BoundaryGrid:
+    """Constant-time point lookup over non-overlapping areas (counties, municipalities).
+
+    The extent of the areas is divided into square cells. Every cell knows the
+    area containing its center and, for cells crossed by area boundaries, the
+    boundary edges inside the cell. A point in a cell without edges belongs to
+    the cell's area; otherwise only the edges crossed by the segment from the
+    point to the cell center are counted, starting from the center's known
+    side. Work per lookup is bounded by the edges in one cell, however large
+    the areas are.
+
+    All state is kept in flat integer/float buffers (``buffers()``): the packed
+    vertex coordinates, the area of each cell center, and per cell the areas
+    whose boundary crosses it with their edges as runs of consecutive vertices.
+    ``from_buffers()`` wraps the same buffers read from a file (for example
+    memoryviews of an mmap) without copying them.
+    """
+
+    def __init__(self, coords: Sequence[float], ring_starts: Sequence[int], area_rings: Sequence[int],
+                 cell_size: float):
+        """Build the grid over packed areas (see ``pack_areas``), in the coordinates' units."""
+        self._coords = coords
+        self.cell_size = cell_size
+        self._origin = (0.0, 0.0)
+        self._cols = self._rows = 0
+        vertices = len(coords) // 2
+        if vertices:
+            xs, ys = coords[0::2], coords[1::2]
+            self._origin = (float(min(xs)), float(min(ys)))
+            self._cols = int((max(xs) - self._origin[0]) // cell_size) + 1
+            self._rows = int((max(ys) - self._origin[1]) // cell_size) + 1
+        self._owners = array("l", [-1]) * (self._cols * self._rows)  # Area containing each cell center
+        cell_edges: Dict[int, Dict[int, List[int]]] = {}  # cell -> area -> first vertex of each edge
+        for area in range(len(area_rings) - 1):
+            crossings: Dict[int, List[float]] = {}  # row -> x where the row's center line crosses the boundary
+            for ring in range(area_rings[area], area_rings[area + 1]):
+                for vertex in range(ring_starts[ring], ring_starts[ring + 1] - 1):
+                    x1, y1 = coords[2 * vertex], coords[2 * vertex + 1]
+                    x2, y2 = coords[2 * vertex + 2], coords[2 * vertex + 3]
+                    self._add_edge(cell_edges, area, vertex, x1, y1, x2, y2)
+                    self._add_crossings(crossings, x1, y1, x2, y2)
+            self._fill_rows(area, crossings)
+
+        # Per cell (in cell order) its entries, per entry its area and runs of (first vertex, edge count)
+        self._cell_starts = array("l", [0])
+        self._entry_areas = array("l")
+        self._entry_starts = array("l", [0])
+        self._runs = array("l")
+        for cell in range(self._cols * self._rows):
+            for area, vertices in sorted(cell_edges.get(cell, {}).items()):
+                self._entry_areas.append(area)
+                run_start = previous = vertices[0]
+                for vertex in vertices[1:]:
+                    if vertex != previous + 1:
+                        self._runs.extend((run_start, previous - run_start + 1))
+                        run_start = vertex
+                    previous = vertex
+                self._runs.extend((run_start, previous - run_start + 1))
+                self._entry_starts.append(len(self._runs) // 2)
+            self._cell_starts.append(len(self._entry_areas))
+
+    @classmethod
+    def from_areas(cls, areas: Sequence[Sequence[Ring]], cell_size: float) -> "BoundaryGrid":
+        """Build the grid from areas given as lists of rings (outer rings and holes alike)."""
+        coords, ring_starts, area_rings = pack_areas(areas)
+        return cls(coords, ring_starts, area_rings, cell_size)
+
+    @classmethod
+    def from_buffers(cls, coords: Sequence[float], origin: Tuple[float, float], cell_size: float, cols: int,
+                     rows: int, owners: Sequence[int], cell_starts: Sequence[int], entry_areas: Sequence[int],
+                     entry_starts: Sequence[int], runs: Sequence[int]) -> "BoundaryGrid":
+        """Wrap previously built buffers (see ``buffers()``) without copying them."""
+        grid = cls.__new__(cls)
+        grid._coords = coords
+        grid._origin = origin
+        grid.cell_size = cell_size
+        grid._cols, grid._rows = cols, rows
+        grid._owners = owners
+        grid._cell_starts = cell_starts
+        grid._entry_areas = entry_areas
+        grid._entry_starts = entry_starts
+        grid._runs = runs
+        return grid
+
+    def buffers(self) -> Dict[str, Any]:
+        """Return the grid's state as ``from_buffers()`` keyword arguments."""
+        return {
+            "coords": self._coords,
+            "origin": self._origin,
+            "cell_size": self.cell_size,
+            "cols": self._cols,
+            "rows": self._rows,
+            "owners": self._owners,
+            "cell_starts": self._cell_starts,
+            "entry_areas": self._entry_areas,
+            "entry_starts": self._entry_starts,
+            "runs": self._runs,
+        }
+
+    def _cell_range(self, low: float, high: float, origin: float, count: int) -> range:
+        """Return the cell indexes along one axis overlapped by [low, high]."""
+        first = max(int((low - origin) // self.cell_size), 0)
+        last = min(int((high - origin) // self.cell_size), count - 1)
+        return range(first, last + 1)
+
+    def _add_edge(self, cell_edges: Dict[int, Dict[int, List[int]]], area: int, vertex: int,
+                  x1: float, y1: float, x2: float, y2: float) -> None:
+        """Add an edge (by its first vertex) to every cell it passes through."""
+        size = self.cell_size
+        origin_x, origin_y = self._origin
+        cols = self._cell_range(min(x1, x2), max(x1, x2), origin_x, self._cols)
+        rows = self._cell_range(min(y1, y2), max(y1, y2), origin_y, self._rows)
+        # An edge within one row or column passes through all of its cells
+        check = len(cols) > 1 and len(rows) > 1
+        for row in rows:
+            for col in cols:
+                cell_x, cell_y = origin_x + col * size, origin_y + row * size
+                if check and not _segment_hits_bbox(x1, y1, x2, y2, (cell_x, cell_y, cell_x + size, cell_y + size)):
+                    continue
+                cell_edges.setdefault(row * self._cols + col, {}).setdefault(area, []).append(vertex)
+
+    def _add_crossings(self, crossings: Dict[int, List[float]], x1: float, y1: float, x2: float, y2: float) -> None:
+        """Record where the edge crosses the center lines of the cell rows."""
+        size = self.cell_size
+        origin_y = self._origin[1]
+        low, high = min(y1, y2), max(y1, y2)
+        # Rows whose center line y satisfies low < y <= high (half-open, so shared vertices count once)
+        first = max(math.floor((low - origin_y) / size - 0.5) + 1, 0)
+        last = min(math.floor((high - origin_y) / size - 0.5), self._rows - 1)
+        for row in range(first, last + 1):
+            center_y = origin_y + (row + 0.5) * size
+            if low < center_y <= high:
+                crossings.setdefault(row, []).append(x1 + (center_y - y1) * (x2 - x1) / (y2 - y1))
+
+    def _fill_rows(self, area: int, crossings: Dict[int, List[float]]) -> None:
+        """Mark the cells whose center lies inside the area (even-odd spans along each row)."""
+        size = self.cell_size
+        origin_x = self._origin[0]
+        for row, xs in crossings.items():
+            xs.sort()
+            for start, end in zip(xs[::2], xs[1::2]):
+                first = max(math.ceil((start - origin_x) / size - 0.5), 0)
+                last = min(math.floor((end - origin_x) / size - 0.5), self._cols - 1)
+                for col in range(first, last + 1):
+                    self._owners[row * self._cols + col] = area
+
+    def area_at(self, x: float, y: float) -> int | None:
+        """Return the position of the area containing the point, or None."""
+        origin_x, origin_y = self._origin
+        col = math.floor((x - origin_x) / self.cell_size)
+        row = math.floor((y - origin_y) / self.cell_size)
+        if not (0 <= col < self._cols and 0 <= row < self._rows):
+            return None
+        cell = row * self._cols + col
+        owner = self._owners[cell]
+        first_entry, last_entry = self._cell_starts[cell], self._cell_starts[cell + 1]
+        if first_entry == last_entry:
+            return owner if owner >= 0 else None
+        center_x = origin_x + (col + 0.5) * self.cell_size
+        center_y = origin_y + (row + 0.5) * self.cell_size
+        coords, runs = self._coords, self._runs
+        owner_has_edges = False
+        for entry in range(first_entry, last_entry):
+            area = self._entry_areas[entry]
+            inside = area == owner
+            owner_has_edges = owner_has_edges or inside
+            for run in range(self._entry_starts[entry], self._entry_starts[entry + 1]):
+                vertex, count = runs[2 * run], runs[2 * run + 1]
+                for offset in range(2 * vertex, 2 * (vertex + count), 2):
+                    x1, y1, x2, y2 = coords[offset], coords[offset + 1], coords[offset + 2], coords[offset + 3]
+                    # The edge crosses the point -> center segment; endpoints on the line count on one side only
+                    if (_side(x, y, center_x, center_y, x1, y1) > 0) != (_side(x, y, center_x, center_y, x2, y2) > 0) \
+                            and (_side(x1, y1, x2, y2, x, y) > 0) != (_side(x1, y1, x2, y2, center_x, center_y) > 0):
+                        inside = not inside
+            if inside:
+                return area
+        return owner if owner >= 0 and not owner_has_edges else None
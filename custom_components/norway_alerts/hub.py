@@ -0,0 +1,136 @@
+"""Cross-entry request coalescing for the Norway Alerts integration.
+
+Several config entries often poll the exact same upstream URL (for example a
+county entry with and without a municipality filter). The fetch hub keyed by
+normalized URL makes sure such requests reach the upstream API only once:
+concurrent callers share one in-flight request (single-flight) and callers
+arriving shortly after get the cached, already parsed payload.
+
+The shared request runs in a task owned by the hub. A caller that is
+cancelled (for example by its refresh deadline) only stops waiting; the
+request carries on for the other callers and its result is still cached.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, DATA_FETCH_HUB, FETCH_HUB_TTL
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SharedFetchCancelled(Exception):
+    """The hub's shared request was cancelled before it completed."""
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL so equivalent requests share one hub key.
+
+    Scheme and host are lower-cased, trailing slashes are dropped and query
+    parameters are sorted.
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+class FetchHub:
+    """Single-flight fetcher with a short TTL cache, shared by all entries."""
+
+    def __init__(self, ttl: float = FETCH_HUB_TTL):
+        self._ttl = ttl
+        self._cache: Dict[str, Tuple[float, Any]] = {}  # key -> (expires at, payload)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._stats = {"upstream_requests": 0, "cache_hits": 0, "coalesced": 0}
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of the hub counters."""
+        return dict(self._stats)
+
+    async def async_fetch(
+        self, url: str, fetcher: Callable[[], Awaitable[Any]], variant: str | None = None,
+        ttl: float | None = None,
+    ) -> Any:
+        """Return the payload for url, calling fetcher at most once per TTL.
+
+        variant distinguishes derived payloads of the same URL (for example a
+        response partitioned per county). ttl overrides the hub's TTL for
+        this payload (seconds). Only successful results are cached;
+        if the fetcher raises, every caller waiting on that request gets the
+        same exception.
+        """
+        key = normalize_url(url)
+        if variant:
+            key = f"{key}#{variant}"
+
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            self._stats["cache_hits"] += 1
+            return cached[1]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._stats["coalesced"] += 1
+            _LOGGER.debug("Joining in-flight request for %s", key)
+        else:
+            self._stats["upstream_requests"] += 1
+            inflight = self._inflight[key] = asyncio.get_running_loop().create_task(
+                self._run(key, fetcher, self._ttl if ttl is None else ttl)
+            )
+            inflight.add_done_callback(_retrieve_exception)
+        # Cancelling a caller detaches it from the shared request without cancelling the request
+        return await asyncio.shield(inflight)
+
+    async def _run(self, key: str, fetcher: Callable[[], Awaitable[Any]], ttl: float) -> Any:
+        """Run the shared request and cache its result."""
+        try:
+            payload = await fetcher()
+        except asyncio.CancelledError:
+            # Callers still waiting get an error instead of being cancelled themselves
+            raise SharedFetchCancelled(f"Shared request for {key} was cancelled") from None
+        else:
+            self._store(key, payload, ttl)
+            return payload
+        finally:
+            self._inflight.pop(key, None)
+
+    def _store(self, key: str, payload: Any, ttl: float) -> None:
+        """Cache a payload for ttl seconds and drop expired entries."""
+        now = time.monotonic()
+        expired = [k for k, (expires, _) in self._cache.items() if expires <= now]
+        for expired_key in expired:
+            del self._cache[expired_key]
+        self._cache[key] = (now + ttl, payload)
+
+    def invalidate(self, url: str | None = None) -> None:
+        """Drop the cached payloads for url, including every variant, or the whole cache."""
+        if url is None:
+            self._cache.clear()
+            return
+        key = normalize_url(url)
+        for cached_key in [k for k in self._cache if k == key or k.startswith(f"{key}#")]:
+            del self._cache[cached_key]
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    """Mark a shared request's exception as retrieved in case every caller detached."""
+    if not task.cancelled():
+        task.exception()
+
+
+@callback
+def async_get_fetch_hub(hass: HomeAssistant) -> FetchHub:
+    """Return the shared fetch hub, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    hub = domain_data.get(DATA_FETCH_HUB)
+    if hub is None:
+        hub = domain_data[DATA_FETCH_HUB] = FetchHub()
+    return hub
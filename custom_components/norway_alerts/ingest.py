@@ -0,0 +1,95 @@
+"""Response ingestion for the Norway Alerts integration.
+
+Response bodies are decoded from bytes with Home Assistant's fast JSON parser.
+Large bodies (NVE county lists easily reach several hundred kilobytes) are
+decoded in the executor so the event loop is not blocked. NVE warning lists
+are projected down to the fields the integration actually uses, which keeps
+``coordinator.data`` small.
+"""
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from typing import Any, Callable, Dict, List
+
+from homeassistant.util.json import json_loads
+
+from .const import JSON_EXECUTOR_THRESHOLD
+
+# Top level fields of an NVE landslide/flood warning that are read by the
+# API clients, the scheduler, the CAP conversion and the sensor attributes.
+NVE_WARNING_FIELDS = frozenset({
+    "Id",
+    "MasterId",
+    "Version",
+    "LangKey",
+    "ActivityLevel",
+    "DangerLevel",
+    "DangerTypeName",
+    "MainText",
+    "WarningText",
+    "AdviceText",
+    "ConsequenceText",
+    "EmergencyWarning",
+    "ValidFrom",
+    "ValidTo",
+    "PublishTime",
+    "NextWarningTime",
+    "DangerIncreaseDateTime",
+    "DangerDecreaseDateTime",
+    "CountyList",
+    "MunicipalityList",
+    "MunicipalityCsvString",
+    "MunicipalityName",
+    "RegionName",
+    "Author",
+})
+NVE_COUNTY_FIELDS = ("Id", "Name")
+NVE_MUNICIPALITY_FIELDS = ("Id", "Name", "CountyId", "CountyName")
+
+
+def _project_items(items: Any, fields: tuple) -> List[Dict[str, Any]]:
+    """Keep only the given fields of each dict in a nested list."""
+    if not isinstance(items, list):
+        return []
+    return [
+        {field: item[field] for field in fields if field in item}
+        for item in items
+        if isinstance(item, dict)
+    ]
+
+
+def project_nve_warnings(payload: Any) -> Any:
+    """Drop unused fields (station lists, micro blog posts, images, ...) from an NVE warning list."""
+    if not isinstance(payload, list):
+        return payload
+    projected = []
+    for warning in payload:
+        if not isinstance(warning, dict):
+            continue
+        slim = {key: value for key, value in warning.items() if key in NVE_WARNING_FIELDS}
+        if "CountyList" in slim:
+            slim["CountyList"] = _project_items(slim["CountyList"], NVE_COUNTY_FIELDS)
+        if "MunicipalityList" in slim:
+            slim["MunicipalityList"] = _project_items(slim["MunicipalityList"], NVE_MUNICIPALITY_FIELDS)
+        projected.append(slim)
+    return projected
+
+
+def decode_json(body: bytes, projection: Callable[[Any], Any] | None = None) -> Any:
+    """Decode a JSON body and apply the optional projection."""
+    payload = json_loads(body)
+    return projection(payload) if projection is not None else payload
+
+
+async def async_decode_json(
+    body: bytes,
+    projection: Callable[[Any], Any] | None = None,
+    threshold: int = JSON_EXECUTOR_THRESHOLD,
+) -> Any:
+    """Decode a JSON body, in the executor if it is larger than threshold bytes."""
+    if len(body) < threshold:
+        return decode_json(body, projection)
+    return await asyncio.get_running_loop().run_in_executor(
+        None, partial(decode_json, body, projection)
+    )
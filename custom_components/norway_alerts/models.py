@@ -0,0 +1,205 @@
+"""Alert model for the Norway Alerts integration.
+
+Every API client converts its upstream payload once, at ingestion, into
+``Alert`` records with one shape for NVE and Met.no warnings. Fields that all
+sources share live in ``__slots__``; source specific fields (avalanche
+problems, Met.no awareness levels, ...) are kept in ``details``. Strings are
+interned, so the texts and names repeated across the many per-municipality
+rows of an NVE warning are stored once, and municipality/county entries are
+shared ``Area`` records.
+
+Both classes are read-only mappings using the upstream key names (``"Id"``,
+``"ActivityLevel"``, ``"MunicipalityList"``, ...), so code written against the
+original dicts keeps working. ``as_dict``/``from_mapping`` convert to and from
+plain dicts, e.g. for the persistent cache.
+"""
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings, return other values unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
+class Area(Mapping):
+    """A municipality or county entry of an alert (``Id``, ``Name``, ``CountyId``, ``CountyName``)."""
+
+    __slots__ = ("id", "name", "county_id", "county_name")
+
+    _KEYS = {"Id": "id", "Name": "name", "CountyId": "county_id", "CountyName": "county_name"}
+
+    def __init__(self, id: Any = None, name: str | None = None,
+                 county_id: Any = None, county_name: str | None = None):
+        self.id = _intern(id)
+        self.name = _intern(name)
+        self.county_id = _intern(county_id)
+        self.county_name = _intern(county_name)
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> "Area":
+        """Return the shared Area for an upstream municipality/county dict."""
+        key = (data.get("Id"), data.get("Name"), data.get("CountyId"), data.get("CountyName"))
+        area = _SHARED_AREAS.get(key)
+        if area is None:
+            if len(_SHARED_AREAS) >= _SHARED_AREAS_MAX:
+                _SHARED_AREAS.clear()
+            area = _SHARED_AREAS[key] = cls(*key)
+        return area
+
+    def __getitem__(self, key: str) -> Any:
+        attr = self._KEYS.get(key)
+        value = getattr(self, attr) if attr is not None else None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key, attr in self._KEYS.items() if getattr(self, attr) is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"Area({dict(self)!r})"
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the entry as a plain dict."""
+        return dict(self)
+
+
+# Areas are immutable, so identical municipality/county entries are shared
+_SHARED_AREAS: Dict[Tuple[Any, Any, Any, Any], Area] = {}
+_SHARED_AREAS_MAX = 4096
+
+
+def _areas(items: Any) -> Tuple[Area, ...]:
+    """Convert an upstream municipality/county list to shared Areas."""
+    if not items:
+        return ()
+    return tuple(Area.from_mapping(item) for item in items if isinstance(item, Mapping))
+
+
+class Alert(Mapping):
+    """A warning from any source, in one compact shape."""
+
+    __slots__ = (
+        "id",
+        "master_id",
+        "version",
+        "warning_type",
+        "activity_level",
+        "danger_type",
+        "main_text",
+        "region_name",
+        "valid_from",
+        "valid_to",
+        "publish_time",
+        "next_warning_time",
+        "counties",
+        "municipalities",
+        "municipality_csv",
+        "details",
+    )
+
+    # Upstream key -> slot
+    _KEYS = {
+        "Id": "id",
+        "MasterId": "master_id",
+        "Version": "version",
+        "_warning_type": "warning_type",
+        "ActivityLevel": "activity_level",
+        "DangerTypeName": "danger_type",
+        "MainText": "main_text",
+        "RegionName": "region_name",
+        "ValidFrom": "valid_from",
+        "ValidTo": "valid_to",
+        "PublishTime": "publish_time",
+        "NextWarningTime": "next_warning_time",
+        "CountyList": "counties",
+        "MunicipalityList": "municipalities",
+        "MunicipalityCsvString": "municipality_csv",
+    }
+
+    def __init__(self, details: Dict[str, Any] | None = None, **fields: Any):
+        for attr in self.__slots__[:-1]:
+            setattr(self, attr, fields.pop(attr, None))
+        if fields:
+            raise TypeError(f"Unknown alert fields: {', '.join(fields)}")
+        self.details = details or {}
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any], warning_type: str | None = None) -> "Alert":
+        """Build an alert from an upstream (or previously converted) warning dict."""
+        if isinstance(data, Alert):
+            return data
+        fields: Dict[str, Any] = {}
+        details: Dict[str, Any] = {}
+        for key, value in data.items():
+            attr = cls._KEYS.get(key)
+            if attr is None:
+                details[_intern(key)] = _intern(value)
+            elif attr in ("counties", "municipalities"):
+                fields[attr] = _areas(value)
+            else:
+                fields[attr] = _intern(value)
+        if warning_type is not None:
+            fields["warning_type"] = sys.intern(warning_type)
+        return cls(details=details, **fields)
+
+    def __getitem__(self, key: str) -> Any:
+        attr = self._KEYS.get(key)
+        if attr is None:
+            return self.details[key]
+        value = getattr(self, attr)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        attr = self._KEYS.get(key)
+        if attr is None:
+            return key in self.details
+        return getattr(self, attr) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for key, attr in self._KEYS.items():
+            if getattr(self, attr) is not None:
+                yield key
+        yield from self.details
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, attr) for attr in self.__slots__)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Alert):
+            return self._values() == other._values()
+        if isinstance(other, Mapping):
+            return self.as_dict() == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Alert(id={self.id!r}, type={self.warning_type!r}, level={self.activity_level!r})"
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the alert as a plain dict with the upstream key names."""
+        result: Dict[str, Any] = {}
+        for key in self:
+            value = self[key]
+            if key in ("CountyList", "MunicipalityList"):
+                value = [area.as_dict() for area in value]
+            result[key] = value
+        return result
+
+
+def alerts_from_mappings(items: Iterable[Mapping[str, Any]], warning_type: str | None = None) -> list:
+    """Convert a list of warning dicts to alerts."""
+    return [Alert.from_mapping(item, warning_type) for item in items]
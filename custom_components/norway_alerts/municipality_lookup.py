@@ -1,8 +1,40 @@
 """Municipality lookup helper for Norway Alerts integration."""
+from __future__ import annotations
+
 import logging
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
+
+from homeassistant.core import HomeAssistant
+
+from .boundary_asset import (
+    BoundaryAsset,
+    async_build_boundary_asset,
+    boundary_asset_outdated,
+    ensure_boundary_asset,
+    read_boundary_areas,
+)
+from .const import (
+    DOMAIN,
+    DATA_COUNTY_BOUNDARIES,
+    BOUNDARY_GRID_CELL_SIZE,
+    BOUNDARY_GRID_CELL_DEGREES,
+    BOUNDARY_SOURCE_ARCHIVE,
+    BOUNDARY_ASSET_FILE,
+    BOUNDARY_DISPLAY_TOLERANCE,
+)
+from .geometry import BoundaryGrid, simplify_rings
+from .projection import TransverseMercator
 
 _LOGGER = logging.getLogger(__name__)
 
+# The asset ships with the integration; the Kartverket archive only exists in a repository checkout
+DEFAULT_BOUNDARY_ASSET = os.path.join(os.path.dirname(__file__), "data", BOUNDARY_ASSET_FILE)
+DEFAULT_BOUNDARY_SOURCE = os.path.join(
+    os.path.dirname(__file__), os.pardir, os.pardir, "municipalities", BOUNDARY_SOURCE_ARCHIVE
+)
+
 # Basic municipality lookup by approximate coordinates
 # This is a simple implementation - can be enhanced with GeoJSON boundaries
 MUNICIPALITY_LOOKUP = {
@@ -48,6 +80,9 @@ MUNICIPALITY_LOOKUP = {
     "Årdal": {"lat_range": (61.1, 61.4), "lon_range": (7.5, 7.9), "county": "46"},
 }
 
+# Counties the approximate table covers; elsewhere no municipality can be suggested from coordinates
+MUNICIPALITY_LOOKUP_COUNTIES = frozenset(data["county"] for data in MUNICIPALITY_LOOKUP.values())
+
 
 def get_municipality_from_coordinates(latitude: float, longitude: float) -> tuple[str, str] | None:
     """
@@ -55,69 +90,229 @@ def get_municipality_from_coordinates(latitude: float, longitude: float) -> tupl
     
     Returns tuple of (municipality_name, county_id) or None if not found.
     
-    This is a basic implementation using bounding boxes.
-    For more accuracy, use GeoJSON polygon intersection.
+    This is a basic implementation using bounding boxes (Vestland only). When
+    several boxes contain the point, the smallest (most specific) one wins;
+    the county administration entry is never returned. For exact results use
+    the boundary lookup below.
     """
     _LOGGER.debug("Looking up municipality for coordinates: %s, %s", latitude, longitude)
     
     matches = []
     for municipality, data in MUNICIPALITY_LOOKUP.items():
+        if municipality.endswith("fylkeskommune"):
+            continue  # County administration, not a municipality
         lat_min, lat_max = data["lat_range"]
         lon_min, lon_max = data["lon_range"]
         
         if lat_min <= latitude <= lat_max and lon_min <= longitude <= lon_max:
-            matches.append((municipality, data["county"]))
+            matches.append(((lat_max - lat_min) * (lon_max - lon_min), municipality, data["county"]))
             _LOGGER.debug("Found match: %s (county %s)", municipality, data["county"])
     
     if not matches:
-        _LOGGER.warning("No municipality found for coordinates: %s, %s", latitude, longitude)
+        _LOGGER.debug("No municipality found for coordinates: %s, %s", latitude, longitude)
         return None
     
     if len(matches) > 1:
-        _LOGGER.warning("Multiple municipalities found for coordinates: %s, %s - using first match", latitude, longitude)
+        _LOGGER.debug("Multiple municipalities found for coordinates: %s, %s - using the smallest", latitude, longitude)
+    
+    _, municipality, county_id = min(matches)
+    return municipality, county_id
+
+
+class AreaBoundaries:
+    """Administrative areas indexed for point lookups.
+    
+    Points are converted into the grid's coordinates - projected (UTM 33 for
+    Kartverket GeoJSON) or scaled (quantized longitude/latitude of the
+    boundary asset) - and looked up in a ``BoundaryGrid``, so a lookup costs
+    the same whatever the size of the boundary polygons.
     
-    return matches[0]
+    With the packed rings, simplified outlines are available for map output.
+    All areas are simplified together, so neighbouring counties keep a common
+    border.
+    """
+    
+    def __init__(self, names: Sequence[str], county_ids: Sequence[str], grid: BoundaryGrid,
+                 projection: TransverseMercator | None = None, scale: float = 1.0,
+                 rings: Tuple[Sequence[float], Sequence[int], Sequence[int]] | None = None):
+        """Wrap a grid whose area positions index names and county_ids.
+        
+        rings is the (coords, ring_starts, area_rings) packing of the areas in
+        grid coordinates, as returned by ``pack_areas``.
+        """
+        self.names = names
+        self.county_ids = county_ids
+        self.grid = grid
+        self.projection = projection
+        self.scale = scale
+        self.rings = rings
+        self._outlines: Dict[float, List[List[List[List[float]]]]] = {}
+    
+    def __len__(self) -> int:
+        """Return the number of areas."""
+        return len(self.names)
+    
+    def lookup(self, latitude: float, longitude: float) -> tuple[str, str] | None:
+        """Return (area_name, county_id) of the area containing the point, or None."""
+        if self.projection is not None:
+            x, y = self.projection.forward(longitude, latitude)
+        else:
+            x, y = longitude * self.scale, latitude * self.scale
+        area = self.grid.area_at(x, y)
+        if area is None:
+            return None
+        return self.names[area], self.county_ids[area]
+    
+    def _simplified_outlines(self, tolerance_m: float) -> List[List[List[List[float]]]]:
+        """Return the [longitude, latitude] rings of every area simplified to the tolerance (cached)."""
+        if tolerance_m not in self._outlines:
+            coords, ring_starts, area_rings = self.rings
+            rings = [
+                [
+                    (coords[offset], coords[offset + 1])
+                    for offset in range(2 * ring_starts[ring], 2 * ring_starts[ring + 1], 2)
+                ]
+                for ring in range(len(ring_starts) - 1)
+            ]
+            if self.projection is not None:
+                tolerance = tolerance_m
+            else:
+                tolerance = tolerance_m / 111320.0 * self.scale  # Metres to (scaled) degrees of latitude
+            outlines = []
+            for ring in simplify_rings(rings, tolerance):
+                xs, ys = [point[0] for point in ring], [point[1] for point in ring]
+                if self.projection is not None:
+                    longitudes, latitudes = self.projection.inverse_many(xs, ys)
+                else:
+                    longitudes = [x / self.scale for x in xs]
+                    latitudes = [y / self.scale for y in ys]
+                outlines.append([[longitude, latitude] for longitude, latitude in zip(longitudes, latitudes)])
+            self._outlines[tolerance_m] = [
+                outlines[area_rings[area]:area_rings[area + 1]] for area in range(len(area_rings) - 1)
+            ]
+        return self._outlines[tolerance_m]
+    
+    def display_geometry(self, county_id: str, tolerance_m: float = BOUNDARY_DISPLAY_TOLERANCE) -> Dict[str, Any] | None:
+        """
+        Return the outline of a county simplified for map output.
+        
+        The first call for a tolerance simplifies all areas (a couple of seconds
+        for the bundled counties); run it in an executor.
+        
+        Returns:
+            GeoJSON MultiLineString of the county's rings in longitude/latitude,
+            or None for an unknown county or boundaries without rings
+        """
+        if self.rings is None:
+            return None
+        outlines = self._simplified_outlines(tolerance_m)
+        lines = [
+            ring
+            for area, area_county in enumerate(self.county_ids) if area_county == str(county_id)
+            for ring in outlines[area]
+        ]
+        if not lines:
+            return None
+        return {"type": "MultiLineString", "coordinates": lines}
 
 
-def load_geojson_boundaries(geojson_path: str) -> dict:
+def load_geojson_boundaries(geojson_path: str) -> AreaBoundaries:
     """
-    Load municipality boundaries from GeoJSON file.
+    Load county or municipality boundaries from a Kartverket GeoJSON file.
     
-    This function can be implemented to use precise polygon boundaries
-    instead of the approximate bounding boxes above.
+    Reads the county ("Fylker") or municipality ("Kommuner") datasets, as a
+    ``.geojson`` file or the downloaded ``.zip`` archive, feature by feature,
+    and builds the grid index. This blocks for a few seconds; run it in an
+    executor.
     
     Parameters:
-        geojson_path: Path to GeoJSON file with municipality boundaries
+        geojson_path: Path to the GeoJSON file or zip archive
     
     Returns:
-        Dictionary mapping municipality names to boundary polygons
+        AreaBoundaries for get_municipality_from_coordinates_precise()
     """
-    # TODO: Implement GeoJSON loading
-    # Can use shapely library for point-in-polygon tests
-    raise NotImplementedError("GeoJSON boundary loading not yet implemented")
+    names, county_ids, rings, projection = read_boundary_areas(geojson_path)
+    cell_size = BOUNDARY_GRID_CELL_SIZE if projection is not None else BOUNDARY_GRID_CELL_DEGREES
+    boundaries = AreaBoundaries(names, county_ids, BoundaryGrid(*rings, cell_size), projection, rings=rings)
+    _LOGGER.debug("Loaded boundaries of %d areas from %s", len(boundaries), geojson_path)
+    return boundaries
+
+
+def load_boundary_asset(asset_path: str = DEFAULT_BOUNDARY_ASSET,
+                        source_path: str = DEFAULT_BOUNDARY_SOURCE) -> AreaBoundaries:
+    """
+    Load the preprocessed county boundaries (memory-mapped, no parsing).
+    
+    When the Kartverket source archive is present (development checkouts) and
+    has changed since the asset was built, the asset is rebuilt first, which
+    blocks for a few seconds. Run it in an executor.
+    """
+    if ensure_boundary_asset(source_path, asset_path):
+        _LOGGER.info("Rebuilt boundary asset %s from %s", asset_path, source_path)
+    asset = BoundaryAsset(asset_path)
+    return AreaBoundaries(
+        asset.names, asset.county_ids, asset.grid, scale=asset.scale,
+        rings=(asset.coords, asset.ring_starts, asset.area_rings),
+    )
+
+
+@lru_cache(maxsize=1)
+def county_boundaries() -> AreaBoundaries:
+    """Return the bundled county boundaries (loaded once)."""
+    return load_boundary_asset()
+
+
+async def _async_load_county_boundaries(hass: HomeAssistant) -> AreaBoundaries:
+    """Rebuild the asset in a worker process if needed, then map it in the executor."""
+    if await hass.async_add_executor_job(
+        boundary_asset_outdated, DEFAULT_BOUNDARY_SOURCE, DEFAULT_BOUNDARY_ASSET
+    ):
+        _LOGGER.info("Rebuilding boundary asset %s in a worker process", DEFAULT_BOUNDARY_ASSET)
+        await async_build_boundary_asset(DEFAULT_BOUNDARY_SOURCE, DEFAULT_BOUNDARY_ASSET)
+    return await hass.async_add_executor_job(county_boundaries)
+
+
+async def async_get_county_boundaries(hass: HomeAssistant) -> AreaBoundaries:
+    """Return the bundled county boundaries without blocking the event loop.
+    
+    Concurrent callers share one load. A rebuild from a changed source
+    archive (development checkouts only) parses the GeoJSON in a separate
+    process, so neither the event loop nor the memory of Home Assistant
+    carries it.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    task = domain_data.get(DATA_COUNTY_BOUNDARIES)
+    if task is None:
+        task = domain_data[DATA_COUNTY_BOUNDARIES] = hass.async_create_task(_async_load_county_boundaries(hass))
+    try:
+        return await task
+    except Exception:
+        domain_data.pop(DATA_COUNTY_BOUNDARIES, None)
+        raise
 
 
 def get_municipality_from_coordinates_precise(
     latitude: float, 
     longitude: float, 
-    boundaries: dict
+    boundaries: AreaBoundaries
 ) -> tuple[str, str] | None:
     """
     Get municipality using precise GeoJSON polygon boundaries.
     
+    With county boundaries the returned name is the county's.
+    
     Parameters:
         latitude: Latitude coordinate
         longitude: Longitude coordinate
-        boundaries: Municipality boundaries from load_geojson_boundaries()
+        boundaries: Boundaries from load_geojson_boundaries()
     
     Returns:
         tuple of (municipality_name, county_id) or None if not found
     """
-    # TODO: Implement point-in-polygon check using shapely
-    # from shapely.geometry import Point, shape
-    # point = Point(longitude, latitude)
-    # for municipality, geojson_feature in boundaries.items():
-    #     polygon = shape(geojson_feature['geometry'])
-    #     if polygon.contains(point):
-    #         return (municipality, geojson_feature['properties']['county_id'])
-    raise NotImplementedError("Precise GeoJSON lookup not yet implemented")
+    return boundaries.lookup(latitude, longitude)
+
+
+def get_county_from_coordinates(latitude: float, longitude: float, boundaries: AreaBoundaries) -> str | None:
+    """Return the county ID ("46") of the coordinates, or None outside Norway."""
+    match = boundaries.lookup(latitude, longitude)
+    return match[1] if match is not None else None
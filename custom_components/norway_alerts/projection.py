@@ -0,0 +1,127 @@
+"""Map projections for the Norway Alerts integration.
+
+Kartverket publishes the administrative boundaries in ETRS89 / UTM zone 33N
+(EPSG:25833). Lookups project the query point into that system instead of
+converting every boundary vertex to latitude/longitude.
+
+The transverse Mercator projection uses Krüger's series in the third
+flattening ``n`` to fourth order (as in Karney, "Transverse Mercator with an
+accuracy of a few nanometers", 2011), which is accurate to well below a
+millimetre within the extent of a UTM zone and its neighbours. The series are
+evaluated by Clenshaw summation in complex arithmetic, so a point costs two
+complex and a handful of real function calls. ``forward_many`` and
+``inverse_many`` transform whole coordinate sequences in one call.
+"""
+from __future__ import annotations
+
+import cmath
+import math
+from array import array
+from functools import lru_cache
+from typing import Iterable, Tuple
+
+GRS80_A = 6378137.0  # Semi-major axis (m)
+GRS80_F = 1 / 298.257222101  # Flattening
+
+
+class TransverseMercator:
+    """Transverse Mercator projection on an ellipsoid (x = easting, y = northing, in metres)."""
+
+    def __init__(self, central_meridian: float, scale: float = 0.9996, false_easting: float = 500000.0,
+                 false_northing: float = 0.0, a: float = GRS80_A, f: float = GRS80_F):
+        self.central_meridian = central_meridian
+        self.scale = scale
+        self.false_easting = false_easting
+        self.false_northing = false_northing
+        n = f / (2 - f)
+        n2, n3, n4 = n * n, n ** 3, n ** 4
+        self._lambda0 = math.radians(central_meridian)
+        self._k_a = scale * a / (1 + n) * (1 + n2 / 4 + n4 / 64)  # k0 * rectifying radius
+        self._e_n = 2 * math.sqrt(n) / (1 + n)  # Eccentricity
+        self._alpha = (
+            n / 2 - 2 * n2 / 3 + 5 * n3 / 16 + 41 * n4 / 180,
+            13 * n2 / 48 - 3 * n3 / 5 + 557 * n4 / 1440,
+            61 * n3 / 240 - 103 * n4 / 140,
+            49561 * n4 / 161280,
+        )
+        self._beta = (
+            n / 2 - 2 * n2 / 3 + 37 * n3 / 96 - n4 / 360,
+            n2 / 48 + n3 / 15 - 437 * n4 / 1440,
+            17 * n3 / 480 - 37 * n4 / 840,
+            4397 * n4 / 161280,
+        )
+        self._delta = (
+            2 * n - 2 * n2 / 3 - 2 * n3 + 116 * n4 / 45,
+            7 * n2 / 3 - 8 * n3 / 5 - 227 * n4 / 45,
+            56 * n3 / 15 - 136 * n4 / 35,
+            4279 * n4 / 630,
+        )
+
+    def forward(self, longitude: float, latitude: float) -> Tuple[float, float]:
+        """Return the easting and northing of a longitude/latitude in degrees."""
+        eastings, northings = self.forward_many((longitude,), (latitude,))
+        return eastings[0], northings[0]
+
+    def inverse(self, easting: float, northing: float) -> Tuple[float, float]:
+        """Return the longitude and latitude in degrees of an easting/northing."""
+        longitudes, latitudes = self.inverse_many((easting,), (northing,))
+        return longitudes[0], latitudes[0]
+
+    def forward_many(self, longitudes: Iterable[float], latitudes: Iterable[float]) -> Tuple[array, array]:
+        """Project whole coordinate sequences (degrees) and return arrays of eastings and northings."""
+        eastings, northings = array("d"), array("d")
+        lambda0, e_n, k_a = self._lambda0, self._e_n, self._k_a
+        false_easting, false_northing = self.false_easting, self.false_northing
+        alpha = self._alpha[::-1]
+        sin, cos, sinh, atanh, atan2, sqrt = math.sin, math.cos, math.sinh, math.atanh, math.atan2, math.sqrt
+        radians, csin, ccos = math.radians, cmath.sin, cmath.cos
+        for longitude, latitude in zip(longitudes, latitudes):
+            sin_phi = sin(radians(latitude))
+            lam = radians(longitude) - lambda0
+            t = sinh(atanh(sin_phi) - e_n * atanh(e_n * sin_phi))
+            # Conformal (Gauss-Schreiber) coordinates, then Krüger's series by Clenshaw summation
+            zeta = complex(atan2(t, cos(lam)), atanh(sin(lam) / sqrt(1 + t * t)))
+            cos_2z = 2 * ccos(2 * zeta)
+            b1 = b2 = 0j
+            for coefficient in alpha:
+                b1, b2 = coefficient + cos_2z * b1 - b2, b1
+            zeta += csin(2 * zeta) * b1
+            eastings.append(false_easting + k_a * zeta.imag)
+            northings.append(false_northing + k_a * zeta.real)
+        return eastings, northings
+
+    def inverse_many(self, eastings: Iterable[float], northings: Iterable[float]) -> Tuple[array, array]:
+        """Unproject whole coordinate sequences and return arrays of longitudes and latitudes (degrees)."""
+        longitudes, latitudes = array("d"), array("d")
+        lambda0, k_a = self._lambda0, self._k_a
+        false_easting, false_northing = self.false_easting, self.false_northing
+        beta, delta = self._beta[::-1], self._delta[::-1]
+        sin, cos, asin, sinh, cosh, atan2 = math.sin, math.cos, math.asin, math.sinh, math.cosh, math.atan2
+        degrees, csin, ccos = math.degrees, cmath.sin, cmath.cos
+        for easting, northing in zip(eastings, northings):
+            zeta = complex((northing - false_northing) / k_a, (easting - false_easting) / k_a)
+            cos_2z = 2 * ccos(2 * zeta)
+            b1 = b2 = 0j
+            for coefficient in beta:
+                b1, b2 = coefficient + cos_2z * b1 - b2, b1
+            zeta -= csin(2 * zeta) * b1
+            xi_prime, eta_prime = zeta.real, zeta.imag
+            chi = asin(sin(xi_prime) / cosh(eta_prime))
+            # Conformal to geodetic latitude (real Clenshaw sum)
+            cos_2chi = 2 * cos(2 * chi)
+            c1 = c2 = 0.0
+            for coefficient in delta:
+                c1, c2 = coefficient + cos_2chi * c1 - c2, c1
+            longitudes.append(degrees(lambda0 + atan2(sinh(eta_prime), cos(xi_prime))))
+            latitudes.append(degrees(chi + sin(2 * chi) * c1))
+        return longitudes, latitudes
+
+
+@lru_cache(maxsize=None)
+def utm_zone(zone: int) -> TransverseMercator:
+    """Return the ETRS89 / UTM projection of a northern hemisphere zone (33 -> central meridian 15)."""
+    return TransverseMercator(central_meridian=6.0 * int(zone) - 183.0)
+
+
+# ETRS89 / UTM zone 33N (EPSG:25833), used by Kartverket for all of Norway
+UTM33 = utm_zone(33)
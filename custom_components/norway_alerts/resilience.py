@@ -0,0 +1,115 @@
+"""Retry and circuit breaker helpers for the Norway Alerts integration.
+
+Transient upstream failures (timeouts, connection errors, 408/429/5xx) are
+retried with exponential backoff and full jitter. A circuit breaker per
+upstream host stops sending requests to a host that keeps failing and lets a
+single trial request through after a cool-down period.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, TypeVar
+
+from .const import (
+    HTTP_RETRY_ATTEMPTS,
+    HTTP_RETRY_BASE_DELAY,
+    HTTP_RETRY_MAX_DELAY,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+def backoff_delay(attempt: int, base_delay: float = HTTP_RETRY_BASE_DELAY,
+                  max_delay: float = HTTP_RETRY_MAX_DELAY) -> float:
+    """Return a full-jitter delay for the given retry attempt (0-based)."""
+    return random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+
+
+async def async_retry(
+    func: Callable[[], Awaitable[_T]],
+    is_transient: Callable[[BaseException], bool],
+    attempts: int = HTTP_RETRY_ATTEMPTS,
+    base_delay: float = HTTP_RETRY_BASE_DELAY,
+    max_delay: float = HTTP_RETRY_MAX_DELAY,
+) -> _T:
+    """Call func, retrying transient failures with exponential backoff and jitter.
+
+    An exception may carry a ``retry_after`` (seconds) hint, which is used
+    instead of the backoff delay when it is larger (capped at max_delay).
+    """
+    for attempt in range(attempts):
+        try:
+            return await func()
+        except Exception as err:
+            if attempt + 1 >= attempts or not is_transient(err):
+                raise
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            retry_after = getattr(err, "retry_after", None)
+            if retry_after:
+                delay = min(max(delay, retry_after), max_delay)
+            _LOGGER.debug("Transient error (%s), retry %d/%d in %.1fs", err, attempt + 1, attempts - 1, delay)
+            await asyncio.sleep(delay)
+    raise RuntimeError("attempts must be at least 1")
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker.
+
+    After failure_threshold consecutive failures the circuit opens and requests
+    are refused for reset_timeout seconds. Then one trial request is allowed
+    (half-open) and concurrent callers are refused while it runs: success
+    closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+                 reset_timeout: float = CIRCUIT_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now."""
+        if self.state == CIRCUIT_OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self.state = CIRCUIT_HALF_OPEN
+        if self.state == CIRCUIT_HALF_OPEN:
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+        return True
+
+    def release_trial(self) -> None:
+        """End a trial request that neither succeeded nor failed upstream (cancelled or rejected)."""
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        self.state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failed request and open the circuit when needed."""
+        self._failures += 1
+        self._trial_in_flight = False
+        if self.state == CIRCUIT_HALF_OPEN or self._failures >= self.failure_threshold:
+            if self.state != CIRCUIT_OPEN:
+                _LOGGER.warning("Circuit opened after %d failures, pausing requests for %ss",
+                                self._failures, self.reset_timeout)
+            self.state = CIRCUIT_OPEN
+            self._opened_at = time.monotonic()
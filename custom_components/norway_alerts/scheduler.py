@@ -0,0 +1,118 @@
+"""Adaptive refresh scheduling for the Norway Alerts integration.
+
+Instead of a fixed scan interval, the next poll is planned from the warnings
+themselves: quiet periods are polled rarely, orange and red situations often,
+and polls are placed just after an announced ``NextWarningTime`` and more
+densely shortly after a ``PublishTime``. The result never goes below the
+minimum interval configured for the upstream host.
+"""
+from __future__ import annotations
+
+import datetime as dt
+import logging
+import re
+from typing import Any, Dict, Iterable
+from urllib.parse import urlsplit
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    API_BASE_LANDSLIDE,
+    API_BASE_FLOOD,
+    API_BASE_AVALANCHE,
+    API_BASE_METALERTS,
+    WARNING_TYPE_LANDSLIDE,
+    WARNING_TYPE_FLOOD,
+    WARNING_TYPE_AVALANCHE,
+    WARNING_TYPE_METALERTS,
+    REFRESH_INTERVAL_QUIET,
+    REFRESH_INTERVAL_YELLOW,
+    REFRESH_INTERVAL_ORANGE,
+    REFRESH_INTERVAL_RED,
+    REFRESH_RECENT_PUBLISH_WINDOW,
+    REFRESH_RECENT_PUBLISH_INTERVAL,
+    REFRESH_PUBLISH_GRACE,
+    REFRESH_MIN_INTERVAL_DEFAULT,
+    REFRESH_MIN_INTERVAL_PER_HOST,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# NVE timestamps are local Norwegian time without offset
+NVE_TIME_ZONE = "Europe/Oslo"
+
+_API_BASES = {
+    WARNING_TYPE_LANDSLIDE: API_BASE_LANDSLIDE,
+    WARNING_TYPE_FLOOD: API_BASE_FLOOD,
+    WARNING_TYPE_AVALANCHE: API_BASE_AVALANCHE,
+    WARNING_TYPE_METALERTS: API_BASE_METALERTS,
+}
+
+# Fractional seconds beyond microseconds (NVE sends 7 digits)
+_EXTRA_FRACTION = re.compile(r"(\.\d{6})\d+")
+
+
+def upstream_host(warning_type: str) -> str | None:
+    """Return the upstream host polled for a warning type."""
+    base_url = _API_BASES.get(warning_type)
+    return urlsplit(base_url).hostname if base_url else None
+
+
+def parse_warning_time(value: Any) -> dt.datetime | None:
+    """Parse an NVE or Met.no timestamp to an aware UTC datetime."""
+    if not value or not isinstance(value, str):
+        return None
+    parsed = dt_util.parse_datetime(_EXTRA_FRACTION.sub(r"\1", value))
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.get_time_zone(NVE_TIME_ZONE))
+    return dt_util.as_utc(parsed)
+
+
+def _highest_level(warnings: Iterable[Dict[str, Any]]) -> int:
+    """Return the highest ActivityLevel among the warnings (0 if none)."""
+    highest = 0
+    for warning in warnings:
+        try:
+            highest = max(highest, int(warning.get("ActivityLevel", 0)))
+        except (TypeError, ValueError):
+            continue
+    return highest
+
+
+def compute_update_interval(
+    warnings: Iterable[Dict[str, Any]], warning_type: str, now: dt.datetime | None = None
+) -> dt.timedelta:
+    """Return the interval until the next refresh for the given warnings."""
+    warnings = list(warnings)
+    now = now or dt_util.utcnow()
+
+    level = _highest_level(warnings)
+    if level >= 4:
+        minutes = REFRESH_INTERVAL_RED
+    elif level == 3:
+        minutes = REFRESH_INTERVAL_ORANGE
+    elif level == 2:
+        minutes = REFRESH_INTERVAL_YELLOW
+    else:
+        minutes = REFRESH_INTERVAL_QUIET
+    interval = dt.timedelta(minutes=minutes)
+
+    # Shortly after a publication, updated or escalated warnings tend to follow
+    publish_times = [parse_warning_time(w.get("PublishTime")) for w in warnings]
+    latest_publish = max((t for t in publish_times if t is not None and t <= now), default=None)
+    if latest_publish is not None and now - latest_publish < dt.timedelta(minutes=REFRESH_RECENT_PUBLISH_WINDOW):
+        interval = min(interval, dt.timedelta(minutes=REFRESH_RECENT_PUBLISH_INTERVAL))
+
+    # Poll right after the next announced publication
+    next_times = [parse_warning_time(w.get("NextWarningTime")) for w in warnings]
+    next_publish = min((t for t in next_times if t is not None and t > now), default=None)
+    if next_publish is not None:
+        interval = min(interval, next_publish - now + dt.timedelta(minutes=REFRESH_PUBLISH_GRACE))
+
+    host = upstream_host(warning_type)
+    min_interval = dt.timedelta(
+        minutes=REFRESH_MIN_INTERVAL_PER_HOST.get(host, REFRESH_MIN_INTERVAL_DEFAULT)
+    )
+    return max(interval, min_interval)
@@ -1,7 +1,10 @@
 """Norway Alerts sensor platform."""
 import logging
-from datetime import timedelta
+from collections import ChainMap, OrderedDict
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
 import os
+import time
 
 import voluptuous as vol
 from jinja2 import Environment, FileSystemLoader
@@ -9,8 +12,9 @@ from jinja2 import Environment, FileSystemLoader
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util.read_only_dict import ReadOnlyDict
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -38,18 +42,25 @@ from .const import (
     WARNING_TYPE_FLOOD,
     WARNING_TYPE_AVALANCHE,
     WARNING_TYPE_METALERTS,
+    DATA_HTTP_CLIENT,
+    DATA_FETCH_HUB,
+    DATA_AVALANCHE_REGIONS,
     ACTIVITY_LEVEL_NAMES,
     ICON_DATA_URLS,
+    CAP_CACHE_SIZE,
     NOTIFICATION_SEVERITY_ALL,
     NOTIFICATION_SEVERITY_YELLOW_PLUS,
     NOTIFICATION_SEVERITY_ORANGE_PLUS,
     NOTIFICATION_SEVERITY_RED_ONLY,
 )
 from .api import WarningAPIFactory
+from .filtering import MunicipalityFilter, MunicipalityIndex
+from .models import Alert
+from .scheduler import compute_update_interval
 
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(minutes=30)
+SCAN_INTERVAL = timedelta(minutes=30)  # Initial interval, adapted after each update
 
 
 async def _async_load_template(hass: HomeAssistant) -> str | None:
@@ -77,7 +88,7 @@ async def _async_load_template(hass: HomeAssistant) -> str | None:
         return None
 
 
-def convert_nve_to_cap(alert: dict, warning_type: str, lang: str) -> dict:
+def convert_nve_to_cap(alert: Mapping, warning_type: str, lang: str, entity_picture: str | None = None) -> dict:
     """Convert NVE warning format to CAP format for unified display.
     
     Maps NVE fields to Common Alerting Protocol (CAP) fields used by Met.no,
@@ -192,7 +203,7 @@ def convert_nve_to_cap(alert: dict, warning_type: str, lang: str) -> dict:
         "warning_type": warning_type,
         
         # Icon
-        "entity_picture": alert.get("entity_picture"),
+        "entity_picture": entity_picture,
     }
     
     # Add avalanche-specific fields if applicable
@@ -213,11 +224,108 @@ def convert_nve_to_cap(alert: dict, warning_type: str, lang: str) -> dict:
             "utm_zone": alert.get("UtmZone"),
             "utm_east": alert.get("UtmEast"),
             "utm_north": alert.get("UtmNorth"),
+            "latitude": alert.get("Latitude"),
+            "longitude": alert.get("Longitude"),
         })
     
     return cap_alert
 
 
+def _alert_period(alert: Mapping) -> tuple[datetime, datetime] | None:
+    """Return the parsed (start, end) of a CAP alert, or None if it has no valid period."""
+    starttime = alert.get("starttime", "")
+    endtime = alert.get("endtime", "")
+    if not starttime or not endtime:
+        return None
+    try:
+        return (
+            datetime.fromisoformat(starttime.replace("Z", "+00:00")),
+            datetime.fromisoformat(endtime.replace("Z", "+00:00")),
+        )
+    except (ValueError, AttributeError) as err:
+        _LOGGER.debug("Failed to parse timestamps for alert: %s", err)
+        return None
+
+
+def _next_status_change(alerts, now: float) -> float | None:
+    """Return the timestamp of the next Expected/Ongoing/Ended status change among the alerts, or None.
+    
+    An alert is Expected before its start, Ongoing up to and including its
+    end and Ended after it.
+    """
+    changes = []
+    for alert in alerts:
+        period = _alert_period(alert)
+        if period is None:
+            continue
+        start, end = period[0].timestamp(), period[1].timestamp()
+        if start > now:
+            changes.append(start)
+        elif end >= now:
+            changes.append(end + 1)  # Ended once the end has passed
+    return min(changes, default=None)
+
+
+class CapConversionCache:
+    """Bounded LRU cache of CAP converted NVE alerts.
+    
+    NVE alerts carry an Id and a Version that changes whenever the warning is
+    updated, so a converted alert can be reused until the Version changes.
+    The validity period is part of the key so a warning re-published with new
+    ValidFrom/ValidTo is not served with stale onset and expiry times.
+    The municipality Ids are part of the key because the same warning is
+    partitioned differently per county. Records are read-only, copy before
+    changing them.
+    """
+
+    def __init__(self, maxsize: int = CAP_CACHE_SIZE):
+        """Initialize the cache."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._records: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def _key(alert: Mapping, warning_type: str, lang: str, cap_format: bool) -> tuple:
+        """Return the cache key of an alert."""
+        return (
+            warning_type,
+            alert.get("Id"),
+            alert.get("Version"),
+            lang,
+            cap_format,
+            # Guards for sources without a Version (avalanche) and for changed validity
+            alert.get("ActivityLevel"),
+            alert.get("PublishTime"),
+            alert.get("ValidFrom"),
+            alert.get("ValidTo"),
+            tuple(m.get("Id") for m in alert.get("MunicipalityList", ())),
+        )
+
+    def convert(self, alert: Mapping, warning_type: str, lang: str, cap_format: bool = True,
+                entity_picture: str | None = None) -> ReadOnlyDict:
+        """Return the CAP conversion of an alert, converting it only once per version."""
+        key = self._key(alert, warning_type, lang, cap_format)
+        record = self._records.get(key)
+        if record is not None:
+            self.hits += 1
+            self._records.move_to_end(key)
+            return record
+        self.misses += 1
+        record = self._records[key] = ReadOnlyDict(convert_nve_to_cap(alert, warning_type, lang, entity_picture))
+        if len(self._records) > self.maxsize:
+            self._records.popitem(last=False)
+        return record
+
+    @property
+    def stats(self) -> dict:
+        """Return hit/miss counters."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._records)}
+
+
+CAP_CACHE = CapConversionCache()
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -274,13 +382,15 @@ class NorwayAlertsCoordinator(DataUpdateCoordinator):
 
     def __init__(self, hass, county_id, county_name, warning_type, lang, test_mode=False, 
                  enable_notifications=False, notification_severity=NOTIFICATION_SEVERITY_YELLOW_PLUS,
-                 cap_format=True, latitude=None, longitude=None, config_entry=None):
+                 cap_format=True, latitude=None, longitude=None, config_entry=None, bulk_fetch=False):
         """Initialize coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=SCAN_INTERVAL,
+            # Unchanged data is returned as the same list, so listeners are only notified on changes
+            always_update=False,
         )
         self.county_id = county_id
         self.county_name = county_name
@@ -293,7 +403,12 @@ class NorwayAlertsCoordinator(DataUpdateCoordinator):
         self.latitude = latitude
         self.longitude = longitude
         self.config_entry = config_entry  # Store config entry for device info
+        self.bulk_fetch = bulk_fetch  # Share one nationwide download across entries
+        self._api_client = None  # Kept between refreshes so unchanged responses can be reused
+        self.cache = None  # WarningCache set up by async_setup_entry, saved after each update
+        self.stale = False  # True while the upstream fails and the last good data is served
         self.previous_alerts = {}  # Track previous alerts for change detection
+        self._municipality_index = None  # (data, MunicipalityIndex), built on first use after an update
 
     # Old _fetch_warnings method removed - replaced by API classes
 
@@ -424,22 +539,45 @@ class NorwayAlertsCoordinator(DataUpdateCoordinator):
                         ],
                     })
                 
-                all_warnings.append(test_alert)
+                all_warnings.append(Alert.from_mapping(test_alert))
                 _LOGGER.info("Test mode: Injected fake orange %s alert", test_warning_type)
             
-            # Use API factory to get appropriate API client and fetch warnings
-            api_factory = WarningAPIFactory(
-                county_id=self.county_id, 
-                county_name=self.county_name, 
-                latitude=self.latitude,
-                longitude=self.longitude,
-                lang=self.lang,
-                test_mode=self.test_mode
-            )
+            # Use API factory to get appropriate API client (created once, reused between refreshes)
+            if self._api_client is None:
+                api_factory = WarningAPIFactory(
+                    county_id=self.county_id, 
+                    county_name=self.county_name, 
+                    latitude=self.latitude,
+                    longitude=self.longitude,
+                    lang=self.lang,
+                    test_mode=self.test_mode,
+                    http_client=self.hass.data.get(DOMAIN, {}).get(DATA_HTTP_CLIENT),
+                    fetch_hub=self.hass.data.get(DOMAIN, {}).get(DATA_FETCH_HUB),
+                    bulk_fetch=self.bulk_fetch,
+                    region_table=self.hass.data.get(DOMAIN, {}).get(DATA_AVALANCHE_REGIONS),
+                )
+                self._api_client = api_factory.get_api(self.warning_type)
             
             # Fetch warnings for the configured warning type
-            api_client = api_factory.get_api(self.warning_type)
+            api_client = self._api_client
             warnings = await api_client.fetch_warnings()
+            
+            # Upstream failing: keep serving the last good data, flagged stale, without notifications
+            if api_client.stale is True and self.data is not None and not self.test_mode:
+                _LOGGER.warning("%s upstream unavailable, serving last good data", self.warning_type)
+                self._set_stale(True)
+                return self.data
+            self._set_stale(api_client.stale is True)
+            
+            # Nothing changed upstream: keep the current data and skip notifications
+            if api_client.not_modified is True and self.data is not None and not self.test_mode:
+                _LOGGER.debug("%s warnings not modified, keeping current data", self.warning_type)
+                self._adapt_update_interval(self.data)
+                if self.cache is not None:
+                    self.cache.async_save(self.data)  # Refresh the cached fetch time
+                return self.data
+            
+            self._adapt_update_interval(warnings)
             all_warnings.extend(warnings)
             _LOGGER.info("Fetched %d %s warnings", len(warnings), self.warning_type)
             
@@ -456,11 +594,35 @@ class NorwayAlertsCoordinator(DataUpdateCoordinator):
             if self.enable_notifications:
                 await self._send_notifications(all_warnings)
             
+            # Persist the last good warnings (test alerts are never cached)
+            if self.cache is not None and not self.test_mode:
+                self.cache.async_save(all_warnings)
+            
             return all_warnings
             
         except Exception as err:
             raise UpdateFailed(f"Error fetching data: {err}")
 
+    def municipality_index(self):
+        """Return the municipality -> alerts index of the current data."""
+        if self._municipality_index is None or self._municipality_index[0] is not self.data:
+            self._municipality_index = (self.data, MunicipalityIndex(self.data))
+        return self._municipality_index[1]
+
+    def _set_stale(self, stale):
+        """Update the stale flag, notifying entities when it changes."""
+        if stale != self.stale:
+            self.stale = stale
+            # Listeners are not called for unchanged data (always_update=False)
+            self.async_update_listeners()
+
+    def _adapt_update_interval(self, warnings):
+        """Plan the next refresh from severity and announced publish times."""
+        interval = compute_update_interval(warnings, self.warning_type)
+        if interval != self.update_interval:
+            _LOGGER.debug("Next %s refresh in %s", self.warning_type, interval)
+            self.update_interval = interval
+
     async def _send_notifications(self, current_alerts):
         """Send notifications for new or changed alerts."""
         try:
@@ -627,12 +789,18 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
         self._county_name = county_name
         self._warning_type = warning_type
         self._municipality_filter = municipality_filter.strip()
+        self._compiled_filter = MunicipalityFilter(self._municipality_filter)
         self._is_main = is_main
         
         # Store pre-loaded template content (loaded async in async_setup_entry)
         self._template_content = template_content
         self._formatted_content_template = None
         self._compact_view_switch_entity_id = None  # Will be set in async_added_to_hass
+        # Snapshot of state/attributes/picture, rebuilt when coordinator data or switch state changes
+        self._snapshot_cache = None
+        self._snapshot_data = None
+        self._snapshot_key = None
+        self._status_change_unsub = None  # Scheduled state write at the next alert status change
         if template_content:
             self._compile_template(template_content)
     
@@ -677,6 +845,7 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
                 self.hass, self.entity_id, _entity_registry_updated
             )
         )
+        self.async_on_remove(self._cancel_status_change)
     
     def _setup_switch_listener(self):
         """Find the switch entity and set up state change listener."""
@@ -720,6 +889,15 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
             _LOGGER.warning("Could not determine device_id for sensor %s", self.entity_id)
             self._compact_view_switch_entity_id = None
     
+    def _compact_view_state(self):
+        """Return the compact view switch entity_id and its current state."""
+        # Use the stored switch entity_id if available, otherwise construct it
+        switch_entity_id = self._compact_view_switch_entity_id or (
+            f"switch.{self.entity_id.split('.')[1]}_compact_view" if self.entity_id else None
+        )
+        switch_state = self.hass.states.get(switch_entity_id) if switch_entity_id and self.hass else None
+        return switch_entity_id, switch_state.state if switch_state else "NOT_FOUND"
+    
     def _add_metalert_attributes(self, alert_dict: dict, alert: dict) -> None:
         """Add MetAlerts-specific attributes to alert dict."""
         area_str = alert.get("area", "")
@@ -771,6 +949,8 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
             "utm_zone": alert.get("UtmZone"),
             "utm_east": alert.get("UtmEast"),
             "utm_north": alert.get("UtmNorth"),
+            "latitude": alert.get("Latitude"),
+            "longitude": alert.get("Longitude"),
             
             # Avalanche-specific information
             "avalanche_danger": alert.get("AvalancheDanger", ""),
@@ -811,50 +991,24 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
     
     def _filter_alerts(self, alerts):
         """Filter alerts by municipality if filter is set."""
-        if not self._municipality_filter:
+        if not self._compiled_filter:
             _LOGGER.debug("No municipality filter set, returning all %d alerts", len(alerts))
             return alerts
         
-        _LOGGER.info("Filtering %d alerts with municipality filter: '%s'", len(alerts), self._municipality_filter)
-        
-        # Split filter by comma for multiple municipalities
-        filter_terms = [term.strip().lower() for term in self._municipality_filter.split(",")]
-        _LOGGER.debug("Filter terms: %s", filter_terms)
-        
-        filtered = []
-        for alert in alerts:
-            municipalities = alert.get("MunicipalityList", [])
-            muni_names = [m.get("Name", "").lower() for m in municipalities]
-            
-            _LOGGER.debug("Checking alert ID %s with municipalities: %s", alert.get("Id"), muni_names)
-            
-            # Check if any municipality matches any filter term
-            matches = False
-            for filter_term in filter_terms:
-                for muni_name in muni_names:
-                    if filter_term in muni_name:
-                        matches = True
-                        _LOGGER.debug("  -> MATCH: '%s' in '%s'", filter_term, muni_name)
-                        break
-                if matches:
-                    break
-            
-            if matches:
-                filtered.append(alert)
-            else:
-                _LOGGER.debug("  -> NO MATCH for alert ID %s", alert.get("Id"))
+        # Use the coordinator's index for its data, built once per update
+        index = self.coordinator.municipality_index() if alerts is self.coordinator.data else MunicipalityIndex(alerts)
+        filtered = self._compiled_filter.select(index)
         
-        _LOGGER.info("Filtered to %d alerts matching '%s'", len(filtered), self._municipality_filter)
+        _LOGGER.debug("Filtered %d alerts to %d matching '%s'", len(alerts), len(filtered), self._municipality_filter)
         return filtered
 
-    def _generate_formatted_content(self, alerts):
+    def _generate_formatted_content(self, alerts, now: float):
         """Generate markdown-formatted content for display using cached Jinja2 template.
         
         Only generates content for CAP-formatted alerts (weather alerts or NVE with CAP enabled).
-        Returns None for non-CAP sensors or if template failed to load.
+        Returns None for non-CAP sensors or if template failed to load. The
+        alert status (Expected/Ongoing/Ended) is rendered for the timestamp now.
         """
-        from datetime import datetime
-        
         try:
             # Only generate formatted content for CAP format sensors
             if not self.coordinator.cap_format:
@@ -872,25 +1026,19 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
             show_status = self.coordinator.config_entry.options.get(CONF_SHOW_STATUS, True)
             show_map = self.coordinator.config_entry.options.get(CONF_SHOW_MAP, True)
             
-            # Enrich alerts with computed fields for template
+            # Enrich alerts with computed fields for template (layered over the alert, not copied)
             enriched_alerts = []
             for alert in alerts:
-                enriched = dict(alert)
+                enriched = ChainMap({}, alert)
                 
                 # Parse timestamps
-                starttime = alert.get("starttime", "")
-                endtime = alert.get("endtime", "")
-                if starttime and endtime:
-                    try:
-                        start_dt = datetime.fromisoformat(starttime.replace("Z", "+00:00"))
-                        end_dt = datetime.fromisoformat(endtime.replace("Z", "+00:00"))
-                        enriched["starttime_timestamp"] = start_dt.timestamp()
-                        enriched["endtime_timestamp"] = end_dt.timestamp()
-                        enriched["start_formatted"] = start_dt.strftime("%A, %d %B kl. %H:%M")
-                        enriched["end_formatted"] = end_dt.strftime("%A, %d %B kl. %H:%M")
-                    except (ValueError, AttributeError) as err:
-                        _LOGGER.debug("Failed to parse timestamps for alert: %s", err)
-                        pass
+                period = _alert_period(alert)
+                if period is not None:
+                    start_dt, end_dt = period
+                    enriched["starttime_timestamp"] = start_dt.timestamp()
+                    enriched["endtime_timestamp"] = end_dt.timestamp()
+                    enriched["start_formatted"] = start_dt.strftime("%A, %d %B kl. %H:%M")
+                    enriched["end_formatted"] = end_dt.strftime("%A, %d %B kl. %H:%M")
                 
                 # Handle area with municipality fallback
                 if not enriched.get("area") and alert.get("municipalities"):
@@ -903,15 +1051,10 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
                 enriched_alerts.append(enriched)
             
             # Check switch state for debugging
-            # Use the stored switch entity_id if available, otherwise construct it
-            switch_entity_id = self._compact_view_switch_entity_id or (
-                f"switch.{self.entity_id.split('.')[1]}_compact_view" if self.entity_id else None
-            )
-            switch_state = self.hass.states.get(switch_entity_id) if switch_entity_id else None
-            switch_state_value = switch_state.state if switch_state else "NOT_FOUND"
+            switch_entity_id, switch_state_value = self._compact_view_state()
             compact_mode = switch_state_value == 'on'
             
-            _LOGGER.info(
+            _LOGGER.debug(
                 "Rendering formatted_content: sensor=%s, switch=%s, switch_state=%s, compact_mode=%s",
                 self.entity_id, switch_entity_id, switch_state_value, compact_mode
             )
@@ -922,7 +1065,7 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
                 show_icon=show_icon,
                 show_status=show_status,
                 show_map=show_map,
-                now_timestamp=datetime.now().timestamp(),
+                now_timestamp=now,
                 entity_id=self.entity_id,
                 switch_entity_id=switch_entity_id,  # Pass the actual switch entity_id
                 states=self.hass.states.get
@@ -959,29 +1102,74 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """Return the state of the sensor (number of active alerts)."""
-        if not self.coordinator.data:
-            return 0
-        
-        # Apply municipality filter if this is the filtered sensor
-        data_to_use = self._filter_alerts(self.coordinator.data) if self._use_filter else self.coordinator.data
-        
-        # Filter out green level (1) and unknown level (0) alerts
-        active_alerts = [
-            alert for alert in data_to_use
-            if alert.get("ActivityLevel", "1") not in ("0", "1")
-        ]
-        
-        return len(active_alerts)
+        return self._snapshot()["native_value"]
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes with all alerts."""
+        return self._snapshot()["attributes"]
+
+    @property
+    def entity_picture(self):
+        """Return embedded Yr.no warning icon based on warning type and highest level."""
+        return self._snapshot()["entity_picture"]
+
+    def _snapshot(self) -> dict:
+        """Return the state, attributes and picture for the current coordinator data.
+        
+        Computed once per coordinator update (and per compact view switch state,
+        which only affects formatted_content) and reused by every state write.
+        formatted_content also shows whether each alert is expected, ongoing or
+        ended, so the snapshot is rebuilt once the next start or end has passed
+        and a state write is scheduled for that moment.
+        """
+        data = self.coordinator.data
+        key = (self.coordinator.stale, self._compact_view_state()[1] if self.coordinator.cap_format else None)
+        status_change = self._snapshot_cache["status_change"] if self._snapshot_cache is not None else None
+        if (
+            self._snapshot_cache is None
+            or self._snapshot_data is not data
+            or self._snapshot_key != key
+            or (status_change is not None and time.time() >= status_change)
+        ):
+            self._snapshot_cache = self._build_snapshot()
+            self._snapshot_data = data
+            self._snapshot_key = key
+            self._schedule_status_change(self._snapshot_cache["status_change"])
+        return self._snapshot_cache
+
+    def _schedule_status_change(self, status_change: float | None) -> None:
+        """Schedule a state write at the next alert status change, replacing the previous one."""
+        self._cancel_status_change()
+        if status_change is None or self.hass is None:
+            return
+        from homeassistant.helpers.event import async_track_point_in_time
+        
+        self._status_change_unsub = async_track_point_in_time(
+            self.hass, self._async_status_changed, datetime.fromtimestamp(status_change, timezone.utc)
+        )
+
+    def _cancel_status_change(self) -> None:
+        """Cancel the scheduled status change state write."""
+        if self._status_change_unsub is not None:
+            self._status_change_unsub()
+            self._status_change_unsub = None
+
+    @callback
+    def _async_status_changed(self, _now) -> None:
+        """Write the state when an alert becomes ongoing or ends."""
+        self._status_change_unsub = None
+        self.async_write_ha_state()
+
+    def _build_snapshot(self) -> dict:
+        """Filter, deduplicate and convert the coordinator data into the sensor snapshot."""
         if not self.coordinator.data:
             base_attrs = {
                 "active_alerts": 0,
                 "highest_level": "green",
                 "highest_level_numeric": 1,
                 "alerts": [],
+                "stale": self.coordinator.stale,
             }
             
             # Add location-specific attributes
@@ -999,7 +1187,7 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
                     "longitude": self.coordinator.longitude,
                 })
             
-            return base_attrs
+            return {"native_value": 0, "attributes": base_attrs, "entity_picture": None, "status_change": None}
         
         # Apply municipality filter if this is the filtered sensor
         data_to_use = self._filter_alerts(self.coordinator.data) if self._use_filter else self.coordinator.data
@@ -1059,10 +1247,10 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
             
             # Check if we already have an alert with this master_id
             if url_id in alerts_dict:
-                # Merge municipality lists (avoid duplicates)
+                # Merge municipality lists (avoid duplicates), copying the possibly cached record
                 existing_munis = set(alerts_dict[url_id]["municipalities"])
                 existing_munis.update(municipalities)
-                alerts_dict[url_id]["municipalities"] = sorted(list(existing_munis))
+                alerts_dict[url_id] = {**alerts_dict[url_id], "municipalities": sorted(list(existing_munis))}
                 _LOGGER.debug("Merged duplicate alert %s, municipalities now: %s", url_id, alerts_dict[url_id]["municipalities"])
             else:
                 # Generate individual icon for this alert
@@ -1084,8 +1272,8 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
                 # If CAP format is enabled and this is an NVE warning, convert it
                 if self.coordinator.cap_format and not is_metalert:
                     # Convert NVE format to CAP format for unified display
-                    alert["entity_picture"] = individual_icon  # Add icon before conversion
-                    alert_dict = convert_nve_to_cap(alert, warning_type, self.coordinator.lang)
+                    alert_dict = CAP_CACHE.convert(alert, warning_type, self.coordinator.lang,
+                                                   self.coordinator.cap_format, individual_icon)
                 else:
                     # Use native format (either MetAlerts CAP or NVE native)
                     # Create base dict with common fields
@@ -1111,16 +1299,20 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
         
         # Convert dict back to list
         alerts_list = list(alerts_dict.values())
+        if self.coordinator.cap_format:
+            _LOGGER.debug("CAP conversion cache: %s", CAP_CACHE.stats)
         
         # Sort by level (highest first), then by starttime
         alerts_list.sort(key=lambda x: (x["level"], x.get("starttime", "")), reverse=True)
         
+        now = time.time()
         result = {
             "active_alerts": len(alerts_list),
             "highest_level": ACTIVITY_LEVEL_NAMES.get(str(max_level), "green"),
             "highest_level_numeric": max_level,
             "alerts": alerts_list,
-            "formatted_content": self._generate_formatted_content(alerts_list),
+            "formatted_content": self._generate_formatted_content(alerts_list, now),
+            "stale": self.coordinator.stale,  # True while the last good data is served during an outage
         }
         
         # Add location-specific attributes
@@ -1138,24 +1330,25 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
                 "longitude": self.coordinator.longitude,
             })
         
-        return result
+        return {
+            "native_value": len(active_alerts),
+            "attributes": result,
+            "entity_picture": self._sensor_picture(max_level),
+            "status_change": _next_status_change(alerts_list, now) if self.coordinator.cap_format else None,
+        }
 
-    @property
-    def entity_picture(self):
-        """Return embedded Yr.no warning icon based on warning type and level."""
-        state = self.native_value
-        
+    def _sensor_picture(self, max_level: int):
+        """Return the icon for the highest active level of this sensor's warnings."""
         # Determine warning type from coordinator data
         warning_type = None
-        if self.coordinator.data:
-            for alert in self.coordinator.data:
-                alert_warning_type = alert.get("_warning_type", "")
-                if alert_warning_type:
-                    warning_type = alert_warning_type
-                    break
+        for alert in self.coordinator.data:
+            alert_warning_type = alert.get("_warning_type", "")
+            if alert_warning_type:
+                warning_type = alert_warning_type
+                break
         
         # Map level to color
-        level_color = ACTIVITY_LEVEL_NAMES.get(state)
+        level_color = ACTIVITY_LEVEL_NAMES.get(str(max_level))
         
         if not level_color or level_color == "green" or not warning_type:
             return None
@@ -1,4 +1,6 @@
 """Pytest configuration and fixtures for Norway Alerts tests."""
+import json
+
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from homeassistant.core import HomeAssistant
@@ -33,6 +35,10 @@ def mock_aiohttp_session():
         # Create context managers for each response
         mock_get_cms = []
         for response in responses:
+            # Mirror the JSON payload as raw bytes for code paths that read the body
+            payload = getattr(response.json, "return_value", None)
+            if isinstance(payload, (list, dict)):
+                response.read = AsyncMock(return_value=json.dumps(payload).encode())
             mock_get_cm = MagicMock()
             mock_get_cm.__aenter__ = AsyncMock(return_value=response)
             mock_get_cm.__aexit__ = AsyncMock(return_value=None)
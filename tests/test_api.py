@@ -1,4 +1,7 @@
 """Unit tests for Norway Alerts API clients."""
+import asyncio
+import json
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from aiohttp import ClientError
@@ -9,7 +12,12 @@ from custom_components.norway_alerts.api import (
     AvalancheAPI,
     MetAlertsAPI,
     WarningAPIFactory,
+    partition_warnings_by_county,
 )
+from custom_components.norway_alerts.client import NorwayAlertsHttpClient
+from custom_components.norway_alerts.hub import FetchHub, normalize_url
+from custom_components.norway_alerts.ingest import async_decode_json, project_nve_warnings
+from custom_components.norway_alerts.resilience import CircuitBreaker, CIRCUIT_OPEN, CIRCUIT_CLOSED
 
 
 class TestLandslideAPI:
@@ -121,6 +129,139 @@ class TestAvalancheAPI:
             assert warnings[0]["_warning_type"] == "avalanches"
 
 
+    @pytest.mark.asyncio
+    async def test_fetch_warnings_partial_on_region_failure(self, mock_avalanche_api_response, mock_aiohttp_session):
+        """Test that a failing region does not drop the other regions."""
+        api = AvalancheAPI(county_id="46", county_name="Vestland", lang="en", max_concurrency=2)
+        
+        summary_data = [
+            {"AvalancheWarningList": [{"RegionId": 3022, "DangerLevel": 3}]},
+            {"AvalancheWarningList": [{"RegionId": 3023, "DangerLevel": 2}]},
+        ]
+        
+        mock_summary_response = MagicMock()
+        mock_summary_response.status = 200
+        mock_summary_response.json = AsyncMock(return_value=summary_data)
+        
+        mock_detail_response = MagicMock()
+        mock_detail_response.status = 200
+        mock_detail_response.json = AsyncMock(return_value=mock_avalanche_api_response)
+        
+        mock_failed_response = MagicMock()
+        mock_failed_response.status = 500
+        
+        with patch("aiohttp.ClientSession", mock_aiohttp_session(mock_summary_response, mock_detail_response, mock_failed_response)):
+            
+            warnings = await api.fetch_warnings()
+            
+            assert len(warnings) == 1
+            assert warnings[0]["Id"] == 3022
+
+    @pytest.mark.asyncio
+    async def test_counties_share_summary_and_details(self, mock_aiohttp_session):
+        """Test that avalanche entries for different counties share downloads and conversions."""
+        summary_data = [{"AvalancheWarningList": [{"RegionId": 3022, "DangerLevel": 3}]}]
+        detail_data = [
+            {
+                "RegionId": 3022,
+                "RegionName": "Voss",
+                "DangerLevel": 3,
+                "CountyList": [{"Name": "Vestland"}],
+                "MunicipalityList": [{"Name": "Voss", "CountyId": 46}, {"Name": "Sauda", "CountyId": 11}],
+            }
+        ]
+        
+        mock_summary_response = MagicMock()
+        mock_summary_response.status = 200
+        mock_summary_response.json = AsyncMock(return_value=summary_data)
+        mock_detail_response = MagicMock()
+        mock_detail_response.status = 200
+        mock_detail_response.json = AsyncMock(return_value=detail_data)
+        
+        http_client = MagicMock()
+        http_client.session = mock_aiohttp_session(mock_summary_response, mock_detail_response).return_value
+        hub = FetchHub(ttl=60)
+        
+        vestland = AvalancheAPI("46", "Vestland", http_client=http_client, fetch_hub=hub)
+        rogaland = AvalancheAPI("11", "Rogaland", http_client=http_client, fetch_hub=hub)
+        oslo = AvalancheAPI("03", "Oslo", http_client=http_client, fetch_hub=hub)
+        
+        vestland_warnings = await vestland.fetch_warnings()
+        rogaland_warnings = await rogaland.fetch_warnings()
+        
+        assert http_client.session.get.call_count == 2
+        assert rogaland_warnings[0] is vestland_warnings[0]
+        assert await oslo.fetch_warnings() == []
+
+    @pytest.mark.asyncio
+    async def test_deadline_of_one_entry_keeps_shared_details(self, mock_aiohttp_session):
+        """Test that an entry reaching its deadline does not cancel region details shared with another entry."""
+        summary_data = [{"AvalancheWarningList": [{"RegionId": 3022, "DangerLevel": 3}]}]
+        detail_data = [
+            {"RegionId": 3022, "RegionName": "Voss", "DangerLevel": 3, "CountyList": [{"Name": "Vestland"}]}
+        ]
+        
+        mock_summary_response = MagicMock()
+        mock_summary_response.status = 200
+        mock_summary_response.json = AsyncMock(return_value=summary_data)
+        mock_detail_response = MagicMock()
+        mock_detail_response.status = 200
+        mock_detail_response.json = AsyncMock(return_value=detail_data)
+        
+        http_client = MagicMock()
+        http_client.session = mock_aiohttp_session(mock_summary_response, mock_detail_response).return_value
+        
+        async def slow_read():
+            await asyncio.sleep(0.3)
+            return json.dumps(detail_data).encode()
+        
+        mock_detail_response.read = AsyncMock(side_effect=slow_read)
+        hub = FetchHub(ttl=60)
+        hasty = AvalancheAPI("46", "Vestland", http_client=http_client, fetch_hub=hub, refresh_deadline=0.2)
+        patient = AvalancheAPI("46", "Vestland", http_client=http_client, fetch_hub=hub, refresh_deadline=30)
+        
+        async def join_later():
+            await asyncio.sleep(0.1)
+            return await patient.fetch_warnings()
+        
+        hasty_warnings, patient_warnings = await asyncio.gather(hasty.fetch_warnings(), join_later())
+        
+        assert hasty_warnings == []
+        assert [warning["Id"] for warning in patient_warnings] == [3022]
+        assert http_client.session.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_only_changed_regions_are_refetched(self, mock_avalanche_api_response, mock_aiohttp_session):
+        """Test that regions with an unchanged summary entry reuse their cached details."""
+        api = AvalancheAPI(county_id="46", county_name="Vestland", lang="en")
+        
+        def summary(publish_time):
+            response = MagicMock()
+            response.status = 200
+            response.json = AsyncMock(return_value=[
+                {"AvalancheWarningList": [{"RegionId": 3022, "DangerLevel": 3, "PublishTime": publish_time}]}
+            ])
+            return response
+        
+        mock_detail_response = MagicMock()
+        mock_detail_response.status = 200
+        mock_detail_response.json = AsyncMock(return_value=mock_avalanche_api_response)
+        
+        session = mock_aiohttp_session(
+            summary("2024-01-01T16:00:00"), mock_detail_response,
+            summary("2024-01-01T16:00:00"),
+            summary("2024-01-01T18:30:00"), mock_detail_response,
+        )
+        with patch("aiohttp.ClientSession", session):
+            first = await api.fetch_warnings()
+            second = await api.fetch_warnings()
+            assert session.return_value.get.call_count == 3
+            third = await api.fetch_warnings()
+            assert session.return_value.get.call_count == 5
+        
+        assert second == first and third == first
+
+
 class TestMetAlertsAPI:
     """Test MetAlertsAPI client."""
 
@@ -158,6 +299,36 @@ class TestMetAlertsAPI:
             
             assert len(warnings) == 1
 
+    @pytest.mark.asyncio
+    async def test_area_queries(self, mock_metalerts_api_response, mock_aiohttp_session):
+        """Test that the alert geometry is kept and indexed on first use for point, bbox and distance queries."""
+        api = MetAlertsAPI(county_id="46", county_name="Vestland", lang="en")
+        mock_metalerts_api_response["features"][0]["geometry"] = {
+            "type": "Polygon",
+            "coordinates": [[[5.0, 60.0], [6.0, 60.0], [6.0, 61.0], [5.0, 61.0], [5.0, 60.0]]],
+        }
+        
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.json = AsyncMock(return_value=mock_metalerts_api_response)
+        
+        with patch("aiohttp.ClientSession", mock_aiohttp_session(mock_response)):
+            warnings = await api.fetch_warnings()
+        
+        assert api.area_index is None
+        assert api.alerts_at(60.39, 5.32) == warnings
+        assert api.area_index is not None
+        assert api.alerts_at(59.91, 10.75) == []
+        assert api.alerts_in_bbox(60.5, 5.9, 62.0, 7.0) == warnings
+        alert, distance = api.nearest_alert(60.5, 7.0)
+        assert alert == warnings[0]
+        assert distance == pytest.approx(54.9, abs=0.5)
+        assert api.display_geometry(warnings[0]) == {
+            "type": "MultiPolygon",
+            "coordinates": [[[[5.0, 60.0], [6.0, 60.0], [6.0, 61.0], [5.0, 61.0], [5.0, 60.0]]]],
+        }
+
     @pytest.mark.asyncio
     async def test_extract_times_from_title(self):
         """Test timestamp extraction from alert title."""
@@ -172,6 +343,395 @@ class TestMetAlertsAPI:
         assert "2024-01-01T12:00:00+01:00" not in clean_title
 
 
+class TestSharedHttpClient:
+    """Test the shared pooled HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_injected_client_session_is_used(self, mock_county_api_response, mock_aiohttp_session):
+        """Test that an injected client is used instead of a new ClientSession."""
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.json = AsyncMock(return_value=mock_county_api_response)
+        
+        shared_session = mock_aiohttp_session(mock_response).return_value
+        http_client = MagicMock()
+        http_client.session = shared_session
+        
+        api = LandslideAPI(county_id="46", county_name="Vestland", lang="en", http_client=http_client)
+        
+        with patch("aiohttp.ClientSession") as mock_session_class:
+            warnings = await api.fetch_warnings()
+        
+        mock_session_class.assert_not_called()
+        shared_session.get.assert_called_once()
+        assert len(warnings) == 1
+
+    def test_factory_injects_client(self):
+        """Test that the factory passes the shared client to every API."""
+        http_client = MagicMock()
+        factory = WarningAPIFactory(county_id="46", county_name="Vestland", http_client=http_client)
+        
+        for warning_type in ("landslide", "flood", "avalanche", "metalerts"):
+            assert factory.get_api(warning_type).http_client is http_client
+
+    @pytest.mark.asyncio
+    async def test_connection_reuse_counters(self):
+        """Test that trace callbacks update the reuse counters."""
+        client = NorwayAlertsHttpClient()
+        
+        await client._count("connections_created")(None, None, None)
+        await client._count("connections_reused")(None, None, None)
+        await client._count("connections_reused")(None, None, None)
+        
+        stats = client.stats
+        assert stats["connections_created"] == 1
+        assert stats["connections_reused"] == 2
+        assert stats["reuse_ratio"] == round(2 / 3, 3)
+
+
+class TestConditionalRequests:
+    """Test ETag/Last-Modified conditional requests."""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_reuses_warnings(self, mock_county_api_response, mock_aiohttp_session):
+        """Test that a 304 response returns the previous warnings without re-parsing."""
+        ok_response = MagicMock()
+        ok_response.status = 200
+        ok_response.headers = {"Content-Type": "application/json", "ETag": '"v1"'}
+        ok_response.json = AsyncMock(return_value=mock_county_api_response)
+        not_modified_response = MagicMock()
+        not_modified_response.status = 304
+        not_modified_response.headers = {}
+        not_modified_response.json = AsyncMock(side_effect=AssertionError("304 body must not be parsed"))
+        
+        http_client = NorwayAlertsHttpClient()
+        http_client._session = mock_aiohttp_session(ok_response, not_modified_response).return_value
+        http_client._session.closed = False
+        api = LandslideAPI(county_id="46", county_name="Vestland", lang="en", http_client=http_client)
+        
+        first = await api.fetch_warnings()
+        assert api.not_modified is False
+        second = await api.fetch_warnings()
+        
+        second_headers = http_client.session.get.call_args_list[1].kwargs["headers"]
+        assert second_headers["If-None-Match"] == '"v1"'
+        assert api.not_modified is True
+        assert second == first
+        assert http_client.stats["not_modified"] == 1
+
+
+class TestIngestion:
+    """Test response decoding and NVE field projection."""
+
+    def test_projection_drops_unused_fields(self, mock_county_api_response):
+        """Test that unused NVE fields are removed and used ones kept."""
+        payload = [dict(
+            mock_county_api_response[0],
+            StationList=[{"Id": 1}],
+            MicroBlogPostList=[{"Text": "..."}],
+            MunicipalityCsvStringBefore2020="1201",
+            CountyList=[{"Id": "46", "Name": "Vestland", "MunicipalityList": [], "HighestActivityLevel": None}],
+        )]
+        
+        projected = project_nve_warnings(payload)
+        
+        assert "StationList" not in projected[0]
+        assert "MicroBlogPostList" not in projected[0]
+        assert "MunicipalityCsvStringBefore2020" not in projected[0]
+        assert projected[0]["CountyList"] == [{"Id": "46", "Name": "Vestland"}]
+        assert projected[0]["MunicipalityList"] == [{"Name": "Bergen", "Id": 4601}]
+        assert projected[0]["MainText"] == mock_county_api_response[0]["MainText"]
+
+    @pytest.mark.asyncio
+    async def test_large_bodies_are_decoded_in_executor(self, mock_county_api_response):
+        """Test that bodies above the threshold are decoded off the event loop."""
+        body = json.dumps(mock_county_api_response).encode()
+        loop = asyncio.get_running_loop()
+        
+        with patch.object(loop, "run_in_executor", wraps=loop.run_in_executor) as mock_executor:
+            small = await async_decode_json(body, project_nve_warnings, threshold=len(body) + 1)
+            large = await async_decode_json(body, project_nve_warnings, threshold=1)
+        
+        assert mock_executor.call_count == 1
+        assert small == large == project_nve_warnings(mock_county_api_response)
+
+
+class TestResilience:
+    """Test retries, the circuit breaker and stale fallbacks."""
+
+    @staticmethod
+    def _response(status, payload=None):
+        response = MagicMock()
+        response.status = status
+        response.headers = {"Content-Type": "application/json"}
+        response.json = AsyncMock(return_value=payload)
+        return response
+
+    @pytest.mark.asyncio
+    async def test_transient_error_is_retried(self, mock_county_api_response, mock_aiohttp_session):
+        """Test that a 503 is retried through the shared client."""
+        http_client = NorwayAlertsHttpClient()
+        http_client._session = mock_aiohttp_session(
+            self._response(503), self._response(200, mock_county_api_response)
+        ).return_value
+        http_client._session.closed = False
+        api = LandslideAPI(county_id="46", county_name="Vestland", lang="en", http_client=http_client)
+        
+        with patch("custom_components.norway_alerts.resilience.asyncio.sleep", AsyncMock()):
+            warnings = await api.fetch_warnings()
+        
+        assert len(warnings) == 1
+        assert api.stale is False
+        assert http_client.session.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_returns_last_good_data(self, mock_county_api_response, mock_aiohttp_session):
+        """Test that a failed refresh returns the previous warnings flagged stale."""
+        api = LandslideAPI(county_id="46", county_name="Vestland", lang="en")
+        
+        with patch("aiohttp.ClientSession", mock_aiohttp_session(self._response(200, mock_county_api_response))):
+            first = await api.fetch_warnings()
+        with patch("aiohttp.ClientSession", mock_aiohttp_session(self._response(500))):
+            second = await api.fetch_warnings()
+        
+        assert api.stale is True
+        assert second == first
+
+    def test_circuit_breaker_opens_and_recovers(self):
+        """Test that the breaker opens after repeated failures and closes after a successful trial."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0)
+        
+        breaker.record_failure()
+        assert breaker.state == CIRCUIT_CLOSED
+        breaker.record_failure()
+        assert breaker.state == CIRCUIT_OPEN
+        
+        # reset_timeout has passed: one trial request is allowed
+        assert breaker.allow_request() is True
+        breaker.record_success()
+        assert breaker.state == CIRCUIT_CLOSED
+        
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=300)
+        breaker.record_failure()
+        assert breaker.allow_request() is False
+
+    def test_circuit_breaker_allows_one_trial(self):
+        """Test that only one caller gets the half-open trial until its outcome is recorded."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+        breaker.record_failure()
+        assert breaker.allow_request() is True
+        breaker.release_trial()
+        assert breaker.allow_request() is True
+        breaker.record_success()
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is True
+
+
+class TestFetchHub:
+    """Test the cross-entry request coalescing hub."""
+
+    def test_normalize_url(self):
+        """Test that equivalent URLs share one key."""
+        assert normalize_url("HTTPS://API.met.no/alerts/?lon=5&lat=60") == normalize_url(
+            "https://api.met.no/alerts?lat=60&lon=5"
+        )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_coalesced(self):
+        """Test that concurrent fetches of one URL call upstream once."""
+        hub = FetchHub(ttl=60)
+        calls = 0
+        
+        async def fetcher():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return [{"Id": 1}]
+        
+        results = await asyncio.gather(
+            *(hub.async_fetch("https://example.com/warnings", fetcher) for _ in range(5))
+        )
+        # Within the TTL the cached payload is served
+        cached = await hub.async_fetch("https://example.com/warnings", fetcher)
+        
+        assert calls == 1
+        assert all(result is results[0] for result in results)
+        assert cached is results[0]
+        assert hub.stats == {"upstream_requests": 1, "cache_hits": 1, "coalesced": 4}
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self):
+        """Test that a failed fetch is retried by the next caller."""
+        hub = FetchHub(ttl=60)
+        
+        async def failing_fetcher():
+            raise ValueError("boom")
+        
+        async def fetcher():
+            return []
+        
+        with pytest.raises(ValueError):
+            await hub.async_fetch("https://example.com/warnings", failing_fetcher)
+        
+        assert await hub.async_fetch("https://example.com/warnings", fetcher) == []
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_detaches(self):
+        """Test that cancelling the first caller leaves the shared request running for the others."""
+        hub = FetchHub(ttl=60)
+        
+        async def fetcher():
+            await asyncio.sleep(0.05)
+            return [{"Id": 1}]
+        
+        first = asyncio.create_task(hub.async_fetch("https://example.com/warnings", fetcher))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(hub.async_fetch("https://example.com/warnings", fetcher))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        
+        assert await second == [{"Id": 1}]
+        assert first.cancelled()
+        assert hub.stats["upstream_requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_variants(self):
+        """Test that invalidating a URL drops its derived payloads but not other URLs."""
+        hub = FetchHub(ttl=60)
+        calls = 0
+        
+        async def fetcher():
+            nonlocal calls
+            calls += 1
+            return calls
+        
+        await hub.async_fetch("https://example.com/a", fetcher)
+        await hub.async_fetch("https://example.com/a", fetcher, variant="converted")
+        await hub.async_fetch("https://example.com/ab", fetcher)
+        hub.invalidate("https://example.com/a/")
+        
+        assert await hub.async_fetch("https://example.com/a", fetcher) == 4
+        assert await hub.async_fetch("https://example.com/a", fetcher, variant="converted") == 5
+        assert await hub.async_fetch("https://example.com/ab", fetcher) == 3
+
+    @pytest.mark.asyncio
+    async def test_ttl_per_payload(self):
+        """Test that a payload can be shared longer or shorter than the hub's TTL."""
+        hub = FetchHub(ttl=60)
+        calls = 0
+        
+        async def fetcher():
+            nonlocal calls
+            calls += 1
+            return calls
+        
+        assert await hub.async_fetch("https://example.com/a", fetcher, ttl=0) == 1
+        assert await hub.async_fetch("https://example.com/a", fetcher, ttl=0) == 2
+        assert await hub.async_fetch("https://example.com/b", fetcher, ttl=600) == 3
+        assert await hub.async_fetch("https://example.com/b", fetcher) == 3
+
+
+class TestBulkFetch:
+    """Test nationwide bulk fetching with local per-county partitioning."""
+
+    NATIONWIDE = [
+        {
+            "Id": 1,
+            "ActivityLevel": "2",
+            "CountyList": [{"Id": "46", "Name": "Vestland"}, {"Id": "11", "Name": "Rogaland"}],
+            "MunicipalityList": [
+                {"Id": "4601", "Name": "Bergen"},
+                {"Id": "1103", "Name": "Stavanger"},
+            ],
+        },
+        {
+            "Id": 2,
+            "ActivityLevel": "3",
+            "CountyList": [],
+            "MunicipalityList": [],
+            "MunicipalityCsvString": "301",
+        },
+    ]
+
+    def test_partition_by_county(self):
+        """Test that warnings are split per county with narrowed municipality lists."""
+        by_county = partition_warnings_by_county(self.NATIONWIDE)
+        
+        assert sorted(by_county) == ["03", "11", "46"]
+        assert [m["Name"] for m in by_county["46"][0]["MunicipalityList"]] == ["Bergen"]
+        assert by_county["11"][0]["CountyList"] == [{"Id": "11", "Name": "Rogaland"}]
+        assert by_county["03"][0]["Id"] == 2
+        # The source warning is not modified
+        assert len(self.NATIONWIDE[0]["MunicipalityList"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_counties_share_one_download(self, mock_aiohttp_session):
+        """Test that bulk entries for different counties issue a single request."""
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.json = AsyncMock(return_value=self.NATIONWIDE)
+        
+        http_client = MagicMock()
+        http_client.session = mock_aiohttp_session(mock_response).return_value
+        hub = FetchHub(ttl=60)
+        
+        vestland = LandslideAPI("46", "Vestland", http_client=http_client, fetch_hub=hub, bulk=True)
+        rogaland = LandslideAPI("11", "Rogaland", http_client=http_client, fetch_hub=hub, bulk=True)
+        
+        vestland_warnings, rogaland_warnings = await asyncio.gather(
+            vestland.fetch_warnings(), rogaland.fetch_warnings()
+        )
+        
+        assert http_client.session.get.call_count == 1
+        assert "/Warning/All/2" in http_client.session.get.call_args[0][0]
+        assert [w["MunicipalityList"][0]["Name"] for w in vestland_warnings] == ["Bergen"]
+        assert [w["MunicipalityList"][0]["Name"] for w in rogaland_warnings] == ["Stavanger"]
+
+    @pytest.mark.asyncio
+    async def test_metalerts_entries_share_one_download(self, mock_aiohttp_session):
+        """Test that bulk MetAlerts entries share one request and filter by polygon or county."""
+        def feature(alert_id, county, ring):
+            return {
+                "type": "Feature",
+                "geometry": {"type": "Polygon", "coordinates": [ring]},
+                "properties": {"id": alert_id, "county": [county], "awareness_level": "2; yellow; Moderate",
+                               "event": "wind", "title": alert_id},
+            }
+        
+        nationwide = {
+            "type": "FeatureCollection",
+            "features": [
+                feature("bergen", "46", [[5.0, 60.0], [6.0, 60.0], [6.0, 61.0], [5.0, 61.0], [5.0, 60.0]]),
+                feature("oslo", "03", [[10.0, 59.0], [11.5, 59.0], [11.5, 60.5], [10.0, 60.5], [10.0, 59.0]]),
+            ],
+        }
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.json = AsyncMock(return_value=nationwide)
+        
+        http_client = MagicMock()
+        http_client.session = mock_aiohttp_session(mock_response).return_value
+        hub = FetchHub(ttl=60)
+        
+        point = MetAlertsAPI(latitude=60.39, longitude=5.32, http_client=http_client, fetch_hub=hub, bulk=True)
+        county = MetAlertsAPI(county_id="03", county_name="Oslo", http_client=http_client, fetch_hub=hub, bulk=True)
+        
+        point_alerts, county_alerts = await asyncio.gather(point.fetch_warnings(), county.fetch_warnings())
+        
+        assert http_client.session.get.call_count == 1
+        url = http_client.session.get.call_args[0][0]
+        assert "current.json?lang=en" in url and "lat=" not in url
+        assert [alert["Id"] for alert in point_alerts] == ["bergen"]
+        assert [alert["Id"] for alert in county_alerts] == ["oslo"]
+
+
 class TestWarningAPIFactory:
     """Test WarningAPIFactory."""
 
@@ -0,0 +1,66 @@
+"""Unit tests for the avalanche region helpers."""
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.norway_alerts.avalanche import RegionCountyTable, county_shares, warning_positions
+
+REGION = {
+    "RegionId": 3022,
+    "CountyList": [{"Name": "Vestland"}],
+    "MunicipalityList": [
+        {"Name": "Voss", "CountyId": 46},
+        {"Name": "Aurland", "CountyId": "46"},
+        {"Name": "Hol", "Id": "3324"},
+        {"Name": "Ukjent"},
+    ],
+}
+
+
+class TestRegionCountyTable:
+    """Test RegionCountyTable."""
+
+    def test_county_shares(self):
+        """Test the share of municipalities per county."""
+        assert county_shares(REGION["MunicipalityList"]) == {"46": 0.5, "33": 0.25}
+        assert county_shares([]) == {}
+
+    def test_relevance(self):
+        """Test relevance by county name and by municipality share."""
+        table = RegionCountyTable()
+
+        assert table.is_relevant(3022, REGION, "46", "Vestland")
+        assert table.is_relevant(3022, REGION, "33", "Buskerud")
+        assert not table.is_relevant(3022, REGION, "33", "Buskerud", threshold=0.3)
+        assert not table.is_relevant(3022, REGION, "03", "Oslo")
+
+    def test_rows_are_reused_until_outdated(self):
+        """Test that a region is only recomputed once its row is older than max_age."""
+        table = RegionCountyTable(max_age=3600)
+
+        with patch("custom_components.norway_alerts.avalanche.time.time", return_value=1000.0):
+            first = table.row(3022, REGION)
+            # Later data for the same region is not looked at while the row is fresh
+            assert table.row("3022", {"CountyList": []}) is first
+        with patch("custom_components.norway_alerts.avalanche.time.time", return_value=5000.0):
+            assert table.row(3022, {"CountyList": []})["counties"] == []
+
+
+class TestWarningPositions:
+    """Test converting region points to longitude/latitude."""
+
+    def test_positions(self):
+        """Test zone 33 and zone 32 points and warnings without a valid point."""
+        warnings = [
+            {"UtmZone": 33, "UtmEast": 262560.4822, "UtmNorth": 6649443.5840},
+            {"UtmZone": None, "UtmEast": None, "UtmNorth": None},
+            {"UtmZone": "32", "UtmEast": "297353.9327", "UtmNorth": "6700648.3451"},
+            {"UtmZone": 33, "UtmEast": "", "UtmNorth": 6649443.5840},
+        ]
+
+        positions = warning_positions(warnings)
+
+        assert positions[0] == pytest.approx((10.7522, 59.9139), abs=1e-7)
+        assert positions[1] is None
+        assert positions[2] == pytest.approx((5.3221, 60.3913), abs=1e-7)
+        assert positions[3] is None
@@ -0,0 +1,142 @@
+"""Unit tests for the preprocessed boundary asset."""
+import asyncio
+import json
+import os
+import zipfile
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.norway_alerts.boundary_asset import (
+    BoundaryAsset,
+    async_build_boundary_asset,
+    build_boundary_asset,
+    ensure_boundary_asset,
+    read_source_hash,
+    source_hash,
+)
+from custom_components.norway_alerts.municipality_lookup import (
+    DEFAULT_BOUNDARY_ASSET,
+    DEFAULT_BOUNDARY_SOURCE,
+    AreaBoundaries,
+    async_get_county_boundaries,
+    get_county_from_coordinates,
+    load_boundary_asset,
+)
+from custom_components.norway_alerts.projection import UTM33
+
+
+def _write_archive(path, counties):
+    """Write a Kartverket style county archive with one square (UTM 33) per county."""
+    features = []
+    for county_id, (longitude, latitude) in counties.items():
+        x, y = UTM33.forward(longitude, latitude)
+        ring = [[x - 10000, y - 10000], [x + 10000, y - 10000], [x + 10000, y + 10000], [x - 10000, y + 10000]]
+        features.append({
+            "type": "Feature",
+            "geometry": {"type": "Polygon", "coordinates": [ring]},
+            "properties": {"fylkesnummer": county_id, "fylkesnavn": f"County {county_id}"},
+        })
+    layer = {"Fylke": {
+        "type": "FeatureCollection",
+        "crs": {"type": "name", "properties": {"name": "EPSG:25833"}},
+        "features": features,
+    }}
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("Fylke_GeoJSON.geojson", json.dumps(layer))
+
+
+class TestBoundaryAsset:
+    """Test building and memory-mapping the boundary asset."""
+
+    def test_build_and_map(self, tmp_path):
+        """Test that the mapped asset answers lookups like the source polygons."""
+        source = tmp_path / "fylker.zip"
+        asset_path = tmp_path / "data" / "boundaries.bin"
+        _write_archive(source, {"46": (5.32, 60.39), "55": (18.96, 69.65)})
+
+        build_boundary_asset(str(source), str(asset_path))
+        asset = BoundaryAsset(str(asset_path))
+
+        assert len(asset) == 2
+        assert asset.county_ids == ["46", "55"]
+        assert asset.names == ["Vestland", "Troms"]
+        assert asset.source_hash == source_hash(str(source))
+        assert isinstance(asset.coords, memoryview)
+        # Two closed rings of five vertices
+        assert list(asset.ring_starts) == [0, 5, 10]
+        boundaries = AreaBoundaries(asset.names, asset.county_ids, asset.grid, scale=asset.scale)
+        assert get_county_from_coordinates(60.39, 5.32, boundaries) == "46"
+        assert get_county_from_coordinates(69.65, 18.96, boundaries) == "55"
+        assert get_county_from_coordinates(63.43, 10.39, boundaries) is None
+
+    def test_rebuilt_when_source_changes(self, tmp_path):
+        """Test that the asset is rebuilt only when the source archive's hash changes."""
+        source = tmp_path / "fylker.zip"
+        asset_path = tmp_path / "boundaries.bin"
+        _write_archive(source, {"46": (5.32, 60.39)})
+
+        assert ensure_boundary_asset(str(source), str(asset_path))
+        assert not ensure_boundary_asset(str(source), str(asset_path))
+
+        _write_archive(source, {"03": (10.75, 59.91)})
+        assert ensure_boundary_asset(str(source), str(asset_path))
+        assert read_source_hash(str(asset_path)) == source_hash(str(source))
+        boundaries = load_boundary_asset(str(asset_path), str(source))
+        assert get_county_from_coordinates(59.91, 10.75, boundaries) == "03"
+
+        # Without the source archive the shipped asset is used as is
+        assert not ensure_boundary_asset(str(tmp_path / "missing.zip"), str(asset_path))
+
+    async def test_build_in_worker_process(self, tmp_path):
+        """Test that the asset built in a worker process is identical to one built in process."""
+        source = tmp_path / "fylker.zip"
+        _write_archive(source, {"46": (5.32, 60.39), "03": (10.75, 59.91)})
+        build_boundary_asset(str(source), str(tmp_path / "local.bin"))
+
+        await async_build_boundary_asset(str(source), str(tmp_path / "worker.bin"))
+
+        assert (tmp_path / "worker.bin").read_bytes() == (tmp_path / "local.bin").read_bytes()
+
+    async def test_county_boundaries_loaded_once(self, mock_hass):
+        """Test that concurrent callers share one load of the shipped asset."""
+        async def run_job(target, *args):
+            return target(*args)
+
+        mock_hass.async_add_executor_job = run_job
+        mock_hass.async_create_task = asyncio.ensure_future
+
+        with patch(
+            "custom_components.norway_alerts.municipality_lookup.async_build_boundary_asset"
+        ) as mock_build:
+            first, second = await asyncio.gather(
+                async_get_county_boundaries(mock_hass), async_get_county_boundaries(mock_hass)
+            )
+
+        assert first is second
+        assert len(first) == 15
+        mock_build.assert_not_called()
+
+    def test_not_an_asset(self, tmp_path):
+        """Test that other files are rejected."""
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"x" * 256)
+
+        assert read_source_hash(str(path)) is None
+        with pytest.raises(ValueError):
+            BoundaryAsset(str(path))
+
+    @pytest.mark.skipif(not os.path.exists(DEFAULT_BOUNDARY_SOURCE), reason="County boundaries not available")
+    def test_bundled_asset_is_current(self):
+        """Test that the shipped asset was built from the bundled county archive."""
+        assert read_source_hash(DEFAULT_BOUNDARY_ASSET) == source_hash(DEFAULT_BOUNDARY_SOURCE)
+
+    def test_bundled_asset(self):
+        """Test county lookups against the shipped asset."""
+        boundaries = load_boundary_asset()
+
+        assert len(boundaries) == 15
+        assert get_county_from_coordinates(59.9139, 10.7522, boundaries) == "03"  # Oslo
+        assert get_county_from_coordinates(60.3913, 5.3221, boundaries) == "46"  # Bergen
+        assert get_county_from_coordinates(69.9689, 23.2716, boundaries) == "56"  # Alta
+        assert get_county_from_coordinates(59.3293, 18.0686, boundaries) is None  # Stockholm
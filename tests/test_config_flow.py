@@ -1,4 +1,6 @@
 """Unit tests for Norway Alerts config flow."""
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from homeassistant import config_entries, data_entry_flow
@@ -10,11 +12,25 @@ from custom_components.norway_alerts.const import (
     CONF_COUNTY_NAME,
     CONF_WARNING_TYPE,
     CONF_LANG,
+    CONF_LATITUDE,
+    CONF_LONGITUDE,
+    CONF_MUNICIPALITY_FILTER,
     WARNING_TYPE_LANDSLIDE,
     WARNING_TYPE_METALERTS,
 )
 
 
+def _run_jobs_inline(hass, latitude=60.39, longitude=5.32):
+    """Run executor jobs and tasks of the mock hass on the test loop, with its home in Bergen."""
+    async def run_job(target, *args):
+        return target(*args)
+
+    hass.async_add_executor_job = run_job
+    hass.async_create_task = asyncio.ensure_future
+    hass.config = MagicMock(latitude=latitude, longitude=longitude)
+    return hass
+
+
 class TestConfigFlow:
     """Test Norway Alerts config flow."""
 
@@ -63,3 +79,72 @@ class TestConfigFlow:
         assert flow is not None
         # Options flow testing requires complex HA infrastructure
         # This basic test ensures the class exists and is importable
+
+    @pytest.mark.asyncio
+    async def test_location_form_defaults_to_home_county(self, mock_hass):
+        """Test that the county and municipality filter are resolved from Home Assistant's location."""
+        from custom_components.norway_alerts.config_flow import NorwayAlertsConfigFlow
+
+        flow = NorwayAlertsConfigFlow()
+        flow.hass = _run_jobs_inline(mock_hass, 60.45, 5.15)
+        flow.context = {"warning_type": WARNING_TYPE_LANDSLIDE}
+
+        result = await flow.async_step_location()
+
+        defaults = {str(key): key.default() for key in result["data_schema"].schema if callable(key.default)}
+        assert defaults[CONF_COUNTY_ID] == "46"
+        assert defaults[CONF_MUNICIPALITY_FILTER] == "Askøy"
+
+
+class TestSiteCoordinates:
+    """Test resolving the county of entered coordinates."""
+
+    @pytest.mark.asyncio
+    async def test_resolve_location(self, mock_hass):
+        """Test county and municipality suggestions from the bundled boundaries."""
+        from custom_components.norway_alerts.config_flow import async_resolve_location
+
+        hass = _run_jobs_inline(mock_hass)
+
+        assert await async_resolve_location(hass, 60.45, 5.15) == ("46", "Askøy")
+        assert await async_resolve_location(hass, 59.9139, 10.7522) == ("03", "")
+        assert await async_resolve_location(hass, 59.3293, 18.0686) == (None, "")
+        assert await async_resolve_location(hass, None, None) == (None, "")
+
+    @pytest.mark.asyncio
+    async def test_coordinates_select_county(self, mock_hass):
+        """Test that site coordinates replace the county and a pre-filled or other county's filter."""
+        from custom_components.norway_alerts.config_flow import async_apply_site_coordinates
+
+        hass = _run_jobs_inline(mock_hass)
+        errors = {}
+
+        user_input = {CONF_COUNTY_ID: "46", CONF_MUNICIPALITY_FILTER: "Bergen", CONF_LATITUDE: 61.11, CONF_LONGITUDE: 10.46}
+        await async_apply_site_coordinates(hass, user_input, errors)
+        assert user_input == {CONF_COUNTY_ID: "34", CONF_MUNICIPALITY_FILTER: ""}  # Lillehammer, Innlandet
+
+        user_input = {CONF_COUNTY_ID: "46", CONF_MUNICIPALITY_FILTER: "Bergen", CONF_LATITUDE: 60.45, CONF_LONGITUDE: 5.15}
+        await async_apply_site_coordinates(hass, user_input, errors)
+        assert user_input[CONF_MUNICIPALITY_FILTER] == "Askøy"
+
+        user_input = {CONF_COUNTY_ID: "46", CONF_MUNICIPALITY_FILTER: "Voss", CONF_LATITUDE: 60.45, CONF_LONGITUDE: 5.15}
+        await async_apply_site_coordinates(hass, user_input, errors)
+        assert user_input[CONF_MUNICIPALITY_FILTER] == "Voss"
+        assert errors == {}
+
+    @pytest.mark.asyncio
+    async def test_invalid_coordinates(self, mock_hass):
+        """Test incomplete coordinates and coordinates outside Norway."""
+        from custom_components.norway_alerts.config_flow import async_apply_site_coordinates
+
+        hass = _run_jobs_inline(mock_hass)
+
+        errors = {}
+        with pytest.raises(ValueError):
+            await async_apply_site_coordinates(hass, {CONF_LATITUDE: 60.0}, errors)
+        assert errors["base"] == "missing_location"
+
+        errors = {}
+        with pytest.raises(ValueError):
+            await async_apply_site_coordinates(hass, {CONF_LATITUDE: 59.3293, CONF_LONGITUDE: 18.0686}, errors)
+        assert errors["base"] == "outside_norway"
@@ -0,0 +1,54 @@
+"""Unit tests for the municipality filter."""
+from custom_components.norway_alerts.filtering import (
+    MunicipalityFilter,
+    MunicipalityIndex,
+    mask_counties,
+    normalize_name,
+    parse_municipality_csv,
+)
+
+ALERTS = [
+    {"Id": 1, "MunicipalityList": [{"Id": 4601, "Name": "Bergen"}, {"Id": 4621, "Name": "Voss"}]},
+    {"Id": 2, "MunicipalityList": [{"Id": 3201, "Name": "Bærum"}]},
+    {"Id": 3, "MunicipalityList": [{"Id": 5501, "Name": "Tromsø"}, {"Id": 4601, "Name": "Bergen"}]},
+    {"Id": 4, "area": "Vestland"},
+]
+
+
+class TestMunicipalityFilter:
+    """Test MunicipalityFilter and MunicipalityIndex."""
+
+    def test_normalize_name(self):
+        """Test Norwegian-aware case folding."""
+        assert normalize_name("BÆRUM") == normalize_name("Baerum") == "bærum"
+        assert normalize_name("Tromsoe") == normalize_name("Tromsö") == "tromsø"
+        assert normalize_name("Aalesund") == "ålesund"
+        assert normalize_name(None) == ""
+
+    def test_select_by_name_and_id(self):
+        """Test that names match as substrings and numbers match Ids."""
+        index = MunicipalityIndex(ALERTS)
+
+        assert [a["Id"] for a in MunicipalityFilter("bergen").select(index)] == [1, 3]
+        assert [a["Id"] for a in MunicipalityFilter("Baerum, tromso").select(index)] == [2]
+        assert [a["Id"] for a in MunicipalityFilter(" Tromsoe , 4621").select(index)] == [1, 3]
+        assert MunicipalityFilter("Oslo").select(index) == []
+
+    def test_empty_terms_are_ignored(self):
+        """Test that blank filters and trailing commas do not match everything."""
+        index = MunicipalityIndex(ALERTS)
+
+        assert not MunicipalityFilter(" , ")
+        assert [a["Id"] for a in MunicipalityFilter("Voss,").select(index)] == [1]
+
+
+class TestMunicipalityMasks:
+    """Test municipality bitsets."""
+
+    def test_county_membership(self):
+        """Test that the counties of a warning are read off its bitset."""
+        mask = parse_municipality_csv("4601;4627;1133;301")
+
+        assert mask == (1 << 4601) | (1 << 4627) | (1 << 1133) | (1 << 301)
+        assert mask_counties(mask) == ["03", "11", "46"]
+        assert parse_municipality_csv("") == 0
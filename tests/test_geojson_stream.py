@@ -0,0 +1,64 @@
+"""Unit tests for the incremental GeoJSON reader."""
+import io
+import json
+
+import pytest
+
+from custom_components.norway_alerts.geojson_stream import iter_features
+
+
+def _features(count):
+    return [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [10.123456789 * i, -1e-7 * i]},
+            "properties": {"id": i, "name": f"Område {i}", "valid": i % 2 == 0, "note": None},
+        }
+        for i in range(count)
+    ]
+
+
+class TestGeoJSONStream:
+    """Test feature-by-feature decoding of GeoJSON text streams."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+    def test_kartverket_layer(self, chunk_size):
+        """Test a collection nested under the layer name, split at every possible chunk boundary."""
+        features = _features(20)
+        document = json.dumps({"Fylke": {
+            "type": "FeatureCollection",
+            "crs": {"type": "name", "properties": {"name": "EPSG:25833"}},
+            "features": features,
+        }}, indent="\t", ensure_ascii=False)
+        header = {}
+
+        assert list(iter_features(io.StringIO(document), header, chunk_size=chunk_size)) == features
+        assert header["type"] == "FeatureCollection"
+        assert header["crs"]["properties"]["name"] == "EPSG:25833"
+
+    def test_plain_collection(self):
+        """Test a top level collection with members after the features and an empty collection."""
+        features = _features(3)
+        header = {}
+        document = json.dumps({"type": "FeatureCollection", "features": features, "bbox": [0, 0, 1, 1], "count": 3})
+
+        assert list(iter_features(io.StringIO(document), header, chunk_size=5)) == features
+        assert header["bbox"] == [0, 0, 1, 1]
+        assert header["count"] == 3
+        assert list(iter_features(io.StringIO('{"type": "FeatureCollection", "features": []}'))) == []
+
+    def test_features_are_decoded_lazily(self):
+        """Test that features are yielded before the rest of the stream is read."""
+        document = json.dumps({"type": "FeatureCollection", "features": _features(100)})
+        stream = io.StringIO(document)
+
+        first = next(iter_features(stream, chunk_size=256))
+
+        assert first["properties"]["id"] == 0
+        assert stream.tell() < len(document) / 10
+
+    @pytest.mark.parametrize("document", ['[1, 2]', '{"features": [{"type": "Feature"}', '{"features": [1 2]}'])
+    def test_invalid_document(self, document):
+        """Test that malformed or truncated documents raise ValueError."""
+        with pytest.raises(ValueError):
+            list(iter_features(io.StringIO(document), chunk_size=4))
@@ -0,0 +1,208 @@
+"""Unit tests for the geometry helpers."""
+import math
+import random
+
+import pytest
+
+from custom_components.norway_alerts.geometry import (
+    BoundaryGrid,
+    PolygonIndex,
+    geometry_polygons,
+    point_in_polygon,
+    point_in_ring,
+    simplify_line,
+    simplify_rings,
+)
+
+SQUARE = [[0.0, 0.0], [10.0, 0.0], [10.0, 10.0], [0.0, 10.0], [0.0, 0.0]]
+HOLE = [[4.0, 4.0], [6.0, 4.0], [6.0, 6.0], [4.0, 6.0], [4.0, 4.0]]
+FAR = [[20.0, 20.0], [30.0, 20.0], [30.0, 30.0], [20.0, 30.0], [20.0, 20.0]]
+
+
+def _feature(geometry):
+    return {"type": "Feature", "geometry": geometry, "properties": {}}
+
+
+class TestGeometry:
+    """Test point-in-polygon lookups and the polygon index."""
+
+    def test_point_in_polygon_with_hole(self):
+        """Test that points in a hole are outside the polygon."""
+        polygon = [SQUARE, HOLE]
+
+        assert point_in_polygon(2.0, 2.0, polygon)
+        assert not point_in_polygon(5.0, 5.0, polygon)
+        assert not point_in_polygon(11.0, 5.0, polygon)
+
+    def test_geometry_polygons(self):
+        """Test that Polygon, MultiPolygon and GeometryCollection geometries are flattened."""
+        multi = {"type": "MultiPolygon", "coordinates": [[SQUARE], [FAR]]}
+        collection = {"type": "GeometryCollection", "geometries": [{"type": "Polygon", "coordinates": [SQUARE]}, multi]}
+
+        assert geometry_polygons({"type": "Polygon", "coordinates": [SQUARE]}) == [[SQUARE]]
+        assert len(geometry_polygons(multi)) == 2
+        assert len(geometry_polygons(collection)) == 3
+        assert geometry_polygons({"type": "Point", "coordinates": [1.0, 1.0]}) == []
+        assert geometry_polygons(None) == []
+
+    def test_features_at(self):
+        """Test that the index returns each containing feature once, in feature order."""
+        index = PolygonIndex([
+            _feature({"type": "MultiPolygon", "coordinates": [[FAR], [SQUARE]]}),
+            _feature({"type": "Polygon", "coordinates": [SQUARE, HOLE]}),
+            _feature(None),
+            _feature({"type": "Polygon", "coordinates": [SQUARE]}),
+        ])
+
+        assert len(index) == 4
+        assert index.features_at(2.0, 2.0) == [0, 1, 3]
+        assert index.features_at(5.0, 5.0) == [0, 3]
+        assert index.features_at(25.0, 25.0) == [0]
+        assert index.features_at(-1.0, -1.0) == []
+
+    def test_features_in_bbox(self):
+        """Test bounding box queries, including boxes inside a polygon or its hole."""
+        index = PolygonIndex([
+            _feature({"type": "Polygon", "coordinates": [SQUARE, HOLE]}),
+            _feature({"type": "Polygon", "coordinates": [FAR]}),
+        ])
+
+        assert index.features_in_bbox((8.0, 8.0, 22.0, 22.0)) == [0, 1]
+        assert index.features_in_bbox((1.0, 1.0, 2.0, 2.0)) == [0]
+        assert index.features_in_bbox((4.5, 4.5, 5.5, 5.5)) == []
+        assert index.features_in_bbox((11.0, 11.0, 19.0, 19.0)) == []
+
+    def test_nearest(self):
+        """Test the nearest area and its distance in km."""
+        index = PolygonIndex([
+            _feature({"type": "Polygon", "coordinates": [SQUARE]}),
+            _feature({"type": "Polygon", "coordinates": [FAR]}),
+        ])
+
+        assert index.nearest(5.0, 5.0) == (0, 0.0)
+        position, distance = index.nearest(12.0, 5.0)
+        assert position == 0
+        assert distance == pytest.approx(2 * 111.32 * math.cos(math.radians(5.0)), rel=1e-6)
+        assert index.nearest(19.0, 25.0)[0] == 1
+        assert PolygonIndex([]).nearest(0.0, 0.0) is None
+
+    def test_matches_linear_scan(self):
+        """Test that the R-tree finds the same features as testing every polygon."""
+        rng = random.Random(7)
+        features = []
+        for _ in range(300):
+            x, y = rng.uniform(4.0, 31.0), rng.uniform(57.0, 71.0)
+            size = rng.uniform(0.05, 1.5)
+            ring = [[x, y], [x + size, y], [x + size, y + size], [x, y + size], [x, y]]
+            features.append(_feature({"type": "Polygon", "coordinates": [ring]}))
+        index = PolygonIndex(features)
+
+        for _ in range(200):
+            x, y = rng.uniform(4.0, 31.0), rng.uniform(57.0, 71.0)
+            expected = [
+                position for position, feature in enumerate(features)
+                if point_in_polygon(x, y, feature["geometry"]["coordinates"])
+            ]
+            assert index.features_at(x, y) == expected
+
+    def test_coarse_level_matches_exact(self):
+        """Test that point queries using the simplified level agree with the exact polygons."""
+        rng = random.Random(3)
+        features = []
+        for _ in range(30):
+            cx, cy, radius = rng.uniform(5.0, 30.0), rng.uniform(58.0, 70.0), rng.uniform(0.2, 2.0)
+            ring = [
+                [cx + radius * (1 + 0.3 * math.sin(5 * t)) * math.cos(t), cy + radius * math.sin(t)]
+                for t in (2 * math.pi * i / 500 for i in range(500))
+            ]
+            features.append(_feature({"type": "Polygon", "coordinates": [ring + ring[:1]]}))
+        exact = PolygonIndex(features)
+        coarse = PolygonIndex(features, coarse_tolerance=0.01)
+
+        assert len(coarse._coarse_coords) < len(coarse._coords) / 2
+        for _ in range(500):
+            x, y = rng.uniform(3.0, 33.0), rng.uniform(56.0, 72.0)
+            assert coarse.features_at(x, y) == exact.features_at(x, y)
+
+    def test_display_geometry(self):
+        """Test the simplified MultiPolygon of a feature."""
+        wavy = [[x / 10, 0.001 * (x % 2)] for x in range(101)] + [[10.0, 10.0], [0.0, 10.0], [0.0, 0.0]]
+        index = PolygonIndex([
+            _feature({"type": "Polygon", "coordinates": [FAR]}),
+            _feature({"type": "MultiPolygon", "coordinates": [[wavy, HOLE], [FAR]]}),
+        ])
+
+        geometry = index.display_geometry(1, 0.01)
+        assert geometry["type"] == "MultiPolygon"
+        assert len(geometry["coordinates"]) == 2
+        assert geometry["coordinates"][0] == [SQUARE, HOLE]
+        assert index.display_geometry(1, 0.01) is geometry
+        assert index.display_geometry(2, 0.01) is None
+
+
+class TestSimplification:
+    """Test Douglas-Peucker line and ring simplification."""
+
+    def test_simplify_line(self):
+        """Test that vertices within the tolerance are dropped and the ends are kept."""
+        line = [(0.0, 0.0), (1.0, 0.05), (2.0, -0.05), (3.0, 2.0), (4.0, 0.0)]
+
+        assert simplify_line(line, 0.1) == [(0.0, 0.0), (2.0, -0.05), (3.0, 2.0), (4.0, 0.0)]
+        assert simplify_line(line, 5.0) == [(0.0, 0.0), (4.0, 0.0)]
+        assert simplify_line(line, 0.0) == line
+
+    def test_shared_border_stays_shared(self):
+        """Test that neighbouring rings are simplified identically along their common border."""
+        rng = random.Random(5)
+        border = [(1.0, y / 50) for y in range(51)]
+        border = [(x + rng.uniform(-0.005, 0.005), y) if 0 < y < 1 else (x, y) for x, y in border]
+        left = [(0.0, 1.0), (0.0, 0.0)] + border
+        right = border[::-1] + [(2.0, 0.0), (2.0, 1.0)]
+
+        simple_left, simple_right = simplify_rings([left + left[:1], right + right[:1]], 0.01)
+        shared = {point for point in simple_left if point[0] > 0.5 and 0 < point[1] < 1}
+        assert shared == {point for point in simple_right if point[0] < 1.5 and 0 < point[1] < 1}
+        assert len(shared) < len(border) - 2
+        assert (1.0, 0.0) in simple_left and (1.0, 1.0) in simple_right
+
+    def test_small_rings_are_kept(self):
+        """Test that rings never collapse below a triangle."""
+        triangle = [(0.0, 0.0), (1.0, 0.0), (0.0, 0.001), (0.0, 0.0)]
+
+        assert simplify_rings([triangle], 1.0) == [triangle]
+        assert simplify_rings([SQUARE], 100.0)[0][0] == simplify_rings([SQUARE], 100.0)[0][-1]
+
+
+class TestBoundaryGrid:
+    """Test the grid index over non-overlapping areas."""
+
+    AREAS = [
+        [SQUARE, HOLE],  # Square with a hole
+        [HOLE],  # The hole is another area
+        [FAR],
+    ]
+
+    def test_area_at(self):
+        """Test lookups in cells with and without boundary edges."""
+        grid = BoundaryGrid.from_areas(self.AREAS, cell_size=3.0)
+
+        assert grid.area_at(1.0, 1.0) == 0
+        assert grid.area_at(5.0, 5.0) == 1
+        assert grid.area_at(3.9, 5.0) == 0
+        assert grid.area_at(25.0, 25.0) == 2
+        assert grid.area_at(15.0, 15.0) is None
+        assert grid.area_at(-5.0, 5.0) is None
+        assert BoundaryGrid.from_areas([], cell_size=1.0).area_at(0.0, 0.0) is None
+
+    def test_matches_linear_scan(self):
+        """Test that the grid agrees with the even-odd test of every area."""
+        rng = random.Random(11)
+        grid = BoundaryGrid.from_areas(self.AREAS, cell_size=1.7)
+
+        for _ in range(2000):
+            x, y = rng.uniform(-1.0, 31.0), rng.uniform(-1.0, 31.0)
+            expected = [
+                area for area, rings in enumerate(self.AREAS)
+                if sum(point_in_ring(x, y, ring) for ring in rings) % 2
+            ]
+            assert grid.area_at(x, y) == (expected[0] if expected else None)
@@ -0,0 +1,59 @@
+"""Unit tests for the Norway Alerts alert model."""
+import json
+
+import pytest
+
+from custom_components.norway_alerts.models import Alert, Area, alerts_from_mappings
+
+
+class TestAlert:
+    """Test the slotted Alert record."""
+
+    def test_mapping_interface(self, mock_county_api_response):
+        """Test that an alert reads like the upstream dict."""
+        alert = Alert.from_mapping(mock_county_api_response[0], "landslide")
+
+        assert alert["Id"] == 123456
+        assert alert["ActivityLevel"] == "2"
+        assert alert["_warning_type"] == "landslide"
+        assert alert.get("MunicipalityList")[0]["Name"] == "Bergen"
+        assert alert.get("DangerLevel") == "Level 2"
+        assert alert.get("WarningText") is None
+        assert "MasterId" in alert
+        assert "NextWarningTime" not in alert
+
+    def test_round_trip(self, mock_county_api_response):
+        """Test that as_dict/from_mapping round-trip through JSON."""
+        alert = Alert.from_mapping(mock_county_api_response[0], "flood")
+
+        restored = Alert.from_mapping(json.loads(json.dumps(alert.as_dict())))
+
+        assert restored == alert
+        assert alert == dict(mock_county_api_response[0], _warning_type="flood")
+
+    def test_alert_is_read_only(self, mock_county_api_response):
+        """Test that alerts cannot be modified in place."""
+        alert = Alert.from_mapping(mock_county_api_response[0])
+
+        with pytest.raises(TypeError):
+            alert["ActivityLevel"] = "3"
+        with pytest.raises(AttributeError):
+            alert.extra = 1
+
+    def test_repeated_values_are_shared(self):
+        """Test that texts and areas repeated across rows are stored once."""
+        rows = [
+            {
+                "Id": 1,
+                "MainText": "".join(["Moderat fare ", "for flom"]),
+                "MunicipalityList": [{"Id": "4601", "Name": "".join(["Ber", "gen"])}],
+            }
+            for _ in range(2)
+        ]
+        assert rows[0]["MainText"] is not rows[1]["MainText"]
+
+        first, second = alerts_from_mappings(rows, "flood")
+
+        assert first["MainText"] is second["MainText"]
+        assert first["MunicipalityList"][0] is second["MunicipalityList"][0]
+        assert isinstance(first["MunicipalityList"][0], Area)
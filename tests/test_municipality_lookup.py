@@ -0,0 +1,121 @@
+"""Unit tests for the coordinate to municipality/county lookup."""
+import json
+import os
+import zipfile
+
+import pytest
+
+from custom_components.norway_alerts.municipality_lookup import (
+    get_county_from_coordinates,
+    get_municipality_from_coordinates,
+    get_municipality_from_coordinates_precise,
+    load_geojson_boundaries,
+)
+from custom_components.norway_alerts.projection import UTM33
+
+FYLKER_ZIP = os.path.join(
+    os.path.dirname(__file__), "..", "municipalities", "Basisdata_0000_Norge_25833_Fylker_GeoJSON.zip"
+)
+
+
+def _square(longitude, latitude, size):
+    """Return a UTM 33 ring of a square around a point (size in metres)."""
+    x, y = UTM33.forward(longitude, latitude)
+    half = size / 2
+    return [[x - half, y - half], [x + half, y - half], [x + half, y + half], [x - half, y + half], [x - half, y - half]]
+
+
+class TestMunicipalityLookup:
+    """Test the bounding box and boundary lookups."""
+
+    def test_bounding_box_prefers_smallest_match(self):
+        """Test that overlapping boxes resolve to the most specific municipality."""
+        # Inside both the Askøy box and the larger Bergen box
+        assert get_municipality_from_coordinates(60.45, 5.15) == ("Askøy", "46")
+        assert get_municipality_from_coordinates(60.39, 5.32) == ("Bergen", "46")
+        assert get_municipality_from_coordinates(0.0, 0.0) is None
+
+    def test_load_zipped_kartverket_layer(self, tmp_path):
+        """Test loading a zipped Kartverket layer in UTM 33 (areas preferred over boundary lines)."""
+        layer = {
+            "Fylke": {
+                "type": "FeatureCollection",
+                "crs": {"type": "name", "properties": {"name": "EPSG:25833"}},
+                "features": [
+                    {
+                        "type": "Feature",
+                        "geometry": {"type": "MultiPolygon", "coordinates": [[_square(5.32, 60.39, 20000)]]},
+                        "properties": {"fylkesnummer": "46", "fylkesnavn": "Vestland"},
+                    },
+                    {
+                        "type": "Feature",
+                        "geometry": {"type": "Polygon", "coordinates": [_square(18.96, 69.65, 20000)]},
+                        "properties": {"fylkesnummer": "55", "fylkesnavn": "Troms - Romsa - Tromssa"},
+                    },
+                ],
+            }
+        }
+        lines = {"type": "FeatureCollection", "features": [
+            {"type": "Feature", "geometry": {"type": "LineString", "coordinates": [[0, 0], [1, 1]]}, "properties": {}}
+        ]}
+        path = tmp_path / "fylker.zip"
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("Grense_GeoJSON.geojson", json.dumps(lines))
+            archive.writestr("Fylke_GeoJSON.geojson", json.dumps(layer))
+
+        boundaries = load_geojson_boundaries(str(path))
+
+        assert len(boundaries) == 2
+        assert get_municipality_from_coordinates_precise(60.39, 5.32, boundaries) == ("Vestland", "46")
+        assert get_county_from_coordinates(69.65, 18.96, boundaries) == "55"
+        assert get_county_from_coordinates(59.91, 10.75, boundaries) is None
+
+    def test_load_municipality_geojson(self, tmp_path):
+        """Test loading longitude/latitude municipality boundaries."""
+        collection = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Polygon", "coordinates": [[[5.0, 60.0], [6.0, 60.0], [6.0, 61.0], [5.0, 60.0]]]},
+                    "properties": {"kommunenummer": "4601", "kommunenavn": "Bergen"},
+                },
+            ],
+        }
+        path = tmp_path / "kommuner.geojson"
+        path.write_text(json.dumps(collection), encoding="utf-8")
+
+        boundaries = load_geojson_boundaries(str(path))
+
+        assert get_municipality_from_coordinates_precise(60.2, 5.8, boundaries) == ("Bergen", "46")
+        assert get_municipality_from_coordinates_precise(60.8, 5.2, boundaries) is None
+
+    def test_unsupported_crs(self, tmp_path):
+        """Test that boundaries in an unknown projection are rejected."""
+        path = tmp_path / "other.geojson"
+        path.write_text(json.dumps({
+            "type": "FeatureCollection",
+            "crs": {"type": "name", "properties": {"name": "EPSG:3857"}},
+            "features": [],
+        }), encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            load_geojson_boundaries(str(path))
+
+    @pytest.mark.skipif(not os.path.exists(FYLKER_ZIP), reason="County boundaries not available")
+    def test_bundled_county_boundaries(self):
+        """Test county lookups against the bundled Kartverket county boundaries."""
+        boundaries = load_geojson_boundaries(FYLKER_ZIP)
+
+        assert get_county_from_coordinates(59.9139, 10.7522, boundaries) == "03"  # Oslo
+        assert get_county_from_coordinates(60.3913, 5.3221, boundaries) == "46"  # Bergen
+        assert get_county_from_coordinates(63.4305, 10.3951, boundaries) == "50"  # Trondheim
+        assert get_county_from_coordinates(69.6492, 18.9553, boundaries) == "55"  # Tromsø
+        assert get_county_from_coordinates(59.9560, 11.0492, boundaries) == "32"  # Lillestrøm
+        assert get_county_from_coordinates(59.3293, 18.0686, boundaries) is None  # Stockholm
+
+        outline = boundaries.display_geometry("46")
+        assert outline["type"] == "MultiLineString"
+        assert all(ring[0] == ring[-1] for ring in outline["coordinates"])
+        assert all(4.0 < lon < 8.5 and 58.5 < lat < 62.5 for ring in outline["coordinates"] for lon, lat in ring)
+        assert boundaries.display_geometry("99") is None
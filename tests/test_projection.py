@@ -0,0 +1,60 @@
+"""Unit tests for the map projections."""
+import random
+
+import pytest
+
+from custom_components.norway_alerts.projection import UTM33, utm_zone
+
+# (longitude, latitude) -> ETRS89 / UTM 33N (easting, northing), computed with PROJ
+REFERENCE_POINTS = [
+    ((10.7522, 59.9139), (262560.4822, 6649443.5840)),  # Oslo
+    ((5.3221, 60.3913), (-32117.3906, 6734201.5915)),  # Bergen, two zones west of the central meridian
+    ((7.0475, 57.9827), (30371.6408, 6454487.7237)),  # Lindesnes
+    ((18.9553, 69.6492), (653421.1876, 7731721.0829)),  # Tromsø
+    ((30.0450, 69.7271), (1076685.5362, 7806974.2128)),  # Kirkenes
+    ((15.6356, 78.2232), (514481.4849, 8683357.6561)),  # Longyearbyen
+]
+
+
+class TestTransverseMercator:
+    """Test the UTM zone 33 projection."""
+
+    def test_central_meridian(self):
+        """Test points on the central meridian against the scaled GRS80 meridian arc."""
+        assert UTM33.forward(15.0, 0.0) == pytest.approx((500000.0, 0.0), abs=1e-6)
+        # k0 * meridian arc to 60 degrees north (6 654 072.819 m)
+        assert UTM33.forward(15.0, 60.0) == pytest.approx((500000.0, 6651411.19), abs=0.01)
+
+    def test_known_points(self):
+        """Test forward and inverse against reference coordinates to a millimetre."""
+        for (longitude, latitude), (easting, northing) in REFERENCE_POINTS:
+            assert UTM33.forward(longitude, latitude) == pytest.approx((easting, northing), abs=0.001)
+            assert UTM33.inverse(easting, northing) == pytest.approx((longitude, latitude), abs=1e-8)
+
+    def test_other_zone(self):
+        """Test a zone other than 33 (EPSG:25832)."""
+        assert utm_zone(32).forward(5.3221, 60.3913) == pytest.approx((297353.9327, 6700648.3451), abs=0.001)
+        assert utm_zone(33) is UTM33
+
+    def test_many(self):
+        """Test that the array transforms match the point transforms."""
+        longitudes = [point[0][0] for point in REFERENCE_POINTS]
+        latitudes = [point[0][1] for point in REFERENCE_POINTS]
+
+        eastings, northings = UTM33.forward_many(longitudes, latitudes)
+        assert list(eastings) == pytest.approx([point[1][0] for point in REFERENCE_POINTS], abs=0.001)
+        assert list(northings) == pytest.approx([point[1][1] for point in REFERENCE_POINTS], abs=0.001)
+
+        back_longitudes, back_latitudes = UTM33.inverse_many(eastings, northings)
+        assert list(back_longitudes) == pytest.approx(longitudes, abs=1e-9)
+        assert list(back_latitudes) == pytest.approx(latitudes, abs=1e-9)
+        assert [len(values) for values in UTM33.forward_many([], [])] == [0, 0]
+
+    def test_round_trip(self):
+        """Test that inverse(forward(p)) returns p across mainland Norway and Svalbard longitudes."""
+        rng = random.Random(5)
+        for _ in range(500):
+            longitude, latitude = rng.uniform(3.0, 32.0), rng.uniform(57.0, 81.0)
+            assert UTM33.inverse(*UTM33.forward(longitude, latitude)) == pytest.approx(
+                (longitude, latitude), abs=1e-9
+            )
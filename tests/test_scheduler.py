@@ -0,0 +1,53 @@
+"""Unit tests for the adaptive refresh scheduler."""
+from datetime import datetime, timedelta, timezone
+
+from custom_components.norway_alerts.scheduler import (
+    compute_update_interval,
+    parse_warning_time,
+    upstream_host,
+)
+
+NOW = datetime(2025, 12, 15, 12, 0, tzinfo=timezone.utc)
+
+
+class TestComputeUpdateInterval:
+    """Test compute_update_interval."""
+
+    def test_quiet_period_polls_rarely(self):
+        """Test that green-only warnings use the quiet interval."""
+        warnings = [{"ActivityLevel": "1"}]
+
+        assert compute_update_interval(warnings, "landslide", NOW) == timedelta(minutes=60)
+        assert compute_update_interval([], "landslide", NOW) == timedelta(minutes=60)
+
+    def test_severity_shortens_interval(self):
+        """Test that orange and red warnings are polled more often."""
+        assert compute_update_interval([{"ActivityLevel": "2"}], "flood", NOW) == timedelta(minutes=30)
+        assert compute_update_interval([{"ActivityLevel": "3"}], "flood", NOW) == timedelta(minutes=10)
+        assert compute_update_interval([{"ActivityLevel": "4"}], "flood", NOW) == timedelta(minutes=5)
+
+    def test_next_warning_time_is_targeted(self):
+        """Test that the next poll lands just after the announced publication."""
+        # 13:20 Oslo time (UTC+1 in December) is 20 minutes from now
+        warnings = [{"ActivityLevel": "1", "NextWarningTime": "2025-12-15T13:20:00"}]
+
+        assert compute_update_interval(warnings, "landslide", NOW) == timedelta(minutes=22)
+
+    def test_recent_publish_polls_more_often(self):
+        """Test that a fresh publication shortens the interval."""
+        warnings = [{"ActivityLevel": "2", "PublishTime": "2025-12-15T12:50:14.4807245"}]
+
+        assert compute_update_interval(warnings, "flood", NOW) == timedelta(minutes=15)
+
+    def test_host_minimum_is_respected(self):
+        """Test that the per-host minimum interval is never undercut."""
+        warnings = [{"ActivityLevel": "4"}]
+
+        assert compute_update_interval(warnings, "metalerts", NOW) == timedelta(minutes=10)
+        assert upstream_host("metalerts").endswith("api.met.no")
+
+    def test_parse_warning_time(self):
+        """Test parsing naive NVE and offset Met.no timestamps."""
+        assert parse_warning_time("2025-12-16T11:00:00") == datetime(2025, 12, 16, 10, 0, tzinfo=timezone.utc)
+        assert parse_warning_time("2025-12-16T11:00:00+00:00") == datetime(2025, 12, 16, 11, 0, tzinfo=timezone.utc)
+        assert parse_warning_time("") is None
@@ -1,7 +1,7 @@
 """Unit tests for Norway Alerts sensor platform."""
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
-from datetime import datetime
+from datetime import datetime, timezone
 from homeassistant.helpers import frame
 
 from custom_components.norway_alerts.const import (
@@ -68,6 +68,96 @@ class TestNorwayAlertsCoordinator:
         assert result is not None
         assert len(result) == 0
 
+    @pytest.mark.asyncio
+    async def test_coordinator_keeps_data_when_not_modified(self, mock_hass, mock_county_api_response):
+        """Test that an unchanged upstream response keeps the current data object."""
+        from custom_components.norway_alerts.sensor import NorwayAlertsCoordinator
+        
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = NorwayAlertsCoordinator(
+                hass=mock_hass,
+                county_id="46",
+                county_name="Vestland",
+                warning_type=WARNING_TYPE_LANDSLIDE,
+                lang="en",
+                enable_notifications=True,
+            )
+        
+        with patch("custom_components.norway_alerts.sensor.WarningAPIFactory") as mock_factory:
+            mock_api = AsyncMock()
+            mock_api.fetch_warnings = AsyncMock(return_value=mock_county_api_response)
+            mock_api.not_modified = False
+            mock_factory.return_value.get_api.return_value = mock_api
+            
+            coordinator.data = await coordinator._async_update_data()
+            mock_api.not_modified = True
+            with patch.object(coordinator, "_send_notifications") as mock_notify:
+                result = await coordinator._async_update_data()
+        
+        assert result is coordinator.data
+        mock_notify.assert_not_called()
+        # The API client is created once and reused between refreshes
+        assert mock_factory.return_value.get_api.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_coordinator_saves_warnings_to_cache(self, mock_hass, mock_county_api_response):
+        """Test that successful updates are persisted, test mode updates are not."""
+        from custom_components.norway_alerts.sensor import NorwayAlertsCoordinator
+        
+        results = {}
+        for test_mode in (False, True):
+            with patch("homeassistant.helpers.frame.report_usage"):
+                coordinator = NorwayAlertsCoordinator(
+                    hass=mock_hass,
+                    county_id="46",
+                    county_name="Vestland",
+                    warning_type=WARNING_TYPE_LANDSLIDE,
+                    lang="en",
+                    test_mode=test_mode,
+                )
+            coordinator.cache = MagicMock()
+            
+            with patch("custom_components.norway_alerts.sensor.WarningAPIFactory") as mock_factory:
+                mock_api = AsyncMock()
+                mock_api.fetch_warnings = AsyncMock(return_value=mock_county_api_response)
+                mock_factory.return_value.get_api.return_value = mock_api
+                
+                results[test_mode] = await coordinator._async_update_data()
+            
+            if test_mode:
+                coordinator.cache.async_save.assert_not_called()
+            else:
+                coordinator.cache.async_save.assert_called_once_with(results[test_mode])
+
+    @pytest.mark.asyncio
+    async def test_coordinator_keeps_data_when_stale(self, mock_hass, mock_county_api_response):
+        """Test that an upstream failure keeps the last good data and skips notifications."""
+        from custom_components.norway_alerts.sensor import NorwayAlertsCoordinator
+        
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = NorwayAlertsCoordinator(
+                hass=mock_hass,
+                county_id="46",
+                county_name="Vestland",
+                warning_type=WARNING_TYPE_LANDSLIDE,
+                lang="en",
+                enable_notifications=True,
+            )
+        coordinator.data = mock_county_api_response
+        
+        with patch("custom_components.norway_alerts.sensor.WarningAPIFactory") as mock_factory:
+            mock_api = AsyncMock()
+            mock_api.fetch_warnings = AsyncMock(return_value=[])
+            mock_api.stale = True
+            mock_factory.return_value.get_api.return_value = mock_api
+            
+            with patch.object(coordinator, "_send_notifications") as mock_notify:
+                result = await coordinator._async_update_data()
+        
+        assert result is mock_county_api_response
+        assert coordinator.stale is True
+        mock_notify.assert_not_called()
+
 
 class TestNorwayAlertsSensor:
     """Test Norway Alerts sensor entity."""
@@ -158,3 +248,151 @@ class TestNorwayAlertsSensor:
         )
         
         assert sensor.native_value == 0
+
+    def test_sensor_snapshot_is_reused(self):
+        """Test that state, attributes and picture are computed once per update."""
+        from custom_components.norway_alerts.sensor import NorwayAlertsCoordinator, NorwayAlertsSensor
+        mock_hass = MagicMock()
+
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = NorwayAlertsCoordinator(
+                hass=mock_hass,
+                county_id="46",
+                county_name="Vestland",
+                warning_type=WARNING_TYPE_LANDSLIDE,
+                lang="en",
+            )
+
+        coordinator.data = [{"ActivityLevel": "3", "Id": 123, "_warning_type": WARNING_TYPE_LANDSLIDE}]
+
+        sensor = NorwayAlertsSensor(
+            coordinator=coordinator,
+            entry_id="test_entry",
+            county_name="Vestland",
+            warning_type=WARNING_TYPE_LANDSLIDE,
+            municipality_filter="",
+            template_content=None,
+        )
+
+        with patch.object(sensor, "_build_snapshot", wraps=sensor._build_snapshot) as build:
+            assert sensor.native_value == 1
+            assert sensor.extra_state_attributes["highest_level"] == "orange"
+            assert sensor.entity_picture is not None
+            assert build.call_count == 1
+
+            # New coordinator data triggers one rebuild
+            coordinator.data = [{"ActivityLevel": "1", "Id": 124, "_warning_type": WARNING_TYPE_LANDSLIDE}]
+            assert sensor.native_value == 0
+            assert sensor.entity_picture is None
+            assert build.call_count == 2
+
+    def test_snapshot_follows_alert_status(self):
+        """Test that the snapshot is rebuilt and a state write scheduled when an alert starts or ends."""
+        from custom_components.norway_alerts.sensor import NorwayAlertsCoordinator, NorwayAlertsSensor
+        mock_hass = MagicMock()
+
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = NorwayAlertsCoordinator(
+                hass=mock_hass,
+                county_id="46",
+                county_name="Vestland",
+                warning_type=WARNING_TYPE_LANDSLIDE,
+                lang="en",
+            )
+
+        start, end = 1_900_000_000, 1_900_003_600
+        coordinator.data = [{
+            "ActivityLevel": "3", "Id": 125, "_warning_type": WARNING_TYPE_LANDSLIDE,
+            "ValidFrom": datetime.fromtimestamp(start, timezone.utc).isoformat(),
+            "ValidTo": datetime.fromtimestamp(end, timezone.utc).isoformat(),
+        }]
+
+        sensor = NorwayAlertsSensor(
+            coordinator=coordinator,
+            entry_id="test_entry",
+            county_name="Vestland",
+            warning_type=WARNING_TYPE_LANDSLIDE,
+            municipality_filter="",
+            template_content=None,
+        )
+        sensor.hass = mock_hass
+
+        with patch.object(sensor, "_build_snapshot", wraps=sensor._build_snapshot) as build, \
+                patch("homeassistant.helpers.event.async_track_point_in_time") as track, \
+                patch("time.time", return_value=start - 60):
+            sensor.native_value
+            sensor.native_value
+            assert build.call_count == 1
+            assert track.call_args[0][2] == datetime.fromtimestamp(start, timezone.utc)
+
+            # Once the alert has started the snapshot is rebuilt and its end is scheduled
+            with patch("time.time", return_value=start + 1):
+                sensor.native_value
+                sensor.native_value
+            assert build.call_count == 2
+            assert track.call_args[0][2] == datetime.fromtimestamp(end + 1, timezone.utc)
+
+
+class TestCapConversionCache:
+    """Test the CAP conversion cache."""
+
+    def test_alert_is_converted_once_per_version(self, mock_county_api_response):
+        """Test that unchanged alerts are served from the cache."""
+        from custom_components.norway_alerts.sensor import CapConversionCache
+
+        cache = CapConversionCache(maxsize=2)
+        alert = dict(mock_county_api_response[0], Version="1.0")
+
+        first = cache.convert(alert, WARNING_TYPE_LANDSLIDE, "en")
+        assert cache.convert(dict(alert), WARNING_TYPE_LANDSLIDE, "en") is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        # A new version or language is converted again
+        updated = cache.convert(dict(alert, Version="2.0"), WARNING_TYPE_LANDSLIDE, "en")
+        assert updated is not first
+        cache.convert(alert, WARNING_TYPE_LANDSLIDE, "no")
+        assert cache.stats == {"hits": 1, "misses": 3, "size": 2}
+
+        # So is a changed validity period under the same version
+        extended = cache.convert(dict(alert, ValidTo="2099-01-01T00:00:00"), WARNING_TYPE_LANDSLIDE, "no")
+        assert extended["endtime"] != cache.convert(alert, WARNING_TYPE_LANDSLIDE, "no")["endtime"]
+        assert cache.misses == 4
+
+        with pytest.raises(RuntimeError):
+            first["title"] = "changed"
+
+
+class TestFilteredSensor:
+    """Test the municipality filtered sensor."""
+
+    def test_filtered_sensor_uses_coordinator_index(self, mock_county_api_response):
+        """Test that the filtered sensor matches through the coordinator's index."""
+        from custom_components.norway_alerts.sensor import NorwayAlertsCoordinator, NorwayAlertsSensor
+        mock_hass = MagicMock()
+
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = NorwayAlertsCoordinator(
+                hass=mock_hass,
+                county_id="46",
+                county_name="Vestland",
+                warning_type=WARNING_TYPE_LANDSLIDE,
+                lang="en",
+            )
+
+        coordinator.data = mock_county_api_response + [
+            {"ActivityLevel": "3", "Id": 2, "MunicipalityList": [{"Name": "Voss", "Id": 4621}]},
+        ]
+
+        sensor = NorwayAlertsSensor(
+            coordinator=coordinator,
+            entry_id="test_entry",
+            county_name="Vestland",
+            warning_type=WARNING_TYPE_LANDSLIDE,
+            municipality_filter="voss, ",
+            template_content=None,
+            is_main=False,
+        )
+
+        assert sensor.native_value == 1
+        assert sensor.extra_state_attributes["highest_level"] == "orange"
+        assert coordinator.municipality_index() is coordinator.municipality_index()